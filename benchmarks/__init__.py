@@ -0,0 +1,4 @@
+"""Micro-benchmarks for transmogrifier internals.
+
+Run a benchmark as a module, e.g. `uv run python -m benchmarks.field_method_dispatch`.
+"""
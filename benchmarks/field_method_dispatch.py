@@ -0,0 +1,44 @@
+"""Per-record overhead of looking up optional field methods.
+
+Compares the previous lookup, which rebuilt the optional field names and called getattr
+for every field of every record, with the dispatch table cached per transformer.
+"""
+
+import timeit
+from collections.abc import Callable, Iterator
+
+import transmogrifier.models as timdex
+from transmogrifier.sources.transformer import Transformer
+
+SOURCE = "jpal"
+SOURCE_FILE = "jpal-2024-01-01-daily-extracted-records-to-index.xml"
+RECORDS = 100_000
+
+
+def uncached_optional_field_methods(
+    transformer: Transformer,
+) -> Iterator[tuple[str, Callable]]:
+    """Look up optional field methods as they were looked up for every record."""
+    for field_name in timdex.TimdexRecord.get_optional_field_names():
+        if field_method := getattr(transformer, f"get_{field_name}", None):
+            yield field_name, field_method
+
+
+def main() -> None:
+    transformer_class = Transformer.get_transformer(SOURCE)
+    transformer = transformer_class(SOURCE, iter(()), source_file=SOURCE_FILE)
+    benchmarks = {
+        "uncached": lambda: list(uncached_optional_field_methods(transformer)),
+        "cached": lambda: list(transformer.get_optional_field_methods()),
+    }
+    print(  # noqa: T201
+        f"{transformer_class.__name__}: "
+        f"{len(transformer.get_optional_field_methods())} optional field methods"
+    )
+    for name, benchmark in benchmarks.items():
+        seconds = min(timeit.repeat(benchmark, number=RECORDS, repeat=5))
+        print(f"{name:>8}: {seconds / RECORDS * 1_000_000:.3f} us per record")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Time to import the CLI and the transformer module of each source.
+
+Each module is imported in a new interpreter with `-X importtime`, so modules imported
+by earlier measurements are not cached.  External configs, e.g. the MARC crosswalks,
+are loaded when first used rather than on import, and the time to load them is
+reported separately.
+"""
+
+import subprocess
+import sys
+from time import perf_counter
+
+from transmogrifier.config import SOURCES, ExternalConfig, load_shared_config
+from transmogrifier.sources.transformer import Transformer
+
+MODULES = [
+    "transmogrifier.cli",
+    *dict.fromkeys(
+        source_config["transform-class"].rsplit(".", 1)[0]
+        for source_config in SOURCES.values()
+    ),
+]
+REPEAT = 5
+
+
+def import_microseconds(module: str) -> int:
+    """Return the cumulative import time of a module in a new interpreter."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # lines are formatted as 'import time: <self us> | <cumulative us> | <module>'
+    for line in reversed(result.stderr.splitlines()):
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    message = f"No import time reported for {module}"
+    raise RuntimeError(message)
+
+
+def main() -> None:
+    print("Import time (best of 5, new interpreter for each import)")  # noqa: T201
+    for module in MODULES:
+        try:
+            microseconds = min(import_microseconds(module) for _ in range(REPEAT))
+        except subprocess.CalledProcessError:
+            # e.g. libguides, which requires LibGuides API env vars to be set
+            print(f"{module:>45}: could not be imported")  # noqa: T201
+            continue
+        print(f"{module:>45}: {microseconds / 1000:8.1f} ms")  # noqa: T201
+
+    print("First access of external configs")  # noqa: T201
+    for source in ("alma", "aspace"):
+        transformer_class = Transformer.get_transformer(source)
+        for name, attribute in vars(transformer_class).items():
+            if isinstance(attribute, ExternalConfig):
+                start_time = perf_counter()
+                getattr(transformer_class, name)
+                elapsed_time = perf_counter() - start_time
+                print(  # noqa: T201
+                    f"{transformer_class.__name__ + '.' + name:>45}: "
+                    f"{elapsed_time * 1000:8.1f} ms"
+                )
+    print(f"Configs loaded: {load_shared_config.cache_info().currsize}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
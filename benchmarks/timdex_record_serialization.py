@@ -0,0 +1,58 @@
+"""Time to serialize transformed TimdexRecords to JSON bytes.
+
+Compares json.dumps(record.asdict()), as records were previously serialized, with
+TimdexRecord.to_json_bytes() for records transformed from test fixtures.
+"""
+
+import json
+import timeit
+
+from transmogrifier.exceptions import DeletedRecordEvent, SkippedRecordEvent
+from transmogrifier.models import TimdexRecord
+from transmogrifier.sources.transformer import Transformer
+
+SOURCE_FILES = {
+    "mitlibwebsite": "tests/fixtures/mitlibwebsite/mitlibwebsite_records.jsonl",
+    "jpal": "tests/fixtures/datacite/datacite_records.xml",
+    "alma": "tests/fixtures/marc/marc_record_all_fields.xml",
+}
+REPEAT = 200
+
+
+def transform_records(source: str, source_file: str) -> list[TimdexRecord]:
+    transformer_class = Transformer.get_transformer(source)
+    transformer = transformer_class(
+        source,
+        transformer_class.parse_source_file(source_file),
+        source_file=f"{source}-2024-01-01-daily-extracted-records-to-index.xml",
+    )
+    records = []
+    for source_record in transformer.source_records:
+        try:
+            records.append(transformer.transform(source_record))
+        except (DeletedRecordEvent, SkippedRecordEvent):
+            continue
+    return records
+
+
+def main() -> None:
+    for source, source_file in SOURCE_FILES.items():
+        records = transform_records(source, source_file)
+        benchmarks = {
+            "asdict": lambda records=records: [
+                json.dumps(record.asdict()).encode() for record in records
+            ],
+            "to_json_bytes": lambda records=records: [
+                record.to_json_bytes() for record in records
+            ],
+        }
+        for name, benchmark in benchmarks.items():
+            seconds = min(timeit.repeat(benchmark, number=REPEAT, repeat=5))
+            print(  # noqa: T201
+                f"{source:>14} {name:>14}: "
+                f"{seconds / REPEAT / len(records) * 1_000_000:.1f} us per record"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""Benchmark suite measuring transform throughput for each source.
+
+For every source in config.SOURCES, a source file of synthetic records is generated by
+repeating the records of a test fixture, giving each copy a unique identifier.  The file
+is transformed and written to a local TIMDEX dataset with Transformer.load() exactly as a
+CLI run would, and a machine-readable JSON report is produced with the records/sec, peak
+memory, and time spent in each stage for every source.
+
+Each source is benchmarked in a new spawned process, so the peak resident set size
+reported for a source is not inflated by sources benchmarked before it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import resource
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import cycle, islice
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import click
+import smart_open  # type: ignore[import-untyped]
+from lxml import etree
+
+from transmogrifier.config import SOURCES, VALIDATION_MODES, configure_logger
+from transmogrifier.profiling import FieldProfiler
+from transmogrifier.sources.jsontransformer import JSONTransformer
+from transmogrifier.sources.transformer import Transformer
+from transmogrifier.sources.xmlparsing import RECORD_TYPES, configure_parsing_engine
+from transmogrifier.sources.xmltransformer import XMLTransformer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_RECORDS = 1_000
+BENCHMARK_RUN_DATE = "2024-01-01"
+
+# fixture, relative to the fixtures directory, used as the template records for a source
+SOURCE_FIXTURES: dict[str, str] = {
+    "alma": "marc/marc_record_all_fields.xml",
+    "aspace": "ead/ead_record_all_fields.xml",
+    "dspace": "dspace/dspace_mets_records.xml",
+    "jpal": "datacite/datacite_records.xml",
+    "libguides": "libguides/libguides-2026-02-20-full-extracted-records-to-index.jsonl",
+    "mitlibwebsite": "mitlibwebsite/mitlibwebsite_records.jsonl",
+    "gismit": "aardvark_records.jsonl",
+    "gisogm": "aardvark_records.jsonl",
+    "researchdatabases": "oai_dc/springshare/research_databases/"
+    "research_databases_records.xml",
+    "whoas": "dspace/whoas_records_with_valid_and_invalid_content_types.xml",
+    "zenodo": "datacite/zenodo_records_with_valid_and_invalid_content_types.xml",
+}
+
+# stages reported for each source, mapped from the methods measured by a FieldProfiler
+STAGE_METHODS: dict[str, tuple[str, ...]] = {
+    "serialize": ("serialize_source_record", "serialize_transformed_record"),
+    "write": ("write_dataset_batch",),
+}
+
+
+def generate_xml_records(template_file: str, record_count: int) -> Iterator[bytes]:
+    """Yield XML records copied from a template file, each with a unique identifier.
+
+    The first identifier of each copy, the OAI-PMH header identifier or the MARC 001
+    control field, is suffixed with the number of the copy.
+
+    Args:
+        template_file: XML file containing the template records.
+        record_count: Number of records to yield.
+    """
+    templates = list(XMLTransformer.read_source_file(template_file))
+    for number, template in enumerate(islice(cycle(templates), record_count)):
+        record = etree.fromstring(template)
+        identifiers: list[etree._Element] = record.xpath(  # type: ignore[assignment]
+            ".//*[local-name()='identifier' "
+            "or (local-name()='controlfield' and @tag='001')][1]"
+        )
+        if identifiers and identifiers[0].text:
+            identifiers[0].text = f"{identifiers[0].text.strip()}-{number}"
+        yield etree.tostring(record, encoding="utf-8")
+
+
+def generate_json_records(template_file: str, record_count: int) -> Iterator[str]:
+    """Yield JSON lines copied from a template file, each with a unique identifier.
+
+    Copies of records with an 'id' property have it suffixed with the number of the
+    copy.  Records identified by other properties, e.g. a URL that is looked up
+    elsewhere during transformation, are copied unchanged.
+
+    Args:
+        template_file: JSON lines file containing the template records.
+        record_count: Number of records to yield.
+    """
+    templates = [
+        json.loads(line) for line in JSONTransformer.read_source_file(template_file)
+    ]
+    for number, template in enumerate(islice(cycle(templates), record_count)):
+        record = dict(template)
+        if isinstance(record.get("id"), str):
+            record["id"] = f"{record['id']}-{number}"
+        yield json.dumps(record)
+
+
+def generate_source_file(
+    source: str, template_file: str, record_count: int, output_directory: str
+) -> str:
+    """Write a source file of synthetic records and return its path.
+
+    The file is named as an extracted full run file for the source, so run data is
+    parsed from it as it is for a CLI run.
+
+    Args:
+        source: Source the records are generated for.
+        template_file: Test fixture containing the template records.
+        record_count: Number of records to write.
+        output_directory: Directory the source file is written to.
+    """
+    extension = Path(template_file).suffix
+    source_file = str(
+        Path(output_directory)
+        / f"{source}-{BENCHMARK_RUN_DATE}-full-extracted-records-to-index{extension}"
+    )
+    if extension == ".xml":
+        with smart_open.open(source_file, "wb") as file:
+            file.write(b'<?xml version="1.0" encoding="UTF-8"?>\n<records>\n')
+            for xml_record in generate_xml_records(template_file, record_count):
+                file.write(xml_record + b"\n")
+            file.write(b"</records>\n")
+    else:
+        with smart_open.open(source_file, "w") as file:
+            for json_record in generate_json_records(template_file, record_count):
+                file.write(json_record + "\n")
+    return source_file
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of the current process in bytes."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in kilobytes on Linux and in bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def benchmark_source(
+    source: str,
+    template_file: str,
+    record_count: int,
+    workers: int = 1,
+    xml_record_type: str = "bs4",
+    validation_mode: str = "record",
+    *,
+    pipeline: bool = False,
+) -> dict[str, Any]:
+    """Generate, transform, and write synthetic records for a source.
+
+    Returns a dict of results for the source.  Sources that cannot be loaded, e.g.
+    libguides without LibGuides API credentials configured, are reported with the
+    reason they were skipped instead of failing the whole benchmark.
+
+    Args:
+        source: Source to benchmark.
+        template_file: Test fixture containing the template records.
+        record_count: Number of synthetic records to transform.
+        workers: Number of processes used to transform records.
+        xml_record_type: 'bs4' or 'lxml' records for XML transformers.
+        validation_mode: 'full' or 'record' validation of TimdexRecords.
+        pipeline: If True, read, transform, and write in pipelined stages.
+    """
+    configure_parsing_engine(record_type=xml_record_type)  # type: ignore[arg-type]
+    with tempfile.TemporaryDirectory() as temp_directory:
+        start_time = perf_counter()
+        source_file = generate_source_file(
+            source, template_file, record_count, temp_directory
+        )
+        generate_seconds = perf_counter() - start_time
+
+        profiler = FieldProfiler()
+        start_time = perf_counter()
+        try:
+            transformer = Transformer.load(
+                source,
+                source_file,
+                workers=workers,
+                profiler=profiler,
+                validation_mode=validation_mode,  # type: ignore[arg-type]
+            )
+        except Exception as exception:  # noqa: BLE001
+            return {
+                "source": source,
+                "skipped": f"{type(exception).__name__}: {exception}",
+            }
+        transformer.write_to_parquet_dataset(
+            str(Path(temp_directory) / "dataset"), pipeline=pipeline
+        )
+        total_seconds = perf_counter() - start_time
+
+    stages = {
+        stage: sum(profiler.seconds.get(method, 0.0) for method in methods)
+        for stage, methods in STAGE_METHODS.items()
+    }
+    stages["transform"] = sum(
+        seconds
+        for method, seconds in profiler.seconds.items()
+        if not any(method in methods for methods in STAGE_METHODS.values())
+    )
+    # with workers, stages are measured in the worker processes and may overlap, in
+    # which case the remaining time is not meaningful
+    stages["read_and_other"] = max(total_seconds - sum(stages.values()), 0.0)
+
+    return {
+        "source": source,
+        "transformer": type(transformer).__name__,
+        "records": transformer.processed_record_count,
+        "transformed_records": transformer.transformed_record_count,
+        "skipped_records": transformer.skipped_record_count,
+        "deleted_records": transformer.deleted_record_count,
+        "total_seconds": round(total_seconds, 6),
+        "records_per_second": round(
+            transformer.processed_record_count / total_seconds, 1
+        ),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "stage_seconds": {
+            "generate": round(generate_seconds, 6),
+            **{stage: round(seconds, 6) for stage, seconds in stages.items()},
+        },
+        "methods": profiler.report(),
+    }
+
+
+def run_benchmarks(
+    sources: list[str],
+    fixtures_directory: str,
+    record_count: int,
+    workers: int = 1,
+    xml_record_type: str = "bs4",
+    validation_mode: str = "record",
+    *,
+    pipeline: bool = False,
+) -> dict[str, Any]:
+    """Benchmark each source in a new spawned process and return the JSON report.
+
+    Args:
+        sources: Sources to benchmark.
+        fixtures_directory: Directory containing the template fixtures.
+        record_count: Number of synthetic records to transform for each source.
+        workers: Number of processes used to transform records.
+        xml_record_type: 'bs4' or 'lxml' records for XML transformers.
+        validation_mode: 'full' or 'record' validation of TimdexRecords.
+        pipeline: If True, read, transform, and write in pipelined stages.
+    """
+    results = []
+    for source in sources:
+        logger.info("Benchmarking source %s with %d records", source, record_count)
+        # record level warnings logged during the transform are not shown, so writing
+        # them does not add to the time measured
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=logging.disable,
+            initargs=(logging.WARNING,),
+        ) as executor:
+            result = executor.submit(
+                benchmark_source,
+                source,
+                str(Path(fixtures_directory) / SOURCE_FIXTURES[source]),
+                record_count,
+                workers,
+                xml_record_type,
+                validation_mode,
+                pipeline=pipeline,
+            ).result()
+        if "skipped" in result:
+            logger.warning("Skipped source %s: %s", source, result["skipped"])
+        else:
+            logger.info(
+                "Source %s: %.1f records/sec, peak RSS %.1f MB",
+                source,
+                result["records_per_second"],
+                result["peak_rss_bytes"] / 1_000_000,
+            )
+        results.append(result)
+    return {
+        "records_per_source": record_count,
+        "workers": workers,
+        "xml_record_type": xml_record_type,
+        "validation_mode": validation_mode,
+        "pipeline": pipeline,
+        "sources": results,
+    }
+
+
+@click.command()
+@click.option(
+    "-n",
+    "--records",
+    type=click.IntRange(min=1),
+    default=BENCHMARK_RECORDS,
+    show_default=True,
+    help="Number of synthetic records to transform for each source.",
+)
+@click.option(
+    "-s",
+    "--source",
+    "sources",
+    multiple=True,
+    type=click.Choice(list(SOURCE_FIXTURES), case_sensitive=False),
+    help="Source to benchmark, may be passed more than once.  Defaults to all sources.",
+)
+@click.option(
+    "--fixtures-dir",
+    required=True,
+    type=click.Path(exists=True, file_okay=False),
+    help="Directory of test fixtures that synthetic records are generated from, e.g. "
+    "'tests/fixtures' in a checkout of the repository.",
+)
+@click.option(
+    "-o",
+    "--output",
+    required=False,
+    help="S3 or local path to write the JSON report to.  Printed to stdout if not "
+    "passed.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to transform records.",
+)
+@click.option(
+    "--xml-record-type",
+    type=click.Choice(RECORD_TYPES),
+    default="bs4",
+    show_default=True,
+    help="Type of record XML transformers receive.",
+)
+@click.option(
+    "--validation-mode",
+    type=click.Choice(VALIDATION_MODES),
+    default="record",
+    show_default=True,
+    help="How transformed records are validated, 'full' or once per 'record'.",
+)
+@click.option(
+    "--pipeline",
+    is_flag=True,
+    help="Pass to read, transform, and write records in pipelined stages.",
+)
+@click.option(
+    "-v", "--verbose", is_flag=True, help="Pass to log at debug level instead of info"
+)
+def main(
+    records: int,
+    sources: tuple[str, ...],
+    fixtures_dir: str,
+    output: str | None,
+    workers: int,
+    xml_record_type: str,
+    validation_mode: str,
+    pipeline: bool,  # noqa: FBT001
+    verbose: bool,  # noqa: FBT001
+) -> None:
+    # logs are written to stderr, leaving stdout for the report
+    logger.info(configure_logger(logging.getLogger(), verbose=verbose))
+    unknown_sources = set(SOURCES) - set(SOURCE_FIXTURES)
+    if unknown_sources:
+        logger.warning("No benchmark fixture for sources: %s", sorted(unknown_sources))
+
+    report = run_benchmarks(
+        list(sources) or list(SOURCE_FIXTURES),
+        fixtures_dir,
+        records,
+        workers,
+        xml_record_type,
+        validation_mode,
+        pipeline=pipeline,
+    )
+    report_json = json.dumps(report, indent=2)
+    if output:
+        with smart_open.open(output, "w") as report_file:
+            report_file.write(report_json)
+        logger.info("Wrote benchmark report to %s", output)
+    else:
+        click.echo(report_json)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ from click.testing import CliRunner
 from moto import mock_aws
 
 import transmogrifier.models as timdex
-from transmogrifier.config import SOURCES, load_external_config
+from transmogrifier.config import SOURCES, load_external_config, load_loc_code_crosswalk
 from transmogrifier.sources.jsontransformer import JSONTransformer
 from transmogrifier.sources.transformer import Transformer
 from transmogrifier.sources.xml.datacite import Datacite
@@ -133,7 +133,7 @@ def datacite_record_all_fields():
 
 @pytest.fixture
 def loc_country_crosswalk():
-    return load_external_config("config/loc-countries.xml", "xml")
+    return load_loc_code_crosswalk("config/loc-countries.xml")
 
 
 @pytest.fixture
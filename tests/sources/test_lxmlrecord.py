@@ -0,0 +1,187 @@
+from unittest import mock
+
+import pytest
+from bs4 import BeautifulSoup
+
+from transmogrifier.sources.lxmlrecord import LxmlRecord, LxmlTag, collapse_whitespace
+from transmogrifier.sources.xml.datacite import Datacite
+from transmogrifier.sources.xml.dspace_dim import DspaceDim
+from transmogrifier.sources.xml.dspace_mets import DspaceMets
+from transmogrifier.sources.xml.ead import Ead
+from transmogrifier.sources.xml.marc import Marc
+from transmogrifier.sources.xml.oaidc import OaiDc
+from transmogrifier.sources.xmlparsing import configure_parsing_engine
+
+RECORD = b"""<record xmlns="http://www.openarchives.org/OAI/2.0/"
+    xmlns:dim="http://www.dspace.org/xmlns/dspace/dim">
+  <header status="deleted"><identifier>oai:1</identifier></header>
+  <metadata>
+    <dim:dim>
+      <dim:field mdschema="dc" element="title">A <!-- note -->Title</dim:field>
+      <dim:field mdschema="dc" element="subject" xml:lang="en">Subject</dim:field>
+      <dim:field mdschema="dc" element="subject"> </dim:field>
+      <dim:field mdschema="dc" element="description"><p>Nested</p></dim:field>
+      <dim:field mdschema="dc" element="rights"><p>One</p><p>Two</p></dim:field>
+    </dim:dim>
+  </metadata>
+</record>"""
+
+
+@pytest.fixture
+def records():
+    return BeautifulSoup(RECORD, "xml"), LxmlRecord.from_bytes(RECORD)
+
+
+def _names(tags):
+    return [(tag.name, tag.attrs) for tag in tags]
+
+
+def test_collapse_whitespace():
+    assert collapse_whitespace("\n  ") == "\n"
+    assert collapse_whitespace("  ") == " "
+    assert collapse_whitespace(" text ") == " text "
+
+
+def test_lxmlrecord_find_matches_bs4(records):
+    bs4_record, lxml_record = records
+    for name in ["record", "header", "identifier", "field", "dim:field", "dim", "x"]:
+        bs4_tag = bs4_record.find(name)
+        lxml_tag = lxml_record.find(name)
+        assert (lxml_tag is None) == (bs4_tag is None), name
+        if bs4_tag is not None:
+            assert lxml_tag.name == bs4_tag.name
+            assert lxml_tag.attrs == bs4_tag.attrs
+
+
+def test_lxmlrecord_find_all_matches_bs4(records):
+    bs4_record, lxml_record = records
+    for args, kwargs in [
+        (("field",), {}),
+        (("dim:field",), {"element": "subject"}),
+        (("field",), {"element": ["title", "rights"]}),
+        (("field",), {"attrs": {"xml:lang": "en"}}),
+        (("field",), {"string": True}),
+        (("field",), {"string": "Subject"}),
+        (("field",), {"limit": 2}),
+        ((["header", "identifier"],), {}),
+        ((True,), {}),
+        (("record",), {"recursive": False}),
+        (("header",), {"recursive": False}),
+        (("header",), {"status": "deleted"}),
+    ]:
+        assert _names(lxml_record.find_all(*args, **kwargs)) == _names(
+            bs4_record.find_all(*args, **kwargs)
+        ), (args, kwargs)
+
+
+def test_lxmlrecord_attribute_access_matches_bs4(records):
+    bs4_record, lxml_record = records
+    assert lxml_record.header.identifier.string == bs4_record.header.identifier.string
+    assert lxml_record.header["status"] == bs4_record.header["status"]
+    assert lxml_record.header.get("missing", "default") == "default"
+    assert lxml_record.header.has_attr("status")
+    assert lxml_record.nonexistent is None
+    assert lxml_record.name == bs4_record.name
+    assert lxml_record.record.parent.name == bs4_record.record.parent.name
+
+
+def test_lxmlrecord_string_and_children_match_bs4(records):
+    bs4_record, lxml_record = records
+    bs4_fields = bs4_record.find_all("field")
+    lxml_fields = lxml_record.find_all("field")
+    for bs4_field, lxml_field in zip(bs4_fields, lxml_fields, strict=True):
+        assert lxml_field.string == bs4_field.string
+        assert [
+            child if isinstance(child, str) else child.name
+            for child in lxml_field.children
+        ] == [
+            str(child) if isinstance(child, str) else child.name
+            for child in bs4_field.children
+        ]
+
+
+def test_lxmltag_str_excludes_tail():
+    record = LxmlRecord.from_bytes(b"<record><p>text</p> tail</record>")
+    tag = record.find("p")
+    assert isinstance(tag, LxmlTag)
+    assert str(tag) == "<p>text</p>"
+    assert tag.encode() == b"<p>text</p>"
+
+
+@pytest.mark.parametrize(
+    ("transformer_class", "source", "source_file"),
+    [
+        (Datacite, "cool-repo", "tests/fixtures/datacite/datacite_records.xml"),
+        (
+            Datacite,
+            "cool-repo",
+            "tests/fixtures/datacite/datacite_record_attribute_and_subfield_variations.xml",
+        ),
+        (DspaceDim, "dspace", "tests/fixtures/dspace/dspace_dim_records.xml"),
+        (
+            DspaceDim,
+            "dspace",
+            "tests/fixtures/dspace/dspace_dim_record_attribute_variations.xml",
+        ),
+        (DspaceMets, "dspace", "tests/fixtures/dspace/dspace_mets_records.xml"),
+        (
+            DspaceMets,
+            "dspace",
+            (
+                "tests/fixtures/dspace/"
+                "dspace_mets_record_attribute_and_subfield_variations.xml"
+            ),
+        ),
+        (Ead, "aspace", "tests/fixtures/ead/ead_record_all_fields.xml"),
+        (
+            Ead,
+            "aspace",
+            "tests/fixtures/ead/ead_record_attribute_and_subfield_variations.xml",
+        ),
+        (Marc, "alma", "tests/fixtures/marc/marc_record_all_fields.xml"),
+        (
+            Marc,
+            "alma",
+            "tests/fixtures/marc/marc_record_attribute_and_subfield_variations.xml",
+        ),
+        (OaiDc, "gismit", "tests/fixtures/oai_dc/oaidc_record_all_fields.xml"),
+    ],
+)
+def test_lxml_records_transform_same_as_bs4_records(
+    transformer_class, source, source_file
+):
+    def transform(record_type):
+        configure_parsing_engine(record_type=record_type)
+        transformer = transformer_class(
+            source,
+            transformer_class.parse_source_file(source_file),
+            run_id="run-abc-123",
+        )
+        return [(record.action, record.transformed_record) for record in transformer]
+
+    try:
+        bs4_results = transform("bs4")
+        lxml_results = transform("lxml")
+    finally:
+        configure_parsing_engine()
+    assert bs4_results
+    assert lxml_results == bs4_results
+
+
+def test_parse_source_file_with_raw_wraps_lxml_elements_without_reparsing():
+    source_file = "tests/fixtures/datacite/datacite_records.xml"
+    bs4_records = list(Datacite.parse_source_file_with_raw(source_file, 1))
+    configure_parsing_engine(record_type="lxml")
+    try:
+        with mock.patch.object(LxmlRecord, "from_bytes") as mocked_from_bytes:
+            lxml_records = list(Datacite.parse_source_file_with_raw(source_file, 1))
+    finally:
+        configure_parsing_engine()
+    mocked_from_bytes.assert_not_called()
+    assert [record.raw for record in lxml_records] == [
+        record.raw for record in bs4_records
+    ]
+    assert all(isinstance(record.record, LxmlRecord) for record in lxml_records)
+    assert [Datacite.get_source_record_id(record.record) for record in lxml_records] == [
+        Datacite.get_source_record_id(record.record) for record in bs4_records
+    ]
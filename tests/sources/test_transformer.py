@@ -1,23 +1,45 @@
-# ruff: noqa: SLF001, D202
+# ruff: noqa: SLF001, D202, PLR2004
+import contextlib
 import datetime
 import json
+import shutil
+import subprocess
+import sys
 from unittest import mock
 
 import pytest
+import smart_open  # type: ignore[import-untyped]
 from lxml import etree
 from timdex_dataset_api import DatasetRecord
 
 import transmogrifier.models as timdex
-from transmogrifier.exceptions import DeletedRecordEvent, SkippedRecordEvent
-from transmogrifier.sources.transformer import Transformer
+from transmogrifier.cache import TransformedRecordCache
+from transmogrifier.checkpoints import Checkpoint
+from transmogrifier.exceptions import (
+    CriticalError,
+    DeletedRecordEvent,
+    SkippedRecordEvent,
+)
+from transmogrifier.helpers import parse_date_from_string
+from transmogrifier.incremental import SourceRecordHashes
+from transmogrifier.profiling import FieldProfiler
+from transmogrifier.sources.json.aardvark import MITAardvark
+from transmogrifier.sources.transformer import (
+    SourceRecord,
+    Transformer,
+    batch_dataset_records,
+)
 from transmogrifier.sources.xml.datacite import Datacite
+from transmogrifier.sources.xml.marc import Marc
+from transmogrifier.sources.xml.springshare import SpringshareOaiDc
+from transmogrifier.sources.xmltransformer import XMLTransformer
 
 
 def test_load_exclusion_list(source_transformer, mock_s3_exclusion_list):
     source_transformer.exclusion_list_path = (
         "s3://test-bucket/libguides/config/libguides-exclusions.csv"
     )
-    assert source_transformer.load_exclusion_list() == [
+    assert list(source_transformer.load_exclusion_list()) == [
         "https://libguides.mit.edu/excluded1",
         "https://libguides.mit.edu/excluded2",
     ]
@@ -259,6 +281,19 @@ def test_transformer_action_column_based_on_transformation_exception_handling(
     assert record.action == expected_action
 
 
+def test_transformer_skips_record_without_source_link_before_getting_title(run_id):
+    # records without a header raise SkippedRecordEvent getting the source link, and an
+    # AttributeError getting the title
+    transformer = SpringshareOaiDc(
+        "researchdatabases",
+        SpringshareOaiDc.parse_source_file(
+            "tests/fixtures/oai_dc/springshare/springshare_valid_dates.xml"
+        ),
+        run_id=run_id,
+    )
+    assert [record.action for record in transformer] == ["skip", "skip"]
+
+
 def test_transformer_provenance_object_added_to_transformed_record(source_transformer):
     dataset_record = next(source_transformer)
     transformed_record = json.loads(dataset_record.transformed_record)
@@ -314,3 +349,719 @@ def test_transformer_dataset_write_includes_run_timestamp_column(
 
     parquet_file = written_files[0]
     assert "run_timestamp" in parquet_file.metadata.schema.names
+
+
+@pytest.mark.parametrize(
+    ("transformer_class", "source", "source_file"),
+    [
+        (Datacite, "cool-repo", "tests/fixtures/datacite/datacite_records.xml"),
+        (MITAardvark, "gismit", "tests/fixtures/aardvark_records.jsonl"),
+    ],
+)
+def test_transformer_with_workers_yields_same_records_as_serial(
+    run_id, transformer_class, source, source_file
+):
+    def transform(workers):
+        source_records = (
+            transformer_class.read_source_file(source_file)
+            if workers > 1
+            else transformer_class.parse_source_file_with_raw(source_file)
+        )
+        transformer = transformer_class(
+            source, source_records, run_id=run_id, workers=workers
+        )
+        records = [
+            (
+                record.timdex_record_id,
+                record.action,
+                record.run_record_offset,
+                record.source_record,
+                record.transformed_record,
+            )
+            for record in transformer
+        ]
+        counts = (
+            transformer.processed_record_count,
+            transformer.transformed_record_count,
+            transformer.skipped_record_count,
+            transformer.error_record_count,
+            transformer.deleted_record_count,
+        )
+        return records, counts
+
+    serial_records, serial_counts = transform(workers=1)
+    parallel_records, parallel_counts = transform(workers=2)
+    assert serial_records
+    assert parallel_records == serial_records
+    assert parallel_counts == serial_counts
+
+
+def test_transformer_with_workers_counts_date_cache_lookups_of_workers(run_id):
+    source_file = "tests/fixtures/datacite/datacite_records.xml"
+    parse_date_from_string.cache_clear()
+    list(
+        Datacite("jpal", Datacite.parse_source_file_with_raw(source_file), run_id=run_id)
+    )
+    date_cache_info = parse_date_from_string.cache_info()
+    assert date_cache_info.hits + date_cache_info.misses > 0
+
+    transformer = Datacite(
+        "jpal", Datacite.read_source_file(source_file), run_id=run_id, workers=2
+    )
+    list(transformer)
+    assert (
+        transformer.worker_date_cache_hits + transformer.worker_date_cache_misses
+        == date_cache_info.hits + date_cache_info.misses
+    )
+    assert parse_date_from_string.cache_info() == date_cache_info
+
+
+def test_transformer_with_workers_counts_actions_from_worker_records(
+    source_transformer,
+):
+    source_transformer.workers = 2
+    source_transformer.source_records = XMLTransformer.read_source_file(
+        "tests/fixtures/oai_pmh_records.xml"
+    )
+    records = list(source_transformer)
+    assert [record.run_record_offset for record in records] == [0, 1, 2]
+    assert source_transformer.processed_record_count == 3
+    assert source_transformer.error_record_count == 2
+    assert source_transformer.deleted_record_count == 1
+
+
+def test_transformer_streams_deleted_record_ids_to_file(source_transformer, tmp_path):
+    deleted_records_path = str(tmp_path / "deleted.txt.gz")
+    source_transformer.deleted_records_path = deleted_records_path
+    records = list(source_transformer)
+    assert source_transformer.deleted_record_count == 1
+    with smart_open.open(deleted_records_path) as deleted_records_file:
+        assert deleted_records_file.read().splitlines() == [
+            record.timdex_record_id for record in records if record.action == "delete"
+        ]
+
+
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_write_to_parquet_dataset_closes_deleted_records_file_on_error(
+    source_transformer, tmp_path, pipeline
+):
+    deleted_records_path = str(tmp_path / "deleted.txt.gz")
+    source_transformer.deleted_records_path = deleted_records_path
+    deleted_record_ids = []
+
+    def write_batch(rows_iter):
+        records = list(rows_iter)
+        if deleted := [record for record in records if record.action == "delete"]:
+            deleted_record_ids.extend(record.timdex_record_id for record in deleted)
+            raise RuntimeError("write failed")
+        return []
+
+    with mock.patch("timdex_dataset_api.TIMDEXDataset") as mocked_timdex_dataset:
+        mocked_timdex_dataset.return_value.records.write.side_effect = write_batch
+        with pytest.raises(RuntimeError, match="write failed"):
+            source_transformer.write_to_parquet_dataset(
+                "dataset", batch_rows=1, pipeline=pipeline
+            )
+    assert deleted_record_ids
+    with smart_open.open(deleted_records_path) as deleted_records_file:
+        assert deleted_records_file.read().splitlines() == deleted_record_ids
+
+
+def test_transformer_writes_empty_deleted_records_file_without_deletes(
+    source_transformer, tmp_path
+):
+    deleted_records_path = tmp_path / "deleted.txt"
+    source_transformer.deleted_records_path = str(deleted_records_path)
+    source_transformer.source_records = iter(())
+    assert list(source_transformer) == []
+    assert source_transformer.deleted_record_count == 0
+    assert deleted_records_path.read_text() == ""
+
+
+def test_transformer_with_profiler_times_field_methods(run_id):
+    profiler = FieldProfiler()
+    transformer = Datacite(
+        "cool-repo",
+        Datacite.parse_source_file("tests/fixtures/datacite/datacite_records.xml"),
+        run_id=run_id,
+        profiler=profiler,
+    )
+    records = list(transformer)
+    for method_name in [
+        "get_valid_title",
+        "get_dates",
+        "generate_derived_fields",
+        "serialize_source_record",
+        "serialize_transformed_record",
+    ]:
+        assert profiler.calls[method_name] > 0, method_name
+    assert profiler.calls["serialize_source_record"] == len(records)
+
+
+def test_transformer_with_workers_merges_worker_profilers(run_id):
+    source_file = "tests/fixtures/datacite/datacite_records.xml"
+    serial_profiler = FieldProfiler()
+    list(
+        Datacite(
+            "cool-repo",
+            Datacite.parse_source_file_with_raw(source_file),
+            run_id=run_id,
+            profiler=serial_profiler,
+        )
+    )
+    parallel_profiler = FieldProfiler()
+    list(
+        Datacite(
+            "cool-repo",
+            Datacite.read_source_file(source_file),
+            run_id=run_id,
+            workers=2,
+            profiler=parallel_profiler,
+        )
+    )
+    assert parallel_profiler.calls == serial_profiler.calls
+
+
+def test_get_optional_field_method_names_cached_per_class():
+    method_names = Datacite.get_optional_field_method_names()
+    assert ("dates", "get_dates") in method_names
+    assert Datacite.get_optional_field_method_names() is method_names
+    assert MITAardvark.get_optional_field_method_names() is not method_names
+
+
+def test_get_optional_field_methods_returns_bound_methods():
+    transformer = Datacite("cool-repo", iter(()))
+    field_methods = transformer.get_optional_field_methods()
+    assert transformer.get_optional_field_methods() is field_methods
+    assert field_methods
+    assert all(
+        field_method == getattr(transformer, f"get_{field_name}")
+        for field_name, field_method in field_methods
+    )
+
+
+@pytest.mark.parametrize(
+    ("transformer_class", "source", "source_file"),
+    [
+        (Datacite, "cool-repo", "tests/fixtures/datacite/datacite_records.xml"),
+        (MITAardvark, "gismit", "tests/fixtures/aardvark_records.jsonl"),
+    ],
+)
+def test_transformer_writes_raw_source_records_without_serializing(
+    transformer_class, source, source_file
+):
+    profiler = FieldProfiler()
+    source_records = list(transformer_class.parse_source_file_with_raw(source_file))
+    transformer = transformer_class(source, iter(source_records), profiler=profiler)
+    dataset_records = list(transformer)
+    assert [record.source_record for record in dataset_records] == [
+        source_record.raw for source_record in source_records
+    ]
+    assert profiler.calls["serialize_source_record"] == 0
+
+
+def test_xmltransformer_parse_source_file_with_raw_returns_record_bytes():
+    source_record = next(
+        Datacite.parse_source_file_with_raw(
+            "tests/fixtures/datacite/datacite_records.xml"
+        )
+    )
+    assert isinstance(source_record, SourceRecord)
+    assert source_record.raw.startswith(b"<record")
+    assert source_record.raw.endswith(b"</record>")
+    assert etree.fromstring(source_record.raw).tag.endswith("record")
+
+
+def test_jsontransformer_parse_source_file_with_raw_returns_line_bytes():
+    source_file = "tests/fixtures/aardvark_records.jsonl"
+    source_record = next(MITAardvark.parse_source_file_with_raw(source_file))
+    with open(source_file, "rb") as file:
+        assert source_record.raw == file.readline().rstrip(b"\r\n")
+    assert source_record.record == json.loads(source_record.raw)
+
+
+def _dataset_record(size):
+    return mock.Mock(source_record=b"x" * size, transformed_record=None)
+
+
+def test_batch_dataset_records_limits_batch_rows_and_bytes():
+    dataset_records = [_dataset_record(size) for size in [10, 10, 10, 50, 10, 10]]
+    batches = list(batch_dataset_records(iter(dataset_records), 3, 40))
+    assert [(len(batch), batch_size) for batch, batch_size in batches] == [
+        (3, 30),
+        (1, 50),
+        (2, 20),
+    ]
+    assert [record for batch, _ in batches for record in batch] == dataset_records
+
+
+def test_batch_dataset_records_empty_yields_no_batches():
+    assert list(batch_dataset_records(iter(()), 3, 40)) == []
+
+
+def test_write_to_parquet_dataset_writes_batches_in_one_write(caplog, source_transformer):
+    caplog.set_level("INFO")
+    with mock.patch("timdex_dataset_api.TIMDEXDataset") as mocked_timdex_dataset:
+        write = mocked_timdex_dataset.return_value.records.write
+        write.side_effect = lambda rows_iter: [len(list(rows_iter))]
+        written_files = source_transformer.write_to_parquet_dataset(
+            "dataset", batch_rows=2
+        )
+    write.assert_called_once()
+    assert written_files == [4]
+    assert "Wrote batch 2: 2 records" in caplog.text
+    assert "records/sec" in caplog.text
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_write_to_parquet_dataset_pipeline_writes_same_records(run_id, workers):
+    source_file = "tests/fixtures/datacite/datacite_records.xml"
+
+    def write(*, pipeline):
+        source_records = (
+            Datacite.read_source_file(source_file)
+            if workers > 1
+            else Datacite.parse_source_file_with_raw(source_file)
+        )
+        transformer = Datacite(
+            "cool-repo", source_records, run_id=run_id, workers=workers
+        )
+        with mock.patch("timdex_dataset_api.TIMDEXDataset") as mocked_timdex_dataset:
+            mocked_timdex_dataset.return_value.records.write.side_effect = (
+                lambda rows_iter: [
+                    (record.timdex_record_id, record.action, record.transformed_record)
+                    for record in rows_iter
+                ]
+            )
+            written_records = transformer.write_to_parquet_dataset(
+                "dataset", batch_rows=10, pipeline=pipeline
+            )
+        return written_records, transformer.processed_record_count
+
+    written_records, processed_record_count = write(pipeline=False)
+    assert written_records
+    assert write(pipeline=True) == (written_records, processed_record_count)
+
+
+def test_write_to_parquet_dataset_pipeline_reraises_transform_errors(
+    source_transformer,
+):
+    with (
+        mock.patch("timdex_dataset_api.TIMDEXDataset") as mocked_timdex_dataset,
+        mock.patch.object(
+            source_transformer,
+            "transform_source_record",
+            side_effect=CriticalError("critical"),
+        ),
+    ):
+        mocked_timdex_dataset.return_value.records.write.side_effect = lambda rows_iter: [
+            len(list(rows_iter))
+        ]
+        with pytest.raises(CriticalError, match="critical"):
+            source_transformer.write_to_parquet_dataset("dataset", pipeline=True)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_transformer_load_multiple_source_files(run_id, tmp_path, workers):
+    source_files = []
+    for index, (run_date, run_type) in enumerate(
+        [("2024-01-01", "full"), ("2024-01-01", "full"), ("2024-01-02", "daily")],
+        start=1,
+    ):
+        source_file = (
+            tmp_path
+            / f"jpal-{run_date}-{run_type}-extracted-records-to-index_{index}.xml"
+        )
+        shutil.copy("tests/fixtures/datacite/datacite_records.xml", source_file)
+        source_files.append(str(source_file))
+    single_file_records = list(
+        Transformer.load("jpal", source_files[0], run_id=run_id, workers=workers)
+    )
+
+    transformer = Transformer.load("jpal", source_files, run_id=run_id, workers=workers)
+    records = list(transformer)
+
+    assert transformer.processed_record_count == 3 * len(single_file_records)
+    assert transformer.source_file == source_files[-1]
+    for file_number, (run_date, run_type) in enumerate(
+        [("2024-01-01", "full"), ("2024-01-01", "full"), ("2024-01-02", "daily")]
+    ):
+        file_records = records[
+            file_number * len(single_file_records) : (file_number + 1)
+            * len(single_file_records)
+        ]
+        assert [record.run_record_offset for record in file_records] == list(
+            range(
+                file_number * len(single_file_records),
+                (file_number + 1) * len(single_file_records),
+            )
+        )
+        assert {(record.run_date, record.run_type) for record in file_records} == {
+            (datetime.date.fromisoformat(run_date), run_type)
+        }
+        assert {record.run_id for record in file_records} == {run_id}
+        assert {record.run_timestamp for record in file_records} == {
+            records[0].run_timestamp
+        }
+        assert [
+            (record.timdex_record_id, record.action, record.source_record)
+            for record in file_records
+        ] == [
+            (record.timdex_record_id, record.action, record.source_record)
+            for record in single_file_records
+        ]
+
+
+@pytest.mark.parametrize(("workers", "pipeline"), [(1, False), (2, False), (1, True)])
+def test_write_to_parquet_dataset_resumes_from_checkpoint(
+    run_id, tmp_path, workers, pipeline
+):
+    source_files = []
+    for index in range(1, 4):
+        source_file = (
+            tmp_path / f"jpal-2024-01-01-full-extracted-records-to-index_{index}.xml"
+        )
+        shutil.copy("tests/fixtures/datacite/datacite_records.xml", source_file)
+        source_files.append(str(source_file))
+    records_per_file = len(list(Datacite.read_source_file(source_files[0])))
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    batch_rows = records_per_file - 1
+
+    def write(transformer, fail_on_batch=None):
+        written_records = []
+
+        def write_records(rows_iter):
+            for record in rows_iter:
+                if fail_on_batch and len(written_records) == (
+                    (fail_on_batch - 1) * batch_rows
+                ):
+                    raise RuntimeError("interrupted")
+                written_records.append(record)
+            return []
+
+        with (
+            mock.patch("timdex_dataset_api.TIMDEXDataset") as mocked_timdex_dataset,
+            contextlib.suppress(RuntimeError),
+        ):
+            mocked_timdex_dataset.return_value.records.write.side_effect = write_records
+            transformer.write_to_parquet_dataset(
+                "dataset", batch_rows=batch_rows, pipeline=pipeline
+            )
+        return [
+            (
+                record.timdex_record_id,
+                record.run_date,
+                record.run_record_offset,
+                record.run_id,
+                record.run_timestamp,
+            )
+            for record in written_records
+        ]
+
+    expected_records = write(Transformer.load("jpal", source_files, run_id=run_id))
+    interrupted_records = write(
+        Transformer.load(
+            "jpal", source_files, workers=workers, checkpoint_path=checkpoint_path
+        ),
+        fail_on_batch=3,
+    )
+    checkpoint = Checkpoint.load(checkpoint_path)
+    assert (
+        checkpoint.source_file_index,
+        checkpoint.source_file_run_record_offset,
+        checkpoint.run_record_offset,
+    ) == (1, records_per_file, 2 * records_per_file - 2)
+    assert checkpoint.written_record_count == len(interrupted_records)
+
+    transformer = Transformer.load(
+        "jpal",
+        source_files,
+        workers=workers,
+        checkpoint_path=checkpoint_path,
+        resume=True,
+    )
+    resumed_records = write(transformer)
+
+    assert transformer.processed_record_count == len(resumed_records)
+    assert [record[:3] for record in interrupted_records + resumed_records] == [
+        record[:3] for record in expected_records
+    ]
+    assert {record[3:] for record in resumed_records} == {
+        (checkpoint.run_id, checkpoint.run_timestamp)
+    }
+    checkpoint = Checkpoint.load(checkpoint_path)
+    assert (
+        checkpoint.source_file_index,
+        checkpoint.source_file_run_record_offset,
+        checkpoint.run_record_offset,
+    ) == (2, 2 * records_per_file, 3 * records_per_file)
+    assert checkpoint.written_record_count == len(expected_records)
+
+
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_write_to_parquet_dataset_resume_keeps_deleted_record_ids(
+    run_id, tmp_path, pipeline
+):
+    source_files = []
+    for index in range(1, 4):
+        source_file = (
+            tmp_path / f"jpal-2024-01-01-full-extracted-records-to-index_{index}.xml"
+        )
+        shutil.copy("tests/fixtures/oai_pmh_records.xml", source_file)
+        source_files.append(str(source_file))
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    def write(transformer, fail_on_batch=None):
+        def write_records(rows_iter):
+            for records_written, _ in enumerate(rows_iter):
+                if fail_on_batch and records_written == (fail_on_batch - 1) * 2:
+                    raise RuntimeError("interrupted")
+            return []
+
+        with (
+            mock.patch("timdex_dataset_api.TIMDEXDataset") as mocked_timdex_dataset,
+            contextlib.suppress(RuntimeError),
+        ):
+            mocked_timdex_dataset.return_value.records.write.side_effect = write_records
+            transformer.write_to_parquet_dataset(
+                "dataset", batch_rows=2, pipeline=pipeline
+            )
+
+    expected_path = tmp_path / "expected-deleted.txt"
+    write(
+        Transformer.load(
+            "jpal", source_files, run_id=run_id, deleted_records_path=str(expected_path)
+        )
+    )
+    deleted_records_path = tmp_path / "deleted.txt.gz"
+    write(
+        Transformer.load(
+            "jpal",
+            source_files,
+            checkpoint_path=checkpoint_path,
+            deleted_records_path=str(deleted_records_path),
+        ),
+        fail_on_batch=3,
+    )
+    checkpoint = Checkpoint.load(checkpoint_path)
+    assert checkpoint.deleted_records_path == str(deleted_records_path)
+    assert checkpoint.deleted_record_count == 1
+
+    transformer = Transformer.load(
+        "jpal",
+        source_files,
+        checkpoint_path=checkpoint_path,
+        resume=True,
+        deleted_records_path=str(deleted_records_path),
+    )
+    write(transformer)
+
+    with smart_open.open(str(deleted_records_path)) as deleted_records_file:
+        deleted_record_ids = deleted_records_file.read().splitlines()
+    assert len(deleted_record_ids) == len(source_files)
+    assert deleted_record_ids == expected_path.read_text().splitlines()
+    assert Checkpoint.load(checkpoint_path).deleted_record_count == len(source_files)
+
+
+def test_transformer_load_resume_without_checkpoint_starts_new_run(caplog, tmp_path):
+    source_file = str(tmp_path / "jpal-2024-01-01-full-extracted-records-to-index.xml")
+    shutil.copy("tests/fixtures/datacite/datacite_records.xml", source_file)
+    transformer = Transformer.load(
+        "jpal",
+        source_file,
+        checkpoint_path=str(tmp_path / "checkpoint.json"),
+        resume=True,
+    )
+    assert "No checkpoint found at" in caplog.text
+    assert len(list(transformer)) == len(list(Datacite.read_source_file(source_file)))
+
+
+def test_read_source_file_skips_records_before_start():
+    xml_file = "tests/fixtures/datacite/datacite_records.xml"
+    json_file = "tests/fixtures/aardvark_records.jsonl"
+    assert (
+        list(Datacite.read_source_file(xml_file, 5))
+        == (list(Datacite.read_source_file(xml_file))[5:])
+    )
+    assert (
+        list(MITAardvark.read_source_file(json_file, 1))
+        == (list(MITAardvark.read_source_file(json_file))[1:])
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_transformer_skips_unchanged_source_records(run_id, tmp_path, workers):
+    source_file = str(tmp_path / "jpal-2024-01-01-daily-extracted-records-to-index.xml")
+    shutil.copy("tests/fixtures/datacite/datacite_records.xml", source_file)
+    raw_records = list(Datacite.read_source_file(source_file))
+    unchanged_offsets = {0, 1, 2, 10, 11, len(raw_records) - 1}
+    transformer = Transformer.load(
+        "jpal",
+        source_file,
+        run_id=run_id,
+        workers=workers,
+        checkpoint_path=str(tmp_path / "checkpoint.json"),
+        source_record_hashes=SourceRecordHashes(
+            raw_records[offset] for offset in unchanged_offsets
+        ),
+    )
+    with mock.patch("timdex_dataset_api.TIMDEXDataset") as mocked_timdex_dataset:
+        mocked_timdex_dataset.return_value.records.write.side_effect = lambda rows_iter: [
+            (record.run_record_offset, record.source_record) for record in rows_iter
+        ]
+        written_records = transformer.write_to_parquet_dataset("dataset", batch_rows=5)
+
+    changed_offsets = [
+        offset for offset in range(len(raw_records)) if offset not in unchanged_offsets
+    ]
+    assert written_records == [
+        (offset, raw_records[offset]) for offset in changed_offsets
+    ]
+    assert transformer.unchanged_record_count == len(unchanged_offsets)
+    assert transformer.processed_record_count == len(raw_records)
+    checkpoint = Checkpoint.load(str(tmp_path / "checkpoint.json"))
+    assert checkpoint.run_record_offset == changed_offsets[-1] + 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_transformer_uses_transformed_record_cache(tmp_path, workers):
+    source_file = str(tmp_path / "jpal-2024-01-01-full-extracted-records-to-index.xml")
+    shutil.copy("tests/fixtures/datacite/datacite_records.xml", source_file)
+    run_timestamp = "2024-01-01T12:00:00"
+    cache = TransformedRecordCache(str(tmp_path / "cache"))
+    cached_run_records = list(
+        Transformer.load(
+            "jpal",
+            source_file,
+            run_id="run-1",
+            run_timestamp=run_timestamp,
+            workers=workers,
+            transformed_record_cache=cache,
+        )
+    )
+    assert (cache.hits, cache.misses) == (0, len(cached_run_records))
+
+    cache = TransformedRecordCache(str(tmp_path / "cache"))
+    transformer = Transformer.load(
+        "jpal",
+        source_file,
+        run_id="run-2",
+        run_timestamp=run_timestamp,
+        workers=workers,
+        transformed_record_cache=cache,
+    )
+    records = list(transformer)
+
+    cached_record_count = sum(
+        record.action in {"index", "delete"} for record in cached_run_records
+    )
+    assert cached_record_count
+    assert (cache.hits, cache.misses) == (
+        cached_record_count,
+        len(cached_run_records) - cached_record_count,
+    )
+    assert records == list(
+        Transformer.load("jpal", source_file, run_id="run-2", run_timestamp=run_timestamp)
+    )
+
+
+@pytest.mark.parametrize("source", ["libguides", "mitlibwebsite"])
+def test_transformer_does_not_cache_run_dependent_sources(tmp_path, run_id, source):
+    with (
+        mock.patch("transmogrifier.config.LIBGUIDES_CLIENT_ID", "123"),
+        mock.patch("transmogrifier.config.LIBGUIDES_API_TOKEN", "aaabbbdddccc"),
+    ):
+        transformer = Transformer.get_transformer(source)(
+            source,
+            iter(()),
+            run_id=run_id,
+            transformed_record_cache=TransformedRecordCache(str(tmp_path / "cache")),
+        )
+    assert transformer.transformed_record_cache is None
+
+
+@pytest.mark.parametrize(
+    ("transformer_class", "source", "source_file"),
+    [
+        (Datacite, "cool-repo", "tests/fixtures/datacite/datacite_records.xml"),
+        (Marc, "alma", "tests/fixtures/marc/marc_record_all_fields.xml"),
+        (MITAardvark, "gismit", "tests/fixtures/aardvark_records.jsonl"),
+    ],
+)
+def test_transformer_record_validation_mode_yields_same_records_as_full(
+    run_id, transformer_class, source, source_file
+):
+    def transform(validation_mode):
+        return list(
+            transformer_class(
+                source,
+                transformer_class.parse_source_file_with_raw(source_file),
+                run_id=run_id,
+                run_timestamp="2024-01-01T12:00:00",
+                validation_mode=validation_mode,
+            )
+        )
+
+    full_records = transform("full")
+    assert full_records
+    assert transform("record") == full_records
+
+
+@pytest.mark.parametrize("validation_mode", ["full", "record"])
+def test_transformer_record_validation_mode_raises_same_error_as_full(
+    run_id, validation_mode
+):
+    transformer = Datacite(
+        "cool-repo",
+        Datacite.parse_source_file("tests/fixtures/datacite/datacite_records.xml"),
+        run_id=run_id,
+        validation_mode=validation_mode,
+    )
+    with (
+        mock.patch.object(Datacite, "get_dates", autospec=True, return_value=["test"]),
+        pytest.raises(
+            TypeError, match=r"'dates' must be <class 'transmogrifier.models.Date'>"
+        ),
+    ):
+        transformer.transform(next(transformer.source_records))
+
+
+def test_transformer_with_workers_transforms_records_in_record_validation_mode(
+    run_id,
+):
+    source_file = "tests/fixtures/aardvark_records.jsonl"
+
+    def transform(source_records, workers):
+        return list(
+            MITAardvark(
+                "gismit",
+                source_records,
+                run_id=run_id,
+                run_timestamp="2024-01-01T12:00:00",
+                workers=workers,
+                validation_mode="record",
+            )
+        )
+
+    serial_records = transform(MITAardvark.parse_source_file_with_raw(source_file), 1)
+    assert serial_records
+    assert transform(MITAardvark.read_source_file(source_file), 2) == serial_records
+
+
+def test_json_transformer_import_does_not_import_xml_or_dataset_modules():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; import transmogrifier.sources.json.aardvark; "
+                "print([m for m in ('bs4', 'lxml', 'timdex_dataset_api') "
+                "if m in sys.modules])"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.splitlines()[-1] == "[]"
@@ -0,0 +1,121 @@
+# ruff: noqa: PLR2004, SLF001
+import threading
+
+import pytest
+from bs4 import BeautifulSoup
+
+from transmogrifier.sources.xmlparsing import (
+    XMLParsingEngine,
+    configure_parsing_engine,
+    parse_bs4,
+    parsing_engine,
+)
+from transmogrifier.sources.xmltransformer import XMLTransformer
+
+
+@pytest.fixture
+def record_bytes():
+    return [
+        f"<record><header><identifier>{i}</identifier></header></record>".encode()
+        for i in range(10)
+    ]
+
+
+def test_parse_bs4_returns_beautifulsoup_object():
+    record = parse_bs4(b"<record><title>Title</title></record>")
+    assert isinstance(record, BeautifulSoup)
+    assert record.find("title").string == "Title"
+
+
+def test_parsing_engine_parse_runs_outside_calling_thread():
+    engine = XMLParsingEngine()
+    parsing_threads = set()
+
+    def parse(source_record):
+        parsing_threads.add(threading.current_thread())
+        return parse_bs4(source_record)
+
+    assert engine.executor.submit(parse, b"<record/>").result() is not None
+    assert threading.current_thread() not in parsing_threads
+    engine.shutdown()
+
+
+def test_parsing_engine_parse_many_preserves_record_order(record_bytes):
+    engine = XMLParsingEngine(workers=3)
+    records = list(engine.parse_many(iter(record_bytes)))
+    assert [record.identifier.string for record in records] == [str(i) for i in range(10)]
+    engine.shutdown()
+
+
+def test_parsing_engine_reuses_pool_across_records(record_bytes):
+    engine = XMLParsingEngine(workers=2)
+    executor = engine.executor
+    list(engine.parse_many(iter(record_bytes)))
+    engine.parse(record_bytes[0])
+    assert engine.executor is executor
+    assert len(executor._threads) <= 2
+    engine.shutdown()
+
+
+def test_parsing_engine_recreates_pool_in_forked_process(monkeypatch):
+    engine = XMLParsingEngine()
+    executor = engine.executor
+    monkeypatch.setattr(engine, "_executor_pid", -1)
+    assert engine.executor is not executor
+    executor.shutdown()
+    engine.shutdown()
+
+
+def test_parsing_engine_invalid_executor_type_raises_error():
+    with pytest.raises(ValueError, match="Unrecognized executor_type parameter: fiber"):
+        XMLParsingEngine(executor_type="fiber")
+
+
+def test_parsing_engine_process_executor_type_raises_error():
+    with pytest.raises(ValueError, match="Unrecognized executor_type parameter: process"):
+        XMLParsingEngine(executor_type="process")
+
+
+def test_parsing_engine_invalid_record_type_raises_error():
+    with pytest.raises(ValueError, match="Unrecognized record_type parameter: etree"):
+        XMLParsingEngine(record_type="etree")
+
+
+def test_parsing_engine_invalid_workers_raises_error():
+    with pytest.raises(ValueError, match="requires at least 1 worker, received: 0"):
+        XMLParsingEngine(workers=0)
+
+
+def test_configure_parsing_engine_updates_shared_engine():
+    try:
+        result = configure_parsing_engine("thread", 4)
+        assert parsing_engine.workers == 4
+        assert result == (
+            "XML parsing engine configured with executor_type=thread, workers=4, "
+            "record_type=bs4"
+        )
+    finally:
+        configure_parsing_engine()
+
+
+def test_xmltransformer_parse_source_file_uses_parsing_engine(monkeypatch):
+    thread_starts = []
+    original_start = threading.Thread.start
+
+    def start(thread):
+        thread_starts.append(thread)
+        original_start(thread)
+
+    monkeypatch.setattr(threading.Thread, "start", start)
+    records = list(
+        XMLTransformer.parse_source_file("tests/fixtures/datacite/datacite_records.xml")
+    )
+    assert len(records) == 38
+    assert len(thread_starts) <= parsing_engine.workers
+
+
+def test_xmltransformer_read_source_file_returns_record_bytes():
+    records = list(XMLTransformer.read_source_file("tests/fixtures/oai_pmh_records.xml"))
+    assert len(records) == 3
+    assert all(isinstance(record, bytes) for record in records)
+    assert XMLTransformer.parse_source_record(records[0]).header.identifier.string
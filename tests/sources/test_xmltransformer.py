@@ -19,7 +19,7 @@ def test_xmltransformer_iterates_through_all_records(caplog, oai_pmh_records):
     assert len(list(output_records)) == 3
     assert output_records.processed_record_count == 3
     assert output_records.transformed_record_count == 2
-    assert len(output_records.deleted_records) == 1
+    assert output_records.deleted_record_count == 1
 
 
 def test_xmltransformer_parse_source_file_returns_record_iterator():
@@ -2113,3 +2113,39 @@ def test_record_is_deleted_returns_true_if_deleted():
 def test_record_is_deleted_returns_false_if_not_deleted():
     marc_record = Marc.parse_source_file("tests/fixtures/marc/marc_record_all_fields.xml")
     assert Marc.record_is_deleted(next(marc_record)) is False
+
+
+def test_get_record_index_builds_index_once_per_record():
+    source_record = create_marc_source_record_stub(
+        datafield_insert=(
+            '<datafield tag="650"><subfield code="a">Subject 1</subfield></datafield>'
+            '<datafield tag="650"><subfield code="a">Subject 2</subfield></datafield>'
+        )
+    )
+    record_index = Marc.get_record_index(source_record)
+    assert Marc.get_record_index(source_record) is record_index
+    assert Marc.get_record_index(create_marc_source_record_stub()) is not record_index
+
+
+def test_get_datafields_matches_find_all():
+    marc_xml_records = Marc.parse_source_file(
+        "tests/fixtures/marc/marc_record_all_fields.xml"
+    )
+    source_record = next(marc_xml_records)
+    for tag in ["245", "650", "856", "986", "999"]:
+        assert Marc.get_datafields(source_record, tag) == source_record.find_all(
+            "datafield", tag=tag
+        )
+    assert Marc.get_datafields(
+        source_record, "856", ind1="4", ind2=["0", "1"]
+    ) == source_record.find_all("datafield", tag="856", ind1="4", ind2=["0", "1"])
+
+
+def test_create_subfield_value_list_from_datafield_not_in_record_index():
+    datafield = BeautifulSoup(
+        '<datafield tag="650"><subfield code="a">Subject</subfield>'
+        '<subfield code="b">Other</subfield></datafield>',
+        "xml",
+    ).datafield
+    assert Marc.create_subfield_value_list_from_datafield(datafield, "a") == ["Subject"]
+    assert Marc.get_single_subfield_string(datafield, "b") == "Other"
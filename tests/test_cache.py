@@ -0,0 +1,140 @@
+# ruff: noqa: PLR2004
+import pickle
+from importlib import metadata
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+import transmogrifier.models as timdex
+from transmogrifier.cache import (
+    TransformedRecordCache,
+    add_timdex_provenance,
+    get_transformer_version,
+    remove_timdex_provenance,
+)
+from transmogrifier.sources.json.aardvark import MITAardvark
+from transmogrifier.sources.xml.datacite import Datacite
+from transmogrifier.sources.xml.marc import Marc
+
+
+def test_add_timdex_provenance_restores_removed_provenance():
+    timdex_record = timdex.TimdexRecord(
+        source="A Cool Repository",
+        source_link="https://example.com/12345",
+        timdex_record_id="cool-repo:12345",
+        title="Title",
+        timdex_provenance=timdex.TimdexProvenance(
+            source="cool-repo",
+            run_date="2024-01-01",
+            run_id="run-abc-123",
+            run_record_offset=7,
+        ),
+    )
+    transformed_record = timdex_record.to_json_bytes()
+    without_provenance = remove_timdex_provenance(transformed_record)
+    assert b"timdex_provenance" not in without_provenance
+    assert (
+        add_timdex_provenance(without_provenance, timdex_record.timdex_provenance)
+        == transformed_record
+    )
+
+
+def test_transformed_record_cache_get_and_put(tmp_path):
+    cache = TransformedRecordCache(str(tmp_path / "cache"))
+    assert cache.get("alma", "v1", b"<record/>") is None
+    cache.put("alma", "v1", b"<record/>", "alma:1", "index", b'{"title": "A"}')
+    cache.put("alma", "v1", b"<deleted/>", "alma:2", "delete", None)
+    assert cache.get("alma", "v1", b"<record/>") == ("alma:1", "index", b'{"title": "A"}')
+    assert cache.get("alma", "v1", b"<deleted/>") == ("alma:2", "delete", None)
+    assert cache.get("alma", "v2", b"<record/>") is None
+    assert cache.get("aspace", "v1", b"<record/>") is None
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert cache.hit_rate == 0.4
+    cache.close()
+
+    reopened_cache = TransformedRecordCache(str(tmp_path / "cache"))
+    assert reopened_cache.get("alma", "v1", b"<record/>") is not None
+
+
+def test_transformed_record_cache_evicts_least_recently_used(tmp_path):
+    cache = TransformedRecordCache(str(tmp_path), max_bytes=25)
+    for number in range(3):
+        cache.put(
+            "alma", "v1", f"{number}".encode(), f"alma:{number}", "index", b"x" * 10
+        )
+    cache.commit()
+    cache.get("alma", "v1", b"0")
+    cache.close()
+
+    cache = TransformedRecordCache(str(tmp_path))
+    assert cache.get("alma", "v1", b"0") is not None
+    assert cache.get("alma", "v1", b"1") is None
+    assert cache.get("alma", "v1", b"2") is not None
+
+
+def test_transformed_record_cache_pickles_without_connection(tmp_path):
+    cache = TransformedRecordCache(str(tmp_path))
+    cache.put("alma", "v1", b"<record/>", "alma:1", "index", b"{}")
+    cache.commit()
+    unpickled_cache = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    assert unpickled_cache.get("alma", "v1", b"<record/>") == ("alma:1", "index", b"{}")
+
+
+def test_get_transformer_version_covers_class_source_and_exclusion_list():
+    version = get_transformer_version(Marc, "alma")
+    assert version == get_transformer_version(Marc, "alma")
+    assert version != get_transformer_version(Marc, "alma", ["alma:1"])
+    assert version != get_transformer_version(Datacite, "jpal")
+    assert get_transformer_version(MITAardvark, "gismit") != get_transformer_version(
+        MITAardvark, "gisogm"
+    )
+
+
+def test_get_transformer_version_covers_xml_record_type():
+    assert get_transformer_version(Marc, "alma") != get_transformer_version(
+        Marc, "alma", record_type="bs4"
+    )
+    assert get_transformer_version(
+        Marc, "alma", record_type="bs4"
+    ) != get_transformer_version(Marc, "alma", record_type="lxml")
+
+
+@pytest.mark.parametrize(
+    "module_file",
+    [
+        "transmogrifier/config.py",
+        "transmogrifier/sources/lxmlrecord.py",
+        "transmogrifier/sources/xmlparsing.py",
+    ],
+)
+def test_get_transformer_version_covers_module_source(module_file):
+    version = get_transformer_version(Marc, "alma", record_type="bs4")
+    read_bytes = Path.read_bytes
+
+    def read_changed_module(path):
+        contents = read_bytes(path)
+        if path.as_posix().endswith(module_file):
+            return contents + b"\n# changed\n"
+        return contents
+
+    with mock.patch.object(
+        Path, "read_bytes", autospec=True, side_effect=read_changed_module
+    ):
+        assert get_transformer_version(Marc, "alma", record_type="bs4") != version
+
+
+@pytest.mark.parametrize("package", ["beautifulsoup4", "lxml"])
+def test_get_transformer_version_covers_package_versions(package):
+    version = get_transformer_version(Marc, "alma", record_type="bs4")
+    package_version = metadata.version
+
+    def changed_package_version(name):
+        if name == package:
+            return "0.0.0"
+        return package_version(name)
+
+    with mock.patch(
+        "transmogrifier.cache.metadata.version", side_effect=changed_package_version
+    ):
+        assert get_transformer_version(Marc, "alma", record_type="bs4") != version
@@ -0,0 +1,112 @@
+import pytest
+
+from transmogrifier.checkpoints import Checkpoint, SourceFilePositions
+from transmogrifier.exceptions import CriticalError
+
+
+@pytest.fixture
+def checkpoint():
+    return Checkpoint(
+        source="jpal",
+        source_files=["jpal-2024-01-01-full-extracted-records-to-index_1.xml"],
+        run_id="run-abc-123",
+        run_timestamp="2024-01-01T12:00:00",
+        run_record_offset=10,
+        written_record_count=10,
+    )
+
+
+def test_checkpoint_write_and_load_local(checkpoint, tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    checkpoint.write(checkpoint_path)
+    assert Checkpoint.load(checkpoint_path) == checkpoint
+
+
+def test_checkpoint_write_and_load_s3(checkpoint, mock_s3):
+    checkpoint.write("s3://test-bucket/checkpoints/checkpoint.json")
+    assert Checkpoint.load("s3://test-bucket/checkpoints/checkpoint.json") == checkpoint
+
+
+def test_checkpoint_load_missing_file_returns_none(caplog, tmp_path):
+    assert Checkpoint.load(str(tmp_path / "missing.json")) is None
+    assert "No checkpoint found at" in caplog.text
+
+
+def test_checkpoint_load_invalid_file_raises_critical_error(tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text('{"source": "jpal"}')
+    with pytest.raises(CriticalError, match="Could not load checkpoint"):
+        Checkpoint.load(str(checkpoint_path))
+
+
+def test_checkpoint_validate_accepts_same_run(checkpoint):
+    checkpoint.validate("jpal", checkpoint.source_files)
+    checkpoint.validate(
+        "jpal", checkpoint.source_files, "run-abc-123", "2024-01-01T12:00:00"
+    )
+
+
+@pytest.mark.parametrize(
+    ("source", "source_files", "run_id", "message"),
+    [
+        ("alma", None, None, "source 'alma' does not match"),
+        ("jpal", ["other.xml"], None, "source files \\['other.xml'\\] does not match"),
+        ("jpal", None, "run-xyz", "run id 'run-xyz' does not match"),
+    ],
+)
+def test_checkpoint_validate_raises_critical_error_for_different_run(
+    checkpoint, source, source_files, run_id, message
+):
+    with pytest.raises(CriticalError, match=message):
+        checkpoint.validate(source, source_files or checkpoint.source_files, run_id)
+
+
+def test_source_file_positions_position_of_next_record():
+    positions = SourceFilePositions()
+    positions.add(0, 2, 20, 25)
+    positions.add(3, 3, 28, 28)
+    # an empty file is started at the same position as the file after it
+    positions.add(10, 4, 35, 35)
+    positions.add(10, 5, 35, 35)
+    assert positions.position(1) == (2, 20, 26)
+    assert positions.position(3) == (3, 28, 28)
+    assert positions.position(9) == (3, 28, 34)
+    assert positions.position(10) == (5, 35, 35)
+    assert positions.position(12) == (5, 35, 37)
+
+
+def test_checkpoint_load_missing_s3_file_returns_none(mock_s3):
+    assert Checkpoint.load("s3://test-bucket/checkpoints/missing.json") is None
+
+
+def test_checkpoint_load_deleted_record_ids_returns_checkpointed_ids(
+    checkpoint, tmp_path
+):
+    deleted_records_path = tmp_path / "deleted.txt"
+    deleted_records_path.write_text("jpal:1\njpal:2\njpal:3\n")
+    checkpoint.deleted_records_path = str(deleted_records_path)
+    checkpoint.deleted_record_count = 2
+    assert checkpoint.load_deleted_record_ids() == ["jpal:1", "jpal:2"]
+
+
+def test_checkpoint_load_deleted_record_ids_without_deleted_records(checkpoint):
+    assert checkpoint.load_deleted_record_ids() == []
+
+
+@pytest.mark.parametrize(
+    ("file_contents", "message"),
+    [
+        ("jpal:1\n", "has 1 id\\(s\\), expected 2"),
+        (None, "Could not load deleted record ids"),
+    ],
+)
+def test_checkpoint_load_deleted_record_ids_raises_critical_error(
+    checkpoint, tmp_path, file_contents, message
+):
+    deleted_records_path = tmp_path / "deleted.txt"
+    if file_contents is not None:
+        deleted_records_path.write_text(file_contents)
+    checkpoint.deleted_records_path = str(deleted_records_path)
+    checkpoint.deleted_record_count = 2
+    with pytest.raises(CriticalError, match=message):
+        checkpoint.load_deleted_record_ids()
@@ -1,8 +1,23 @@
+import json
+import shutil
 import subprocess
+import sys
+from pathlib import Path
 from unittest import mock
 
 from transmogrifier.cli import main
 from transmogrifier.exceptions import CriticalError
+from transmogrifier.sources.xmlparsing import configure_parsing_engine
+
+# modules that are slow to import, and are only needed once arguments are parsed
+DEFERRED_IMPORTS = [
+    "bs4",
+    "lxml",
+    "sentry_sdk",
+    "smart_open",
+    "timdex_dataset_api",
+    "transmogrifier.sources.transformer",
+]
 
 
 def _mock_transformer():
@@ -10,14 +25,15 @@ def _mock_transformer():
     transformer.processed_record_count = 100
     transformer.transformed_record_count = 100
     transformer.skipped_record_count = 0
-    transformer.deleted_records = []
+    transformer.deleted_record_count = 0
     return transformer
 
 
 def test_transform_no_sentry_not_verbose(caplog, monkeypatch, runner, tmp_path):
     monkeypatch.delenv("SENTRY_DSN", raising=False)
     with mock.patch(
-        "transmogrifier.cli.Transformer.load", return_value=_mock_transformer()
+        "transmogrifier.sources.transformer.Transformer.load",
+        return_value=_mock_transformer(),
     ):
         result = runner.invoke(
             main,
@@ -40,7 +56,8 @@ def test_transform_with_sentry_and_verbose(caplog, monkeypatch, runner, tmp_path
     monkeypatch.setenv("SENTRY_DSN", "https://1234567890@00000.ingest.sentry.io/123456")
     monkeypatch.setenv("STATUS_UPDATE_INTERVAL", "10")
     with mock.patch(
-        "transmogrifier.cli.Transformer.load", return_value=_mock_transformer()
+        "transmogrifier.sources.transformer.Transformer.load",
+        return_value=_mock_transformer(),
     ):
         result = runner.invoke(
             main,
@@ -82,6 +99,7 @@ def test_transform_no_records(
     )
     assert result.exit_code == 0
     assert "Completed transform, total records processed: 0" in caplog.text
+    assert "date cache hits: " in caplog.text
 
 
 def test_transform_deleted_records(
@@ -102,6 +120,28 @@ def test_transform_deleted_records(
     assert "deleted records: 1" in caplog.text
 
 
+def test_transform_deleted_records_file(
+    caplog, runner, source_input_file, empty_dataset_location, tmp_path
+):
+    deleted_records_file = tmp_path / "deleted.txt"
+    result = runner.invoke(
+        main,
+        [
+            "-i",
+            source_input_file,
+            "--output-location",
+            empty_dataset_location,
+            "-s",
+            "jpal",
+            "--deleted-records-file",
+            str(deleted_records_file),
+        ],
+    )
+    assert result.exit_code == 0
+    assert "deleted records: 1" in caplog.text
+    assert len(deleted_records_file.read_text().splitlines()) == 1
+
+
 def test_transform_run_id_argument_passed_and_used(caplog, runner, tmp_path):
     caplog.set_level("INFO")
     run_id = "abc123"
@@ -203,6 +243,145 @@ def test_transform_run_timestamp_argument_not_passed_and_timestamp_minted(
     assert "run_timestamp set: '2024-06-03T12:34:56+00:00'" in caplog.text
 
 
+def test_transform_parse_engine_options_configure_parsing_engine(
+    caplog, runner, source_input_file, empty_dataset_location
+):
+    caplog.set_level("INFO")
+    try:
+        result = runner.invoke(
+            main,
+            [
+                "-s",
+                "jpal",
+                "-i",
+                source_input_file,
+                "-o",
+                empty_dataset_location,
+                "--parse-engine",
+                "thread",
+                "--parse-workers",
+                "2",
+            ],
+        )
+    finally:
+        configure_parsing_engine()
+    assert result.exit_code == 0
+    assert (
+        "XML parsing engine configured with executor_type=thread, workers=2, "
+        "record_type=bs4" in caplog.text
+    )
+    assert "total records processed: 4" in caplog.text
+
+
+def test_transform_json_source_does_not_configure_parsing_engine(
+    caplog, runner, empty_dataset_location, tmp_path
+):
+    caplog.set_level("INFO")
+    source_file = tmp_path / "gismit-2024-01-01-full-extracted-records-to-index.jsonl"
+    shutil.copy("tests/fixtures/aardvark_records.jsonl", source_file)
+    with mock.patch(
+        "transmogrifier.sources.xmlparsing.configure_parsing_engine"
+    ) as mocked_configure_parsing_engine:
+        result = runner.invoke(
+            main,
+            ["-s", "gismit", "-i", str(source_file), "-o", empty_dataset_location],
+        )
+    assert result.exit_code == 0
+    mocked_configure_parsing_engine.assert_not_called()
+    assert "XML parsing engine configured" not in caplog.text
+
+
+def test_transform_workers_option_transforms_records_in_worker_processes(
+    caplog, runner, source_input_file, empty_dataset_location
+):
+    caplog.set_level("INFO")
+    result = runner.invoke(
+        main,
+        [
+            "-s",
+            "jpal",
+            "-i",
+            source_input_file,
+            "-o",
+            empty_dataset_location,
+            "--workers",
+            "2",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "total records processed: 4" in caplog.text
+
+
+def test_transform_profile_report_option_writes_report(
+    caplog, runner, source_input_file, empty_dataset_location, tmp_path
+):
+    caplog.set_level("INFO")
+    profile_report = tmp_path / "profile.json"
+    result = runner.invoke(
+        main,
+        [
+            "-s",
+            "jpal",
+            "-i",
+            source_input_file,
+            "-o",
+            empty_dataset_location,
+            "--profile-report",
+            str(profile_report),
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Transform profile:" in caplog.text
+    report = json.loads(profile_report.read_text())
+    assert report["source"] == "jpal"
+    assert "get_valid_title" in [timing["method"] for timing in report["methods"]]
+
+
+def test_transform_batch_options_limit_write_batches(
+    caplog, runner, source_input_file, empty_dataset_location
+):
+    caplog.set_level("INFO")
+    result = runner.invoke(
+        main,
+        [
+            "-s",
+            "jpal",
+            "-i",
+            source_input_file,
+            "-o",
+            empty_dataset_location,
+            "--batch-rows",
+            "3",
+            "--batch-bytes",
+            "1000000",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Wrote batch 1: 3 records" in caplog.text
+    assert "Wrote batch 2: 1 records" in caplog.text
+
+
+def test_transform_pipeline_option(
+    caplog, runner, source_input_file, empty_dataset_location
+):
+    caplog.set_level("INFO")
+    result = runner.invoke(
+        main,
+        [
+            "-s",
+            "jpal",
+            "-i",
+            source_input_file,
+            "-o",
+            empty_dataset_location,
+            "--pipeline",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "total records processed: 4" in caplog.text
+    assert "deleted records: 1" in caplog.text
+
+
 def test_transform_no_memory_fault_for_threaded_bs4_parsing(monkeypatch, tmp_path):
     """This test requires running the CLI as a subprocess to simulate the 'uv run ...'
     context. In this context, we have observed memory faults when BeautifulSoup4 is used
@@ -235,7 +414,8 @@ def test_transform_critical_error_prevents_writing(
 
     with (
         mock.patch(
-            "transmogrifier.cli.Transformer.load", return_value=source_transformer
+            "transmogrifier.sources.transformer.Transformer.load",
+            return_value=source_transformer,
         ),
         mock.patch.object(
             source_transformer,
@@ -259,3 +439,191 @@ def test_transform_critical_error_prevents_writing(
     assert str(result.exception) == "Catastrophic failure, no records will work!"
     assert result.exit_code != 0
     assert "Completed transform, total records processed" not in caplog.text
+
+
+def test_cli_import_does_not_import_deferred_modules():
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; import transmogrifier.cli; "
+                f"print([m for m in {DEFERRED_IMPORTS!r} if m in sys.modules])"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
+def test_transform_help_does_not_import_deferred_modules():
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; from transmogrifier.cli import main; "
+                "main(['--help'], standalone_mode=False); "
+                f"print([m for m in {DEFERRED_IMPORTS!r} if m in sys.modules])"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
+def test_transform_multiple_input_files_in_one_run(
+    caplog, runner, source_input_file, empty_dataset_location, tmp_path
+):
+    deleted_records_file = tmp_path / "deleted.txt"
+    result = runner.invoke(
+        main,
+        [
+            "-i",
+            "tests/fixtures/dataset/libguides-2024-06-0*-full-extracted-records-to-index.xml",
+            "-i",
+            source_input_file,
+            "--output-location",
+            empty_dataset_location,
+            "-s",
+            "jpal",
+            "--deleted-records-file",
+            str(deleted_records_file),
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Transforming 2 source files" in caplog.text
+    assert (
+        "Transforming source file tests/fixtures/dataset/"
+        "libguides-2024-06-04-full-extracted-records-to-index.xml"
+    ) in caplog.text
+    assert "deleted records: 1" in caplog.text
+    assert len(deleted_records_file.read_text().splitlines()) == 1
+
+
+def test_transform_resume_requires_checkpoint_file(
+    runner, source_input_file, empty_dataset_location
+):
+    result = runner.invoke(
+        main,
+        [
+            "-i",
+            source_input_file,
+            "-o",
+            empty_dataset_location,
+            "-s",
+            "jpal",
+            "--resume",
+        ],
+    )
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--resume requires --checkpoint-file" in result.output
+
+
+def test_transform_resume_completed_run_skips_written_records(
+    caplog, runner, source_input_file, empty_dataset_location, tmp_path
+):
+    checkpoint_file = str(tmp_path / "checkpoint.json")
+    args = [
+        "-i",
+        source_input_file,
+        "-o",
+        empty_dataset_location,
+        "-s",
+        "jpal",
+        "--checkpoint-file",
+        checkpoint_file,
+    ]
+    result = runner.invoke(main, args)
+    assert result.exit_code == 0
+    checkpoint = json.loads(Path(checkpoint_file).read_text())
+    assert (
+        f"total records processed: {checkpoint['written_record_count']}," in caplog.text
+    )
+
+    caplog.clear()
+    result = runner.invoke(main, [*args, "--resume"])
+    assert result.exit_code == 0
+    assert f"Resuming run {checkpoint['run_id']}" in caplog.text
+    assert "total records processed: 0" in caplog.text
+
+
+def test_transform_incremental_skips_unchanged_records(
+    caplog, runner, source_input_file, empty_dataset_location, tmp_path
+):
+    from transmogrifier.incremental import SourceRecordHashes  # noqa: PLC0415
+    from transmogrifier.sources.xmltransformer import XMLTransformer  # noqa: PLC0415
+
+    daily_input_file = str(
+        tmp_path / "libguides-2024-06-03-daily-extracted-records-to-index.xml"
+    )
+    shutil.copy(source_input_file, daily_input_file)
+    raw_records = list(XMLTransformer.read_source_file(daily_input_file))
+    with mock.patch(
+        "transmogrifier.incremental.SourceRecordHashes.load",
+        return_value=SourceRecordHashes(raw_records[:2]),
+    ) as mocked_load:
+        result = runner.invoke(
+            main,
+            [
+                "-i",
+                daily_input_file,
+                "-o",
+                empty_dataset_location,
+                "-s",
+                "jpal",
+                "--incremental",
+            ],
+        )
+    assert result.exit_code == 0
+    mocked_load.assert_called_once_with(empty_dataset_location, "jpal")
+    assert f"total records processed: {len(raw_records)}," in caplog.text
+    assert "unchanged records: 2," in caplog.text
+
+
+def test_transform_incremental_requires_daily_run(
+    runner, source_input_file, empty_dataset_location
+):
+    with mock.patch("transmogrifier.incremental.SourceRecordHashes.load") as mocked_load:
+        result = runner.invoke(
+            main,
+            [
+                "-i",
+                source_input_file,
+                "-o",
+                empty_dataset_location,
+                "-s",
+                "jpal",
+                "--incremental",
+            ],
+        )
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--incremental requires daily run input files" in result.output
+    mocked_load.assert_not_called()
+
+
+def test_transform_with_cache_dir_reports_hit_rate(
+    caplog, runner, source_input_file, empty_dataset_location, tmp_path
+):
+    args = [
+        "-i",
+        source_input_file,
+        "-o",
+        empty_dataset_location,
+        "-s",
+        "jpal",
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+    result = runner.invoke(main, args)
+    assert result.exit_code == 0
+    assert "Transformed record cache hits: 0," in caplog.text
+
+    caplog.clear()
+    result = runner.invoke(main, args)
+    assert result.exit_code == 0
+    assert "misses: 0, hit rate: 100.0%" in caplog.text
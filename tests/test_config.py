@@ -1,12 +1,20 @@
 import logging
+import os
+import subprocess
+import sys
 
 import pytest
 from bs4 import BeautifulSoup  # type: ignore[import-untyped]
 
 from transmogrifier.config import (
+    ExternalConfig,
+    compile_loc_code_crosswalk,
     configure_logger,
     configure_sentry,
     load_external_config,
+    load_json_config,
+    load_loc_code_crosswalk,
+    load_shared_config,
 )
 
 
@@ -57,3 +65,92 @@ def test_load_external_config_xml():
     assert isinstance(
         load_external_config("config/loc-countries.xml", "xml"), BeautifulSoup
     )
+
+
+def test_compile_loc_code_crosswalk_matches_xml_code_search():
+    with open("config/loc-countries.xml", "rb") as config_file:
+        content = config_file.read()
+    crosswalk = compile_loc_code_crosswalk(content)
+    soup = BeautifulSoup(content, "xml")
+    for code in ["xxu", "bwr", "am", "ai", "xi", "air"]:
+        code_element = soup.find("code", string=code)
+        assert crosswalk[code] == (
+            str(code_element.parent.find("name").string),
+            code_element.get("status") == "obsolete",
+        )
+
+
+def test_load_loc_code_crosswalk_writes_and_reads_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr("transmogrifier.config.CONFIG_CACHE_DIR", str(tmp_path))
+    crosswalk = load_loc_code_crosswalk("config/loc-countries.xml")
+    assert crosswalk["xxu"] == ("United States", False)
+    cache_files = os.listdir(tmp_path)
+    assert len(cache_files) == 1
+    assert cache_files[0].startswith("loc-countries.xml.")
+
+    monkeypatch.setattr(
+        "transmogrifier.config.compile_loc_code_crosswalk",
+        lambda _content: pytest.fail("crosswalk should be loaded from cache"),
+    )
+    assert load_loc_code_crosswalk("config/loc-countries.xml") == crosswalk
+
+
+def test_load_loc_code_crosswalk_compiles_if_cache_not_writable(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "not-a-directory"
+    cache_dir.write_text("")
+    monkeypatch.setattr("transmogrifier.config.CONFIG_CACHE_DIR", str(cache_dir))
+    crosswalk = load_loc_code_crosswalk("config/loc-countries.xml")
+    assert crosswalk["bwr"] == ("Byelorussian S.S.R", True)
+
+
+def test_external_config_loaded_on_first_access_and_shared():
+    loaded_file_paths = []
+
+    def loader(file_path):
+        loaded_file_paths.append(file_path)
+        return {"file_path": file_path}
+
+    class First:
+        config = ExternalConfig("config/first.json", loader)
+
+    class Second:
+        config = ExternalConfig("config/first.json", loader)
+
+    assert loaded_file_paths == []
+    assert First.config == {"file_path": "config/first.json"}
+    assert First().config is First.config
+    assert Second.config is First.config
+    assert loaded_file_paths == ["config/first.json"]
+
+
+def test_external_config_load_json_config():
+    class Transformer:
+        crosswalk = ExternalConfig(
+            "config/marc_content_type_crosswalk.json", load_json_config
+        )
+
+    assert Transformer.crosswalk == load_external_config(
+        "config/marc_content_type_crosswalk.json", "json"
+    )
+    shared_config = load_shared_config(
+        load_json_config, "config/marc_content_type_crosswalk.json"
+    )
+    assert shared_config is Transformer.crosswalk
+
+
+def test_importing_transformers_does_not_load_external_configs():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import transmogrifier.sources.xml.ead, transmogrifier.sources.xml.marc; "
+                "from transmogrifier.config import load_shared_config; "
+                "print(load_shared_config.cache_info().currsize)"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "0"
@@ -0,0 +1,43 @@
+import pickle
+
+import pytest
+
+from transmogrifier.exceptions import CriticalError
+from transmogrifier.exclusions import ExclusionList
+
+
+def test_exclusion_list_membership_and_order():
+    exclusion_list = ExclusionList(["b", "a", "b"])
+    assert "a" in exclusion_list
+    assert "c" not in exclusion_list
+    assert list(exclusion_list) == ["b", "a"]
+    assert len(exclusion_list) == 2  # noqa: PLR2004
+
+
+def test_exclusion_list_load_from_s3(caplog, mock_s3_exclusion_list):
+    caplog.set_level("INFO")
+    exclusion_list = ExclusionList.load(
+        "s3://test-bucket/libguides/config/libguides-exclusions.csv"
+    )
+    assert "https://libguides.mit.edu/excluded1" in exclusion_list
+    assert len(exclusion_list) == 2  # noqa: PLR2004
+    assert (
+        "Loaded exclusion list from "
+        "s3://test-bucket/libguides/config/libguides-exclusions.csv with 2 entries in"
+    ) in caplog.text
+
+
+def test_exclusion_list_load_skips_blank_lines(tmp_path):
+    exclusion_list_path = tmp_path / "exclusions.csv"
+    exclusion_list_path.write_text("one\n\n  two  \n\n")
+    assert list(ExclusionList.load(str(exclusion_list_path))) == ["one", "two"]
+
+
+def test_exclusion_list_load_missing_file_raises_critical_error(tmp_path):
+    with pytest.raises(CriticalError, match="Could not load exclusion list"):
+        ExclusionList.load(str(tmp_path / "missing.csv"))
+
+
+def test_exclusion_list_is_picklable():
+    exclusion_list = pickle.loads(pickle.dumps(ExclusionList(["one"])))  # noqa: S301
+    assert list(exclusion_list) == ["one"]
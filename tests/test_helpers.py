@@ -1,10 +1,22 @@
 import logging
-from datetime import datetime
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+import pytest
 
 import transmogrifier.models as timdex
+from transmogrifier.config import DATE_FORMATS
 from transmogrifier.helpers import (
+    DATE_CACHE_SIZE,
+    DateFormatParser,
+    expand_source_files,
     generate_citation,
+    map_in_order,
+    natural_sort_key,
     parse_date_from_string,
+    prefetch,
     validate_date,
     validate_date_range,
 )
@@ -249,6 +261,83 @@ def test_parse_date_from_string_invalid_date_returns_none():
     assert parse_date_from_string("circa 1930s") is None
 
 
+def test_parse_date_from_string_matches_strptime_over_date_formats():
+    def parse_date_with_strptime(date_string):
+        for date_format in DATE_FORMATS:
+            try:
+                return datetime.strptime(date_string, date_format).astimezone(UTC)
+            except ValueError:
+                pass
+        return None
+
+    date_strings = [
+        "1930",
+        "circa 1930s",
+        "",
+        "1930 ",
+        "1930\n",
+        "2020-02-29",
+        "2021-02-29",
+        "21-02-30",
+        "2020-13",
+        "202011",
+        "2020111",
+        "1/1/20",
+        "12/31/69",
+        " 1/ 5/2020",
+        "2020-1-5t1:2:3.5z",
+        "2020-01-01T23:59:60",
+        "2020-01-01T24",
+        "1930-12-31T12:34:56.1234567",
+        "\u0661\u0669\u0663\u0660",
+    ]
+    # strings built from the configured formats, some with a character replaced
+    randomizer = random.Random(0)  # noqa: S311
+    for _ in range(2000):
+        date_string = randomizer.choice(DATE_FORMATS)
+        for directive, length in [
+            ("%Y", 4),
+            ("%y", 2),
+            ("%f", randomizer.randint(1, 7)),
+            ("%m", randomizer.randint(1, 2)),
+            ("%d", randomizer.randint(1, 2)),
+            ("%H", randomizer.randint(1, 2)),
+            ("%M", randomizer.randint(1, 2)),
+            ("%S", randomizer.randint(1, 2)),
+        ]:
+            digits = "".join(randomizer.choice("0123456789") for _ in range(length))
+            date_string = date_string.replace(directive, digits)
+        if randomizer.random() < 0.2:  # noqa: PLR2004
+            position = randomizer.randrange(len(date_string))
+            date_string = (
+                date_string[:position]
+                + randomizer.choice("0123456789-/:TZ. ")
+                + date_string[position + 1 :]
+            )
+        date_strings.append(date_string)
+
+    for date_string in date_strings:
+        assert parse_date_from_string(date_string) == parse_date_with_strptime(
+            date_string
+        ), date_string
+
+
+def test_date_format_parser_unsupported_directive_raises_error():
+    with pytest.raises(ValueError, match="Unsupported directive in date format: %B"):
+        DateFormatParser(["%B"])
+
+
+def test_parse_date_from_string_caches_results():
+    parse_date_from_string.cache_clear()
+    first_result = parse_date_from_string("2020-01-02")
+    assert parse_date_from_string("2020-01-02") is first_result
+    assert parse_date_from_string("circa 1930s") is None
+    assert parse_date_from_string("circa 1930s") is None
+    cache_info = parse_date_from_string.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 2)
+    assert cache_info.maxsize == DATE_CACHE_SIZE
+
+
 def test_validate_date_success():
     assert validate_date("1930", "1234") is True
 
@@ -287,3 +376,112 @@ def test_validate_date_range_invalid_start_date_logs_error(caplog):
     assert (
         "Record ID '1234' has a later start date than end date: '1930', '1924'"
     ) in caplog.text
+
+
+def test_map_in_order_yields_results_in_input_order():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(map_in_order(executor, lambda x: x * 2, range(20), 3)) == [
+            x * 2 for x in range(20)
+        ]
+
+
+def test_map_in_order_limits_items_in_flight():
+    consumed = []
+
+    def items():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = map_in_order(executor, lambda x: x, items(), 2)
+        assert next(results) == 0
+        assert consumed == [0, 1]
+        assert list(results) == list(range(1, 10))
+
+
+def test_prefetch_yields_items_in_order():
+    assert list(prefetch(range(20), 3, "test-prefetch")) == list(range(20))
+
+
+def test_prefetch_reraises_producer_exception():
+    def items():
+        yield 1
+        raise ValueError("failed to read")
+
+    prefetched = prefetch(items(), 3, "test-prefetch")
+    assert next(prefetched) == 1
+    with pytest.raises(ValueError, match="failed to read"):
+        next(prefetched)
+
+
+def test_prefetch_limits_items_ahead_and_stops_when_closed():
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    prefetched = prefetch(items(), 2, "test-prefetch")
+    assert next(prefetched) == 0
+    prefetched.close()
+    # at most max_size items are buffered, plus one waiting to be buffered
+    assert len(consumed) <= 4  # noqa: PLR2004
+    assert not any(thread.name == "test-prefetch" for thread in threading.enumerate())
+
+
+def test_natural_sort_key_orders_numbered_files_numerically():
+    files = [
+        "alma-2024-01-01-full-extracted-records-to-index_10.xml",
+        "alma-2024-01-01-full-extracted-records-to-index_2.xml",
+        "alma-2024-01-01-full-extracted-records-to-index_1.xml",
+    ]
+    assert sorted(files, key=natural_sort_key) == [files[2], files[1], files[0]]
+
+
+def test_expand_source_files_globs_and_directories(tmp_path):
+    for index in (1, 2, 10):
+        (
+            tmp_path / f"alma-2024-01-01-full-extracted-records-to-index_{index}.xml"
+        ).touch()
+    (tmp_path / "nested").mkdir()
+    expected = [
+        str(tmp_path / f"alma-2024-01-01-full-extracted-records-to-index_{index}.xml")
+        for index in (1, 2, 10)
+    ]
+    assert expand_source_files([str(tmp_path / "alma-*.xml")]) == expected
+    assert expand_source_files([str(tmp_path)]) == expected
+    # files matched more than once are included once, in the order first matched
+    assert expand_source_files([expected[2], str(tmp_path / "*.xml")]) == [
+        expected[2],
+        expected[0],
+        expected[1],
+    ]
+
+
+def test_expand_source_files_passes_through_file_paths():
+    assert expand_source_files(["s3://bucket/alma.xml", "missing.xml"]) == [
+        "s3://bucket/alma.xml",
+        "missing.xml",
+    ]
+
+
+def test_expand_source_files_raises_error_if_nothing_matched(tmp_path):
+    with pytest.raises(ValueError, match="No source files found matching"):
+        expand_source_files([str(tmp_path / "*.xml")])
+
+
+def test_expand_source_files_lists_s3_prefix_and_glob(mock_s3):
+    for key in [
+        "alma/alma-2024-01-01-full-extracted-records-to-index_10.xml",
+        "alma/alma-2024-01-01-full-extracted-records-to-index_9.xml",
+        "alma/alma-2024-01-02-daily-extracted-records-to-index.xml",
+        "alma/nested/alma-2024-01-01-full-extracted-records-to-index_1.xml",
+    ]:
+        mock_s3.put_object(Bucket="test-bucket", Key=key, Body=b"")
+    assert expand_source_files(["s3://test-bucket/alma/alma-2024-01-01-*.xml"]) == [
+        "s3://test-bucket/alma/alma-2024-01-01-full-extracted-records-to-index_9.xml",
+        "s3://test-bucket/alma/alma-2024-01-01-full-extracted-records-to-index_10.xml",
+    ]
+    assert len(expand_source_files(["s3://test-bucket/alma/"])) == 3  # noqa: PLR2004
@@ -0,0 +1,49 @@
+from unittest import mock
+
+import pytest
+
+from transmogrifier.exceptions import CriticalError
+from transmogrifier.incremental import SourceRecordHashes, hash_source_record
+
+
+def test_hash_source_record_is_stable_and_distinguishes_records():
+    assert hash_source_record(b"<record>1</record>") == hash_source_record(
+        b"<record>1</record>"
+    )
+    assert hash_source_record(b"<record>1</record>") != hash_source_record(
+        b"<record>2</record>"
+    )
+
+
+def test_source_record_hashes_membership():
+    source_record_hashes = SourceRecordHashes([b"one", b"two", b"one"])
+    assert b"one" in source_record_hashes
+    assert b"three" not in source_record_hashes
+    assert None not in source_record_hashes
+    assert len(source_record_hashes) == 2  # noqa: PLR2004
+
+
+def test_source_record_hashes_load_reads_current_indexed_records(caplog):
+    caplog.set_level("INFO")
+    with mock.patch("timdex_dataset_api.TIMDEXDataset") as mocked_timdex_dataset:
+        read_dicts_iter = mocked_timdex_dataset.return_value.records.read_dicts_iter
+        read_dicts_iter.return_value = iter(
+            [{"source_record": b"one"}, {"source_record": b"two"}]
+        )
+        source_record_hashes = SourceRecordHashes.load("dataset", "alma")
+    read_dicts_iter.assert_called_once_with(
+        table="current_records",
+        columns=["source_record"],
+        source="alma",
+        action="index",
+    )
+    assert b"two" in source_record_hashes
+    assert "Loaded 2 source record hashes for source alma from dataset" in caplog.text
+
+
+def test_source_record_hashes_load_error_raises_critical_error():
+    with (
+        mock.patch("timdex_dataset_api.TIMDEXDataset", side_effect=OSError("no dataset")),
+        pytest.raises(CriticalError, match="Could not load source record hashes"),
+    ):
+        SourceRecordHashes.load("dataset", "alma")
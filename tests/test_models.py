@@ -1,3 +1,7 @@
+import json
+import pickle
+
+import attrs
 import pytest
 
 import transmogrifier.models as timdex
@@ -404,6 +408,39 @@ def test_timdex_object_hash_same_if_same_class():
     assert identifier_0.__hash__() == identifier_1.__hash__()
 
 
+def test_timdex_object_with_list_attribute_hash_same_if_same_values():
+    subject_0 = timdex.Subject(value=["Trees", "Forests"], kind="LCSH")
+    subject_1 = timdex.Subject(value=["Trees", "Forests"], kind="LCSH")
+    assert subject_0 == subject_1
+    assert hash(subject_0) == hash(subject_1)
+    assert subject_0 != timdex.Subject(value=["Forests", "Trees"], kind="LCSH")
+
+
+def test_timdex_object_is_frozen():
+    identifier = timdex.Identifier(value="x", kind="y")
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        identifier.kind = "z"  # type: ignore[misc]
+
+
+def test_timdex_object_unpickled_hash_same_as_new_object():
+    contributor = timdex.Contributor(value="x", affiliation=["MIT"])
+    hash(contributor)
+    unpickled_contributor = pickle.loads(pickle.dumps(contributor))  # noqa: S301
+    assert hash(unpickled_contributor) == hash(
+        timdex.Contributor(value="x", affiliation=["MIT"])
+    )
+
+
+def test_mutable_timdex_object_hash_changes_with_attributes():
+    date = timdex.Date(range=timdex.DateRange(gte="2019", lte="2020"))
+    date_hash = hash(date)
+    date.kind = "Coverage"
+    assert hash(date) != date_hash
+    assert hash(date) == hash(
+        timdex.Date(kind="Coverage", range=timdex.DateRange(gte="2019", lte="2020"))
+    )
+
+
 def test_timdex_record_dedupe_alternate_titles(timdex_record_required_fields):
     timdex_record_required_fields.alternate_titles = [
         timdex.AlternateTitle(value="My Octopus Teacher"),
@@ -657,3 +694,83 @@ def test_timdex_dedupes_correctly_if_same_class():
         timdex.Identifier(value="x", kind="y"),
     ]
     assert timdex.dedupe(items) == [timdex.Identifier(value="x", kind="y")]
+
+
+@pytest.mark.parametrize(
+    "timdex_record_fixture",
+    ["timdex_record_required_fields", "timdex_record_all_fields_and_subfields"],
+)
+def test_timdex_record_to_json_bytes_matches_json_dumps_of_asdict(
+    request, timdex_record_fixture
+):
+    timdex_record = request.getfixturevalue(timdex_record_fixture)
+    assert timdex_record.to_json_bytes() == json.dumps(timdex_record.asdict()).encode()
+
+
+def test_timdex_record_to_json_bytes_escapes_and_omits_none_values(
+    timdex_record_required_fields,
+):
+    timdex_record_required_fields.title = 'Les Misérables "中文"\n'
+    timdex_record_required_fields.dates = [
+        timdex.Date(kind="Coverage", range=timdex.DateRange(gte="1900", lte="2000"))
+    ]
+    timdex_record_required_fields.timdex_provenance = timdex.TimdexProvenance(
+        source="cool-repo", run_date="2024-01-01", run_id="abc", run_record_offset=0
+    )
+    assert (
+        timdex_record_required_fields.to_json_bytes()
+        == json.dumps(timdex_record_required_fields.asdict()).encode()
+    )
+    assert b'"range": {"gte": "1900", "lte": "2000"}' in (
+        timdex_record_required_fields.to_json_bytes()
+    )
+
+
+def test_validate_timdex_record_passes_valid_record(
+    timdex_record_all_fields_and_subfields,
+):
+    assert timdex.validate_timdex_record(timdex_record_all_fields_and_subfields) is None
+
+
+@pytest.mark.parametrize(
+    ("field_name", "create_value", "error", "message"),
+    [
+        ("title", lambda: None, TypeError, "'title' must be <class 'str'>"),
+        ("dates", list, ValueError, "'dates' cannot be an empty list"),
+        ("dates", lambda: "test", TypeError, "'dates' must be <class 'list'>"),
+        (
+            "dates",
+            lambda: ["test"],
+            TypeError,
+            r"'dates' must be <class 'transmogrifier.models.Date'>",
+        ),
+        (
+            "dates",
+            lambda: [timdex.Date(value=2019)],
+            TypeError,
+            "'value' must be <class 'str'>",
+        ),
+        (
+            "dates",
+            lambda: [
+                timdex.Date(
+                    range=timdex.DateRange(
+                        gt="2019-01-01", gte="2019-01-01", lt="2019-06-30"
+                    )
+                )
+            ],
+            ValueError,
+            "range may have a 'gt' or 'gte' value, but not both;",
+        ),
+    ],
+)
+def test_validate_timdex_record_raises_same_error_as_attrs_validators(
+    timdex_record_required_fields, field_name, create_value, error, message
+):
+    with pytest.raises(error, match=message):
+        setattr(timdex_record_required_fields, field_name, create_value())
+
+    with attrs.validators.disabled():
+        setattr(timdex_record_required_fields, field_name, create_value())
+    with pytest.raises(error, match=message):
+        timdex.validate_timdex_record(timdex_record_required_fields)
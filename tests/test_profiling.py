@@ -0,0 +1,62 @@
+# ruff: noqa: PLR2004
+import json
+
+import pytest
+
+from transmogrifier.profiling import FieldProfiler
+
+
+def test_field_profiler_measure_records_calls_and_time():
+    profiler = FieldProfiler()
+    with profiler.measure("get_dates"):
+        pass
+    with pytest.raises(ValueError, match="failed"), profiler.measure("get_dates"):
+        raise ValueError("failed")
+    assert profiler.calls["get_dates"] == 2
+    assert profiler.seconds["get_dates"] > 0
+
+
+def test_field_profiler_merge_adds_timings():
+    profiler = FieldProfiler()
+    profiler.calls.update({"get_dates": 1})
+    profiler.seconds["get_dates"] = 1.0
+    other = FieldProfiler()
+    other.calls.update({"get_dates": 2, "get_notes": 1})
+    other.seconds.update({"get_dates": 2.0, "get_notes": 0.5})
+    profiler.merge(other)
+    assert profiler.calls == {"get_dates": 3, "get_notes": 1}
+    assert profiler.seconds == {"get_dates": 3.0, "get_notes": 0.5}
+
+
+def test_field_profiler_report_sorted_by_total_time():
+    profiler = FieldProfiler()
+    profiler.calls.update({"get_dates": 4, "get_notes": 1})
+    profiler.seconds.update({"get_dates": 0.002, "get_notes": 0.01})
+    assert profiler.report() == [
+        {
+            "method": "get_notes",
+            "calls": 1,
+            "total_seconds": 0.01,
+            "mean_microseconds": 10000.0,
+        },
+        {
+            "method": "get_dates",
+            "calls": 4,
+            "total_seconds": 0.002,
+            "mean_microseconds": 500.0,
+        },
+    ]
+    table = profiler.format_table().splitlines()
+    assert table[0].split() == ["method", "calls", "total", "(s)", "mean", "(us)"]
+    assert table[1].split() == ["get_notes", "1", "0.010000", "10000.000"]
+
+
+def test_field_profiler_write_report(tmp_path):
+    profiler = FieldProfiler()
+    with profiler.measure("get_dates"):
+        pass
+    report_path = tmp_path / "profile.json"
+    profiler.write_report(str(report_path), source="jpal")
+    report = json.loads(report_path.read_text())
+    assert report["source"] == "jpal"
+    assert [timing["method"] for timing in report["methods"]] == ["get_dates"]
@@ -0,0 +1,95 @@
+# ruff: noqa: PLR2004
+import json
+
+from benchmarks.transform_bench import (
+    SOURCE_FIXTURES,
+    benchmark_source,
+    generate_source_file,
+    main,
+)
+from transmogrifier.config import SOURCES
+from transmogrifier.sources.json.aardvark import MITAardvark
+from transmogrifier.sources.xml.marc import Marc
+
+
+def test_source_fixtures_cover_all_sources():
+    # cool-repo is a test source added to SOURCES by the test config
+    assert set(SOURCE_FIXTURES) == set(SOURCES) - {"cool-repo"}
+
+
+def test_generate_source_file_xml_records_have_unique_identifiers(tmp_path):
+    source_file = generate_source_file(
+        "alma", "tests/fixtures/marc/marc_record_all_fields.xml", 5, str(tmp_path)
+    )
+    assert source_file.endswith("alma-2024-01-01-full-extracted-records-to-index.xml")
+    source_records = list(Marc.parse_source_file(source_file))
+    assert [Marc.get_source_record_id(record) for record in source_records] == [
+        f"990027185640106761-{number}" for number in range(5)
+    ]
+
+
+def test_generate_source_file_json_records_have_unique_identifiers(tmp_path):
+    source_file = generate_source_file(
+        "gismit", "tests/fixtures/aardvark_records.jsonl", 8, str(tmp_path)
+    )
+    source_records = list(MITAardvark.parse_source_file(source_file))
+    assert len(source_records) == 8
+    assert len({record["id"] for record in source_records}) == 8
+
+
+def test_benchmark_source_reports_throughput_and_stages():
+    result = benchmark_source("gismit", "tests/fixtures/aardvark_records.jsonl", 12)
+    assert result["source"] == "gismit"
+    assert result["transformer"] == "MITAardvark"
+    assert result["records"] == 12
+    assert result["records_per_second"] > 0
+    assert result["peak_rss_bytes"] > 0
+    assert set(result["stage_seconds"]) == {
+        "generate",
+        "serialize",
+        "write",
+        "transform",
+        "read_and_other",
+    }
+    assert {timing["method"] for timing in result["methods"]} >= {
+        "get_valid_title",
+        "write_dataset_batch",
+    }
+
+
+def test_benchmark_source_reports_skipped_source(monkeypatch):
+    def load(*_args, **_kwargs):
+        raise RuntimeError("Required env var 'LIBGUIDES_CLIENT_ID' is not set")
+
+    monkeypatch.setattr("benchmarks.transform_bench.Transformer.load", load)
+    result = benchmark_source("gismit", "tests/fixtures/aardvark_records.jsonl", 1)
+    assert result == {
+        "source": "gismit",
+        "skipped": "RuntimeError: Required env var 'LIBGUIDES_CLIENT_ID' is not set",
+    }
+
+
+def test_transform_bench_writes_json_report(caplog, runner, tmp_path):
+    report_path = tmp_path / "report.json"
+    result = runner.invoke(
+        main,
+        [
+            "-n",
+            "5",
+            "-s",
+            "gismit",
+            "-s",
+            "jpal",
+            "--fixtures-dir",
+            "tests/fixtures",
+            "-o",
+            str(report_path),
+        ],
+    )
+    assert result.exit_code == 0
+    report = json.loads(report_path.read_text())
+    assert report["records_per_source"] == 5
+    assert report["validation_mode"] == "record"
+    assert [result["source"] for result in report["sources"]] == ["gismit", "jpal"]
+    assert all(result["records"] == 5 for result in report["sources"])
+    assert "Source jpal: " in caplog.text
@@ -0,0 +1,337 @@
+"""Persistent cache of transformed records, keyed by source record and transformer."""
+
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import sqlite3
+from hashlib import blake2b
+from importlib import metadata
+from importlib.util import find_spec
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any
+
+import transmogrifier.models as timdex
+from transmogrifier.config import (
+    SOURCES,
+    TRANSFORMED_RECORD_CACHE_MAX_BYTES,
+    ExternalConfig,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = "transformed-records.sqlite3"
+# number of records added to the cache between commits
+TRANSFORMED_RECORD_CACHE_COMMIT_ROWS = 1000
+
+# modules used by every transformer, in addition to the modules of its classes
+TRANSFORMER_VERSION_MODULES = (
+    "transmogrifier.config",
+    "transmogrifier.helpers",
+    "transmogrifier.models",
+)
+# modules parsing the records of XML transformers
+XML_TRANSFORMER_VERSION_MODULES = (
+    "transmogrifier.sources.lxmlrecord",
+    "transmogrifier.sources.xmlparsing",
+)
+# installed packages parsing source records
+TRANSFORMER_VERSION_PACKAGES = ("beautifulsoup4", "lxml")
+
+# timdex_provenance is the last field of a TimdexRecord, and is serialized last
+TIMDEX_PROVENANCE_JSON_SEPARATOR = b', "timdex_provenance": '
+
+
+def get_transformer_version(
+    transformer_class: type,
+    source: str,
+    exclusion_list: Iterable[str] | None = None,
+    record_type: str | None = None,
+) -> str:
+    """Return a hash of everything determining the records a transformer produces.
+
+    The hash covers the source code of each transmogrifier class the transformer
+    inherits from and of the modules all transformers use, the transformer's external
+    config files, the source's config, the installed versions of the packages parsing
+    source records, and the exclusion list of the run, as excluded records are skipped
+    rather than transformed.  For XML transformers, it also covers the XML parsing
+    modules and the record type records are parsed as.
+
+    Args:
+        transformer_class: Transformer class of the source.
+        source: Source the transformer transforms records of.
+        exclusion_list: Identifiers of records excluded from the run, if any.
+        record_type: XML record type records are parsed as, or None for transformers
+            that do not parse XML.
+    """
+    version = blake2b(digest_size=16)
+    source_files: dict[str, None] = {}
+    config_files: dict[str, None] = {}
+    for cls in transformer_class.__mro__:
+        if cls.__module__.startswith("transmogrifier."):
+            source_files[inspect.getfile(cls)] = None
+            config_files.update(
+                (attribute.file_path, None)
+                for attribute in vars(cls).values()
+                if isinstance(attribute, ExternalConfig)
+            )
+    modules = list(TRANSFORMER_VERSION_MODULES)
+    if record_type is not None:
+        modules.extend(XML_TRANSFORMER_VERSION_MODULES)
+    for module in modules:
+        # found without importing, so XML modules are not imported for JSON sources
+        source_files[find_spec(module).origin] = None  # type: ignore[union-attr, index]
+    for file_path in [*source_files, *config_files]:
+        version.update(file_path.encode())
+        version.update(Path(file_path).read_bytes())
+    version.update(json.dumps(SOURCES[source], sort_keys=True).encode())
+    for package in TRANSFORMER_VERSION_PACKAGES:
+        version.update(f"{package}=={metadata.version(package)}\n".encode())
+    if record_type is not None:
+        version.update(f"record_type={record_type}\n".encode())
+    for entry in exclusion_list or ():
+        version.update(entry.encode())
+        version.update(b"\n")
+    return version.hexdigest()
+
+
+def cache_key_for_source_record(raw_source_record: bytes) -> bytes:
+    """Return the hash of the raw bytes of a source record used as its cache key.
+
+    Args:
+        raw_source_record: Raw bytes of a source record.
+    """
+    return blake2b(raw_source_record, digest_size=16).digest()
+
+
+def remove_timdex_provenance(transformed_record: bytes) -> bytes:
+    """Return serialized TimdexRecord JSON without its timdex_provenance field.
+
+    Provenance includes the run id and run record offset, so differs for each run.
+
+    Args:
+        transformed_record: JSON bytes of a TimdexRecord, see to_json_bytes().
+    """
+    provenance_start = transformed_record.rfind(TIMDEX_PROVENANCE_JSON_SEPARATOR)
+    if provenance_start == -1:
+        return transformed_record
+    return transformed_record[:provenance_start] + b"}"
+
+
+def add_timdex_provenance(
+    transformed_record: bytes, timdex_provenance: timdex.TimdexProvenance
+) -> bytes:
+    """Return serialized TimdexRecord JSON with a timdex_provenance field added.
+
+    The result is the same as serializing the TimdexRecord with its provenance set.
+
+    Args:
+        transformed_record: JSON bytes of a TimdexRecord without provenance.
+        timdex_provenance: Provenance of the record in the current run.
+    """
+    return (
+        transformed_record[:-1]
+        + TIMDEX_PROVENANCE_JSON_SEPARATOR
+        + timdex.TIMDEX_JSON_ENCODER.encode(
+            timdex.TIMDEX_OBJECT_ENCODERS[timdex.TimdexProvenance](timdex_provenance)
+        ).encode()
+        + b"}"
+    )
+
+
+class TransformedRecordCache:
+    """SQLite cache of the results of transforming source records.
+
+    Entries are keyed by source, transformer version (see get_transformer_version()),
+    and a hash of the raw bytes of the source record, and hold the TIMDEX record id,
+    action, and serialized transformed record without provenance.  Only records
+    transformed to the 'index' or 'delete' actions are cached.
+
+    Each process opens its own connection to the cache file when first used, so a
+    cache passed to worker processes is shared by them.  Added entries are committed
+    every TRANSFORMED_RECORD_CACHE_COMMIT_ROWS records and by commit().  When the cache
+    is closed, the least recently used entries are evicted until the transformed
+    records it holds total no more than max_bytes.
+    """
+
+    def __init__(
+        self,
+        cache_directory: str,
+        max_bytes: int = TRANSFORMED_RECORD_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize a cache in a local directory, created if it does not exist.
+
+        Args:
+            cache_directory: Local directory of the cache file.
+            max_bytes: Maximum bytes of transformed records kept in the cache.
+        """
+        self.cache_path = Path(cache_directory) / CACHE_FILE_NAME
+        self.max_bytes = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self._connection: sqlite3.Connection | None = None
+        self._uncommitted_count: int = 0
+        self._used_keys: list[tuple[float, str, str, bytes]] = []
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling, without this process's connection or counts."""
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_uncommitted_count"] = 0
+        state["_used_keys"] = []
+        state["hits"] = 0
+        state["misses"] = 0
+        return state
+
+    def __repr__(self) -> str:
+        """Return the class name and path of the cache file."""
+        return f"<{self.__class__.__name__} path={self.cache_path}>"
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups found in the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.cache_path, timeout=60, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS transformed_records (
+                    id INTEGER PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    transformer_version TEXT NOT NULL,
+                    source_record_hash BLOB NOT NULL,
+                    timdex_record_id TEXT,
+                    action TEXT NOT NULL,
+                    transformed_record BLOB,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL,
+                    UNIQUE (source, transformer_version, source_record_hash)
+                )
+                """
+            )
+            self._connection.commit()
+        return self._connection
+
+    def get(
+        self, source: str, transformer_version: str, raw_source_record: bytes
+    ) -> tuple[str | None, str, bytes | None] | None:
+        """Return the cached TIMDEX record id, action, and transformed record, if any.
+
+        Args:
+            source: Source of the record.
+            transformer_version: Version of the transformer of the source.
+            raw_source_record: Raw bytes of the source record.
+        """
+        source_record_hash = cache_key_for_source_record(raw_source_record)
+        row = self.connection.execute(
+            "SELECT timdex_record_id, action, transformed_record "
+            "FROM transformed_records "
+            "WHERE source = ? AND transformer_version = ? AND source_record_hash = ?",
+            (source, transformer_version, source_record_hash),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used_keys.append((time(), source, transformer_version, source_record_hash))
+        return row
+
+    def put(
+        self,
+        source: str,
+        transformer_version: str,
+        raw_source_record: bytes,
+        timdex_record_id: str | None,
+        action: str,
+        transformed_record: bytes | None,
+    ) -> None:
+        """Add the result of transforming a source record to the cache.
+
+        Args:
+            source: Source of the record.
+            transformer_version: Version of the transformer of the source.
+            raw_source_record: Raw bytes of the source record.
+            timdex_record_id: TIMDEX record id of the transformed record.
+            action: Action of the transformed record, 'index' or 'delete'.
+            transformed_record: Serialized transformed record without provenance.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO transformed_records (source, transformer_version, "
+            "source_record_hash, timdex_record_id, action, transformed_record, size, "
+            "last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                source,
+                transformer_version,
+                cache_key_for_source_record(raw_source_record),
+                timdex_record_id,
+                action,
+                transformed_record,
+                len(transformed_record or b""),
+                time(),
+            ),
+        )
+        self._uncommitted_count += 1
+        if self._uncommitted_count >= TRANSFORMED_RECORD_CACHE_COMMIT_ROWS:
+            self.commit()
+
+    def commit(self) -> None:
+        """Commit added entries, and the last used time of entries found."""
+        if self._connection is None:
+            return
+        if self._used_keys:
+            self._connection.executemany(
+                "UPDATE transformed_records SET last_used = ? "
+                "WHERE source = ? AND transformer_version = ? AND source_record_hash = ?",
+                self._used_keys,
+            )
+            self._used_keys = []
+        self._connection.commit()
+        self._uncommitted_count = 0
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache is within max_bytes.
+
+        Returns the number of entries deleted.
+        """
+        deleted_count = self.connection.execute(
+            """
+            DELETE FROM transformed_records WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, SUM(size) OVER (
+                        ORDER BY last_used DESC, id DESC
+                    ) AS cumulative_size
+                    FROM transformed_records
+                )
+                WHERE cumulative_size > ?
+            )
+            """,
+            (self.max_bytes,),
+        ).rowcount
+        self.connection.commit()
+        if deleted_count:
+            logger.info("Evicted %d records from transformed record cache", deleted_count)
+        return deleted_count
+
+    def close(self) -> None:
+        """Commit, evict entries over max_bytes, and close this process's connection.
+
+        Entries are evicted even if this process did not use the cache, e.g. when
+        records were transformed by worker processes.
+        """
+        self.commit()
+        self.evict()
+        self.connection.close()
+        self._connection = None
@@ -0,0 +1,235 @@
+"""Checkpoints recording the progress of a run, so it can be resumed."""
+
+from __future__ import annotations
+
+import json
+import logging
+from bisect import bisect_right
+from itertools import islice
+from operator import itemgetter
+
+import smart_open  # type: ignore[import-untyped]
+from attrs import asdict, define, field
+
+from transmogrifier.exceptions import CriticalError
+
+logger = logging.getLogger(__name__)
+
+
+@define
+class Checkpoint:
+    """Position of the next record to transform in a run of one or more source files.
+
+    A checkpoint is written once the TIMDEX dataset writer has consumed each batch of
+    records, so every record before the position has been passed to the writer.  A
+    resumed run skips those records, and continues writing under the same run id and
+    run timestamp.
+
+    Attributes:
+        source: Source of the run.
+        source_files: Source files of the run, in the order they are transformed.
+        run_id: Run id of the run.
+        run_timestamp: Run timestamp of the run.
+        source_file_index: Index in source_files of the file with the next record.
+        source_file_run_record_offset: Run record offset of the first record of the
+            file with the next record.
+        run_record_offset: Run record offset of the next record.
+        written_record_count: Number of records written by the run, including any
+            earlier runs it resumed.
+        deleted_records_path: Deleted records file of the run, if any.
+        deleted_record_count: Number of deleted records written by the run, including
+            any earlier runs it resumed.  Their ids are the first lines of the deleted
+            records file, which is written as records are transformed.
+    """
+
+    source: str
+    source_files: list[str]
+    run_id: str
+    run_timestamp: str
+    source_file_index: int = 0
+    source_file_run_record_offset: int = 0
+    run_record_offset: int = 0
+    written_record_count: int = 0
+    deleted_records_path: str | None = None
+    deleted_record_count: int = 0
+
+    @classmethod
+    def load(cls, checkpoint_path: str) -> Checkpoint | None:
+        """Load a checkpoint from path (S3 or local filesystem).
+
+        Returns None if there is no checkpoint file, e.g. if the run being resumed
+        stopped before its first batch was written.
+
+        Args:
+            checkpoint_path: Path of the JSON checkpoint file.
+
+        Raises:
+            On error reading or parsing the file, raises CriticalError which will
+            terminate the run.
+        """
+        try:
+            with smart_open.open(checkpoint_path, "r") as checkpoint_file:
+                checkpoint = cls(**json.load(checkpoint_file))
+        except Exception as exc:
+            if not _is_missing_file_error(exc):
+                raise CriticalError(f"Could not load checkpoint: {exc}") from exc
+            logger.warning("No checkpoint found at %s", checkpoint_path)
+            return None
+        logger.info(
+            "Loaded checkpoint from %s: source file %d of %d at run record offset %d",
+            checkpoint_path,
+            checkpoint.source_file_index + 1,
+            len(checkpoint.source_files),
+            checkpoint.run_record_offset,
+        )
+        return checkpoint
+
+    def validate(
+        self,
+        source: str,
+        source_files: list[str],
+        run_id: str | None = None,
+        run_timestamp: str | None = None,
+    ) -> None:
+        """Check that a run resuming from the checkpoint is the same run.
+
+        Args:
+            source: Source of the resuming run.
+            source_files: Source files of the resuming run.
+            run_id: Run id passed to the resuming run, if any.
+            run_timestamp: Run timestamp passed to the resuming run, if any.
+
+        Raises:
+            CriticalError if the source, source files, run id, or run timestamp differ
+            from those of the checkpoint.
+        """
+        for name, value, checkpoint_value in (
+            ("source", source, self.source),
+            ("source files", source_files, self.source_files),
+            ("run id", run_id, self.run_id),
+            ("run timestamp", run_timestamp, self.run_timestamp),
+        ):
+            if value is not None and value != checkpoint_value:
+                message = (
+                    f"Cannot resume from checkpoint, {name} {value!r} does not match "
+                    f"checkpoint {name} {checkpoint_value!r}"
+                )
+                raise CriticalError(message)
+
+    def load_deleted_record_ids(self) -> list[str]:
+        """Load the ids of the deleted records written before the checkpoint.
+
+        The deleted records file may have ids of records transformed after the
+        checkpoint, which were not written to the dataset, so only the first
+        deleted_record_count ids are returned.
+
+        Raises:
+            On error reading the deleted records file, or if it has fewer ids than
+            deleted_record_count, raises CriticalError which will terminate the run.
+        """
+        if not self.deleted_records_path or not self.deleted_record_count:
+            return []
+        try:
+            with smart_open.open(self.deleted_records_path, "r") as deleted_records:
+                deleted_record_ids = [
+                    line.rstrip("\n")
+                    for line in islice(deleted_records, self.deleted_record_count)
+                ]
+        except Exception as exc:
+            raise CriticalError(f"Could not load deleted record ids: {exc}") from exc
+        if len(deleted_record_ids) < self.deleted_record_count:
+            message = (
+                f"Cannot resume from checkpoint, deleted records file "
+                f"{self.deleted_records_path!r} has {len(deleted_record_ids)} id(s), "
+                f"expected {self.deleted_record_count}"
+            )
+            raise CriticalError(message)
+        return deleted_record_ids
+
+    def write(self, checkpoint_path: str) -> None:
+        """Write the checkpoint as JSON to path (S3 or local filesystem).
+
+        Args:
+            checkpoint_path: Path of the JSON checkpoint file.
+        """
+        with smart_open.open(checkpoint_path, "w") as checkpoint_file:
+            json.dump(asdict(self), checkpoint_file)
+        logger.debug("Wrote checkpoint to %s: %s", checkpoint_path, self)
+
+
+def _is_missing_file_error(exc: Exception) -> bool:
+    """Return True if exc was raised opening a local or S3 file that does not exist.
+
+    smart_open raises an OSError for S3 errors, with the botocore error as its
+    backend_error attribute.
+    """
+    if isinstance(exc, FileNotFoundError):
+        return True
+    backend_error = getattr(exc, "backend_error", None)
+    error_code = getattr(backend_error, "response", {}).get("Error", {}).get("Code")
+    return error_code in {"NoSuchKey", "404"}
+
+
+@define
+class SourceFilePositions:
+    """Run record offsets of the source files read by a run, by position in the run.
+
+    Each source file started by the run is added with the number of records read
+    before it, the run record offset of the file's first record, and the run record
+    offset of the first record read from it.  The position of the next
+    record to transform, for a checkpoint, is then found from the number of records
+    written.  Files are added by the thread reading source records, and positions
+    found by the thread writing batches, so each file is a single tuple appended to a
+    single list.
+    """
+
+    source_files: list[tuple[int, int, int, int]] = field(factory=list)
+
+    def add(
+        self,
+        records_read: int,
+        source_file_index: int,
+        source_file_run_record_offset: int,
+        first_run_record_offset: int,
+    ) -> None:
+        """Add a source file started after records_read records of the run were read.
+
+        Args:
+            records_read: Number of records of the run read before the file.
+            source_file_index: Index of the file in the run's source files.
+            source_file_run_record_offset: Run record offset of the file's first
+                record.
+            first_run_record_offset: Run record offset of the first record read from
+                the file.
+        """
+        self.source_files.append(
+            (
+                records_read,
+                source_file_index,
+                source_file_run_record_offset,
+                first_run_record_offset,
+            )
+        )
+
+    def position(self, records_written: int) -> tuple[int, int, int]:
+        """Return the position of the next record.
+
+        The position is the index of the record's source file, the run record offset
+        of the file's first record, and the run record offset of the record.
+
+        Args:
+            records_written: Number of records of the run written.
+        """
+        (
+            records_read,
+            source_file_index,
+            source_file_run_record_offset,
+            first_run_record_offset,
+        ) = self.source_files[
+            bisect_right(self.source_files, records_written, key=itemgetter(0)) - 1
+        ]
+        return (
+            source_file_index,
+            source_file_run_record_offset,
+            first_run_record_offset + records_written - records_read,
+        )
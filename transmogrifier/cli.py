@@ -4,8 +4,17 @@ from time import perf_counter
 
 import click
 
-from transmogrifier.config import SOURCES, configure_logger, configure_sentry
-from transmogrifier.sources.transformer import Transformer
+from transmogrifier.config import (
+    EXECUTOR_TYPES,
+    PARQUET_DATASET_BATCH_BYTES,
+    PARQUET_DATASET_BATCH_ROWS,
+    RECORD_TYPES,
+    SOURCES,
+    TRANSFORMED_RECORD_CACHE_MAX_BYTES,
+    VALIDATION_MODES,
+    configure_logger,
+    configure_sentry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +23,17 @@ logger = logging.getLogger(__name__)
 @click.option(
     "-i",
     "--input-file",
+    "input_files",
     required=True,
+    multiple=True,
     help="Filepath of input records to transform.  The filename must be in the format "
     "<source>-<YYYY-MM-DD>-<run-type>-extracted-records-to-<action><index[optional]>"
     ".<extension>.  Examples: 'gisogm-2024-03-28-daily-extracted-records-to-index.jsonl' "
-    "or 'alma-2023-01-13-full-extracted-records-to-index_17.xml'.",
+    "or 'alma-2023-01-13-full-extracted-records-to-index_17.xml'.  May be passed more "
+    "than once, and may be a glob pattern, a local directory, or an S3 prefix ending "
+    "with '/'.  All files are transformed by one run, in numeric order of their "
+    "index, sharing the run id and run timestamp, with run record offsets continuing "
+    "from one file to the next.",
 )
 @click.option(
     "-o",
@@ -55,46 +70,268 @@ logger = logging.getLogger(__name__)
     "possible for the TIMDEX StepFunction to invoke Transmogrifier multiple times, this "
     "allows a single run_timestamp to be associated with all outputs for single run_id.",
 )
+@click.option(
+    "--parse-engine",
+    type=click.Choice(EXECUTOR_TYPES),
+    default="thread",
+    show_default=True,
+    help="Type of worker pool used to parse XML source records with BeautifulSoup.  "
+    "Ignored for JSON sources.  Use --workers to parse records in several processes.",
+)
+@click.option(
+    "--parse-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of workers in the XML parsing pool.  More than one worker allows "
+    "several records to be parsed at once.",
+)
+@click.option(
+    "--xml-record-type",
+    type=click.Choice(RECORD_TYPES),
+    default="bs4",
+    show_default=True,
+    help="Type of record XML transformers receive.  'lxml' records wrap the elements "
+    "read from the source file instead of parsing them again with BeautifulSoup, and "
+    "do not use the parsing pool.  Records sent to --workers, and changed records of "
+    "--incremental runs, are parsed again from their bytes by lxml.  Ignored for JSON "
+    "sources.",
+)
+@click.option(
+    "--validation-mode",
+    type=click.Choice(VALIDATION_MODES),
+    default="record",
+    show_default=True,
+    help="How transformed records are validated.  'full' validates each TIMDEX "
+    "object as it is created and each field as it is set.  'record' validates each "
+    "complete record once, raising the same errors.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to transform records.  More than one worker "
+    "parses and transforms records in a pool of worker processes.",
+)
+@click.option(
+    "--batch-rows",
+    type=click.IntRange(min=1),
+    default=PARQUET_DATASET_BATCH_ROWS,
+    show_default=True,
+    help="Maximum number of records written to the TIMDEX dataset in a batch.",
+)
+@click.option(
+    "--batch-bytes",
+    type=click.IntRange(min=1),
+    default=PARQUET_DATASET_BATCH_BYTES,
+    show_default=True,
+    help="Maximum bytes of source and transformed records written to the TIMDEX "
+    "dataset in a batch.  A batch is written when it reaches either limit.",
+)
+@click.option(
+    "--pipeline",
+    is_flag=True,
+    help="Pass to read, transform, and write records in separate threads connected "
+    "by bounded queues, overlapping reading from S3, transforming, and writing the "
+    "TIMDEX dataset.",
+)
+@click.option(
+    "--deleted-records-file",
+    required=False,
+    help="S3 or local path to write the TIMDEX record ids of deleted records to, one "
+    "per line.  Compressed if the path ends with a compression extension, e.g. '.gz'.",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Pass to skip source records whose raw bytes are identical to the current "
+    "indexed version of a record in the TIMDEX dataset at --output-location.  "
+    "Unchanged records are not parsed, transformed, or written to the dataset.  "
+    "Only allowed for daily runs.",
+)
+@click.option(
+    "--cache-dir",
+    required=False,
+    help="Local directory of a persistent cache of transformed records, keyed by "
+    "source, a hash of the transformer's code and configuration, and a hash of each "
+    "source record.  Records found in the cache are not transformed again.  Not used "
+    "for sources whose records depend on the run or API data, e.g. libguides.",
+)
+@click.option(
+    "--cache-max-bytes",
+    type=click.IntRange(min=0),
+    default=TRANSFORMED_RECORD_CACHE_MAX_BYTES,
+    show_default=True,
+    help="Maximum bytes of transformed records kept in the cache at --cache-dir.  The "
+    "least recently used records are evicted at the end of the run.",
+)
+@click.option(
+    "--checkpoint-file",
+    required=False,
+    help="S3 or local path to write a JSON checkpoint to after each batch is passed "
+    "to the TIMDEX dataset writer, recording the source file and run record offset of "
+    "the next record to transform.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Pass to resume the run recorded by the checkpoint at --checkpoint-file, if "
+    "it exists.  Records already written are skipped without being transformed, but "
+    "source files are still read from the start of the file with the next record.  "
+    "Records are written with the run id and run timestamp of the checkpoint, and "
+    "deleted record ids already written are kept in --deleted-records-file.  Input "
+    "files must be the same as the checkpointed run.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Pass to record time spent in each transformer field method and log a "
+    "table of timings at the end of the run.",
+)
+@click.option(
+    "--profile-report",
+    required=False,
+    help="S3 or local path to write a JSON report of field method timings to.  "
+    "Enables profiling.",
+)
 @click.option(
     "-v", "--verbose", is_flag=True, help="Pass to log at debug level instead of info"
 )
 def main(
     source: str,
-    input_file: str,
+    input_files: tuple[str, ...],
     output_location: str,
     exclusion_list_path: str,
     run_id: str,
     run_timestamp: str,
+    parse_engine: str,
+    parse_workers: int,
+    xml_record_type: str,
+    validation_mode: str,
+    workers: int,
+    batch_rows: int,
+    batch_bytes: int,
+    pipeline: bool,  # noqa: FBT001
+    deleted_records_file: str | None,
+    incremental: bool,  # noqa: FBT001
+    cache_dir: str | None,
+    cache_max_bytes: int,
+    checkpoint_file: str | None,
+    resume: bool,  # noqa: FBT001
+    profile: bool,  # noqa: FBT001
+    profile_report: str | None,
     verbose: bool,  # noqa: FBT001
 ) -> None:
+    # source transformers and their dependencies, e.g. the TIMDEX dataset API, bs4, and
+    # smart_open, are imported after arguments are parsed, so --help and invalid
+    # arguments do not wait for them
+    from transmogrifier.cache import TransformedRecordCache  # noqa: PLC0415
+    from transmogrifier.helpers import (  # noqa: PLC0415
+        expand_source_files,
+        parse_date_from_string,
+    )
+    from transmogrifier.incremental import SourceRecordHashes  # noqa: PLC0415
+    from transmogrifier.profiling import FieldProfiler  # noqa: PLC0415
+    from transmogrifier.sources.transformer import Transformer  # noqa: PLC0415
+
+    if resume and not checkpoint_file:
+        raise click.UsageError("--resume requires --checkpoint-file")
+
     start_time = perf_counter()
     root_logger = logging.getLogger()
     logger.info(configure_logger(root_logger, verbose=verbose))
     logger.info(configure_sentry())
+    # the XML parsing engine, and bs4 and lxml, are only needed for XML sources, whose
+    # transformers are in the transmogrifier.sources.xml package
+    if SOURCES[source]["transform-class"].startswith("transmogrifier.sources.xml."):
+        from transmogrifier.sources.xmlparsing import (  # noqa: PLC0415
+            configure_parsing_engine,
+        )
+
+        logger.info(
+            configure_parsing_engine(
+                parse_engine,  # type: ignore[arg-type]
+                parse_workers,
+                xml_record_type,  # type: ignore[arg-type]
+            )
+        )
     logger.info("Running transform for source %s", source)
+    profiler = FieldProfiler() if profile or profile_report else None
 
+    source_files = expand_source_files(input_files)
+    # a full run replaces the index, so records skipped as unchanged would be removed
+    if incremental and any(
+        Transformer.get_run_data(source_file)["run_type"] != "daily"
+        for source_file in source_files
+    ):
+        raise click.UsageError("--incremental requires daily run input files")
+    if len(source_files) > 1:
+        logger.info("Transforming %d source files", len(source_files))
     transformer = Transformer.load(
         source,
-        input_file,
+        source_files,
         exclusion_list_path=exclusion_list_path,
         run_id=run_id,
         run_timestamp=run_timestamp,
+        workers=workers,
+        deleted_records_path=deleted_records_file,
+        profiler=profiler,
+        checkpoint_path=checkpoint_file,
+        source_record_hashes=(
+            SourceRecordHashes.load(output_location, source) if incremental else None
+        ),
+        transformed_record_cache=(
+            TransformedRecordCache(cache_dir, cache_max_bytes) if cache_dir else None
+        ),
+        validation_mode=validation_mode,  # type: ignore[arg-type]
+        resume=resume,
+    )
+    transformer.write_to_parquet_dataset(
+        output_location,
+        batch_rows=batch_rows,
+        batch_bytes=batch_bytes,
+        pipeline=pipeline,
     )
-    transformer.write_to_parquet_dataset(output_location)
 
+    date_cache_info = parse_date_from_string.cache_info()
     logger.info(
         (
             "Completed transform, total records processed: %d, "
             "transformed records: %d, "
             "skipped records: %d, "
-            "deleted records: %d"
+            "deleted records: %d, "
+            "unchanged records: %d, "
+            "date cache hits: %d, "
+            "date cache misses: %d"
         ),
         transformer.processed_record_count,
         transformer.transformed_record_count,
         transformer.skipped_record_count,
-        len(transformer.deleted_records),
+        transformer.deleted_record_count,
+        transformer.unchanged_record_count,
+        date_cache_info.hits + transformer.worker_date_cache_hits,
+        date_cache_info.misses + transformer.worker_date_cache_misses,
     )
 
+    if cache := transformer.transformed_record_cache:
+        logger.info(
+            "Transformed record cache hits: %d, misses: %d, hit rate: %.1f%%",
+            cache.hits,
+            cache.misses,
+            cache.hit_rate * 100,
+        )
+
+    if profiler is not None:
+        logger.info("Transform profile:\n%s", profiler.format_table())
+        if profile_report:
+            profiler.write_report(
+                profile_report,
+                source=source,
+                input_files=source_files,
+                run_id=transformer.run_data["run_id"],
+            )
+
     elapsed_time = perf_counter() - start_time
     logger.info(
         "Total time to complete transform: %s", str(timedelta(seconds=elapsed_time))
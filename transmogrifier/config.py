@@ -1,12 +1,23 @@
-"""transmogrifier.config module."""
+"""transmogrifier.config module.
 
+Imported by the CLI before its arguments are parsed, so dependencies that are slow to
+import, e.g. sentry_sdk, bs4, and lxml, are imported by the functions that use them.
+"""
+
+from __future__ import annotations
+
+import hashlib
 import json
 import logging
 import os
-from typing import Literal
+import tempfile
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal
 
-import sentry_sdk
-from bs4 import BeautifulSoup  # type: ignore[import-untyped]
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from bs4 import BeautifulSoup  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +156,30 @@ LIBGUIDES_GUIDES_URL = os.getenv(
 LIBGUIDES_API_TOKEN = os.getenv("LIBGUIDES_API_TOKEN")
 LIBGUIDES_CLIENT_ID = os.getenv("LIBGUIDES_CLIENT_ID")
 
+CONFIG_CACHE_DIR = os.getenv(
+    "CONFIG_CACHE_DIR", os.path.join(tempfile.gettempdir(), "transmogrifier")
+)
+
+# a batch of DatasetRecords is written once it reaches either limit
+PARQUET_DATASET_BATCH_ROWS = 10_000
+PARQUET_DATASET_BATCH_BYTES = 128 * 1024 * 1024
+
+# transformed records kept by the transformed record cache, see transmogrifier.cache
+TRANSFORMED_RECORD_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# options of the XML parsing engine, see transmogrifier.sources.xmlparsing; there is no
+# process pool, as unpickling a BeautifulSoup object in the parent parses it again
+type ExecutorType = Literal["thread"]
+type RecordType = Literal["bs4", "lxml"]
+
+EXECUTOR_TYPES: tuple[ExecutorType, ...] = ("thread",)
+RECORD_TYPES: tuple[RecordType, ...] = ("bs4", "lxml")
+
+# how TimdexRecords are validated, see Transformer.transform()
+type ValidationMode = Literal["full", "record"]
+
+VALIDATION_MODES: tuple[ValidationMode, ...] = ("full", "record")
+
 
 def configure_logger(
     root_logger: logging.Logger,
@@ -184,6 +219,8 @@ def configure_logger(
 
 
 def configure_sentry() -> str:
+    import sentry_sdk  # noqa: PLC0415
+
     env = os.getenv("WORKSPACE")
     sentry_dsn = os.getenv("SENTRY_DSN")
     if sentry_dsn and sentry_dsn.lower() != "none":
@@ -202,6 +239,8 @@ def load_external_config(
     Raises an error if an unhandled file_type parameter is passed.
 
     """
+    from bs4 import BeautifulSoup  # noqa: PLC0415
+
     with open(file_path, "rb") as config_file:
         if file_type == "json":
             return json.load(config_file)
@@ -210,3 +249,127 @@ def load_external_config(
         else:
             message = f"Unrecognized file_type parameter: {file_type}"
             raise ValueError(message)
+
+
+def load_json_config(file_path: str) -> dict:
+    """Load a JSON configuration file into a dict.
+
+    Args:
+        file_path: Path to a JSON configuration file.
+    """
+    return load_external_config(file_path, "json")  # type: ignore[return-value]
+
+
+@cache
+def load_shared_config(loader: Callable[[str], Any], file_path: str) -> Any:  # noqa: ANN401
+    """Load a configuration file once per process, sharing it between all callers.
+
+    Args:
+        loader: Function loading the configuration file, e.g. load_json_config.
+        file_path: Path to the configuration file.
+    """
+    logger.debug("Loading external config %s", file_path)
+    return loader(file_path)
+
+
+class ExternalConfig[T]:
+    """Class attribute for a configuration file, loaded when first accessed.
+
+    Configuration files are loaded on first use instead of when the class defining them
+    is created, so importing a transformer module does not read or parse its config
+    files.  Loaded configs are cached by load_shared_config(), and shared by every
+    ExternalConfig with the same loader and file.
+
+    Usage:
+        class Marc(XMLTransformer):
+            country_code_crosswalk = ExternalConfig(
+                "config/loc-countries.xml", load_loc_code_crosswalk
+            )
+    """
+
+    __slots__ = ("_config", "file_path", "loader")
+
+    def __init__(self, file_path: str, loader: Callable[[str], T]) -> None:
+        self.file_path = file_path
+        self.loader = loader
+        self._config: T | None = None
+
+    def __get__(self, instance: object, owner: type | None = None) -> T:
+        """Return the config, loading it on first access."""
+        if self._config is None:
+            self._config = load_shared_config(self.loader, self.file_path)
+        return self._config
+
+    def __repr__(self) -> str:
+        """Return the class name, file path, and whether the config is loaded."""
+        return (
+            f"<{self.__class__.__name__} {self.file_path} "
+            f"loaded={self._config is not None}>"
+        )
+
+
+def load_loc_code_crosswalk(file_path: str) -> dict[str, tuple[str, bool]]:
+    """
+    Load a Library of Congress XML code list into a dict of code to (name, obsolete).
+
+    The compiled crosswalk is cached as JSON in CONFIG_CACHE_DIR, keyed by a hash of the
+    XML file, so the XML is only parsed when the file changes.  If the cache cannot be
+    read or written, the crosswalk is compiled from the XML file.
+
+    Args:
+        file_path: Path to a Library of Congress XML code list, e.g. countries or
+            languages.
+    """
+    with open(file_path, "rb") as config_file:
+        content = config_file.read()
+
+    cache_file_path = os.path.join(
+        CONFIG_CACHE_DIR,
+        f"{os.path.basename(file_path)}."
+        f"{hashlib.blake2b(content, digest_size=16).hexdigest()}.json",
+    )
+    try:
+        with open(cache_file_path) as cache_file:
+            return {
+                code: (name, obsolete)
+                for code, (name, obsolete) in json.load(cache_file).items()
+            }
+    except (OSError, ValueError):
+        pass
+
+    crosswalk = compile_loc_code_crosswalk(content)
+    try:
+        os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+        temporary_file_path = f"{cache_file_path}.{os.getpid()}"
+        with open(temporary_file_path, "w") as cache_file:
+            json.dump(crosswalk, cache_file)
+        os.replace(temporary_file_path, cache_file_path)
+    except OSError as exception:
+        logger.debug("Could not cache crosswalk %s: %s", file_path, exception)
+    return crosswalk
+
+
+def compile_loc_code_crosswalk(content: bytes) -> dict[str, tuple[str, bool]]:
+    """
+    Compile a Library of Congress XML code list into a dict of code to (name, obsolete).
+
+    A code may appear more than once in a code list, e.g. as an obsolete code in a note
+    for another entry.  The first occurrence of a code in the document is used, with
+    the first name found under the code's parent element.
+
+    Args:
+        content: Bytes of a Library of Congress XML code list.
+    """
+    from lxml import etree  # noqa: PLC0415
+
+    crosswalk: dict[str, tuple[str, bool]] = {}
+    for code_element in etree.fromstring(content).iter("{*}code"):
+        code = code_element.text
+        if code is None or code in crosswalk:
+            continue
+        name_element = code_element.getparent().find(".//{*}name")  # type: ignore[union-attr]
+        crosswalk[code] = (
+            str(name_element.text),  # type: ignore[union-attr]
+            code_element.get("status") == "obsolete",
+        )
+    return crosswalk
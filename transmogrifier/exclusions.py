@@ -0,0 +1,77 @@
+"""Exclusion list of source record identifiers to skip during transformation."""
+
+from __future__ import annotations
+
+import logging
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import smart_open  # type: ignore[import-untyped]
+
+from transmogrifier.exceptions import CriticalError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class ExclusionList:
+    """Set of identifiers, e.g. source links, for records excluded from a run.
+
+    Entries are held as the keys of a dict, giving constant time membership checks
+    while preserving the order of the exclusion list file.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, entries: Iterable[str] = ()) -> None:
+        self._entries: dict[str, None] = dict.fromkeys(entries)
+
+    def __contains__(self, entry: object) -> bool:
+        """Return True if the entry is in the exclusion list."""
+        return entry in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over entries in the order they were loaded."""
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """Return the number of unique entries."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return the class name and number of entries."""
+        return f"<{self.__class__.__name__} entries={len(self)}>"
+
+    @classmethod
+    def load(cls, exclusion_list_path: str) -> ExclusionList:
+        """Load an exclusion list CSV file from path (S3 or local filesystem).
+
+        CSV file has no headers and contains identifiers to exclude, one per line.  The
+        file is read line by line as it is streamed, without buffering the whole file.
+
+        Args:
+            exclusion_list_path: Path to exclusion list file (s3://bucket/key or local
+                path).
+
+        Raises:
+            On error loading or parsing the file, raises CriticalError which will
+            terminate the run.
+        """
+        start_time = perf_counter()
+        try:
+            with smart_open.open(exclusion_list_path, "r") as exclusion_list_file:
+                exclusion_list = cls(
+                    entry for row in exclusion_list_file if (entry := row.strip())
+                )
+        except Exception as exc:
+            raise CriticalError(f"Could not load exclusion list: {exc}") from exc
+
+        logger.info(
+            "Loaded exclusion list from %s with %d entries in %.3f seconds",
+            exclusion_list_path,
+            len(exclusion_list),
+            perf_counter() - start_time,
+        )
+        return exclusion_list
@@ -1,11 +1,39 @@
+import fnmatch
+import glob
 import logging
+import os
+import queue
+import re
+import threading
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future
 from datetime import UTC, datetime
+from functools import lru_cache
 
 import transmogrifier.models as timdex
 from transmogrifier.config import DATE_FORMATS
 
 logger = logging.getLogger(__name__)
 
+# maximum number of date strings with cached parse_date_from_string() results
+DATE_CACHE_SIZE = 10_000
+
+# regular expressions matching strptime directives, as compiled by the _strptime module
+STRPTIME_DIRECTIVE_PATTERNS = {
+    "Y": r"\d\d\d\d",
+    "y": r"\d\d",
+    "m": r"1[0-2]|0[1-9]|[1-9]",
+    "d": r"3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]",
+    "H": r"2[0-3]|[0-1]\d|\d",
+    "M": r"[0-5]\d|\d",
+    "S": r"6[0-1]|[0-5]\d|\d",
+    "f": r"[0-9]{1,6}",
+}
+
+# characters that make a source file path a glob pattern
+GLOB_PATTERN_CHARACTERS = re.compile(r"[*?[]")
+
 
 def generate_citation(timdex_record: timdex.TimdexRecord) -> str:
     """Generate a citation in the Datacite schema format.
@@ -55,6 +83,102 @@ def generate_citation(timdex_record: timdex.TimdexRecord) -> str:
     return citation
 
 
+class DateFormatParser:
+    """Parse date strings with the first of a list of strptime formats that succeeds.
+
+    Trying each format with datetime.strptime() raises an exception for every format
+    that does not match.  Instead, the formats are compiled into a single regular
+    expression with one alternative per format, which identifies the first matching
+    format in one pass over the string.
+
+    Each alternative reproduces strptime's matching: directives use the same regular
+    expressions, case is ignored, and the first match of the format must consume the
+    whole string (an atomic group prevents backtracking to find a longer match).  If
+    the matched values are not a valid date, e.g. February 30, the following formats
+    are tried in turn as strptime would.
+    """
+
+    def __init__(self, date_formats: list[str]) -> None:
+        self.date_formats = date_formats
+        self.format_directives: list[tuple[str, ...]] = []
+        format_patterns = []
+        for index, date_format in enumerate(date_formats):
+            pattern, directives = self._compile_format(date_format, index)
+            format_patterns.append(pattern)
+            self.format_directives.append(directives)
+        self.pattern = re.compile("|".join(format_patterns), re.IGNORECASE)
+        self.format_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in format_patterns
+        ]
+
+    @staticmethod
+    def _compile_format(date_format: str, index: int) -> tuple[str, tuple[str, ...]]:
+        """Return a regular expression alternative and the directives of a format."""
+        pattern = ""
+        directives: list[str] = []
+        for literal, directive in re.findall(r"([^%]*)(?:%(.))?", date_format):
+            pattern += re.escape(literal)
+            if directive:
+                if directive not in STRPTIME_DIRECTIVE_PATTERNS:
+                    message = f"Unsupported directive in date format: {date_format}"
+                    raise ValueError(message)
+                directives.append(directive)
+                pattern += (
+                    f"(?P<f{index}_{directive}>{STRPTIME_DIRECTIVE_PATTERNS[directive]})"
+                )
+        return rf"(?P<f{index}>(?>{pattern}))\Z", tuple(directives)
+
+    def parse(self, date_string: str) -> datetime | None:
+        """
+        Transform a date string into a UTC datetime object with the first matching
+        format.  Returns None if the date string cannot be parsed.
+
+        Args:
+            date_string: A date string.
+        """
+        if (match := self.pattern.match(date_string)) is None:
+            return None
+        index = int(match.lastgroup[1:])  # type: ignore[index]
+        try:
+            return self._create_datetime(match, index)
+        except ValueError:
+            pass
+        for next_index in range(index + 1, len(self.format_patterns)):
+            if match := self.format_patterns[next_index].match(date_string):
+                try:
+                    return self._create_datetime(match, next_index)
+                except ValueError:
+                    pass
+        return None
+
+    def _create_datetime(self, match: re.Match, index: int) -> datetime:
+        """Create a datetime from a matched format, converting values as strptime."""
+        values = {
+            directive: match.group(f"f{index}_{directive}")
+            for directive in self.format_directives[index]
+        }
+        year = 1900
+        if "Y" in values:
+            year = int(values["Y"])
+        elif "y" in values:
+            # years 00-68 are in the 2000s, 69-99 in the 1900s
+            year = int(values["y"])
+            year += 2000 if year <= 68 else 1900  # noqa: PLR2004
+        return datetime(
+            year,
+            int(values.get("m", 1)),
+            int(values.get("d", 1)),
+            int(values.get("H", 0)),
+            int(values.get("M", 0)),
+            int(values.get("S", 0)),
+            int(values.get("f", "0").ljust(6, "0")),
+        ).astimezone(UTC)
+
+
+date_format_parser = DateFormatParser(DATE_FORMATS)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_date_from_string(
     date_string: str,
 ) -> datetime | None:
@@ -62,15 +186,14 @@ def parse_date_from_string(
     Transform a date string into a datetime object according to one of the configured
     OpenSearch date formats. Returns None if the date string cannot be parsed.
 
+    The same date strings recur across the records of a source file, so results are
+    kept in an LRU cache.  Cache hits and misses are reported by
+    parse_date_from_string.cache_info().
+
     Args:
         date_string: A date string.
     """
-    for date_format in DATE_FORMATS:
-        try:
-            return datetime.strptime(date_string, date_format).astimezone(UTC)
-        except ValueError:
-            pass
-    return None
+    return date_format_parser.parse(date_string)
 
 
 def validate_date(
@@ -131,3 +254,168 @@ def validate_date_range(
         end_date,
     )
     return False
+
+
+def map_in_order[T, R](
+    executor: Executor,
+    function: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+) -> Iterator[R]:
+    """Map a function over items with an executor, yielding results in input order.
+
+    Unlike Executor.map(), which submits every item before returning, this submits at
+    most 'max_in_flight' items ahead of the consumer.  This keeps memory bounded when
+    items are streamed from a large source file.
+
+    Args:
+        executor: A thread or process pool executor.
+        function: A callable applied to each item.
+        items: An iterable of items, consumed lazily.
+        max_in_flight: Maximum number of submitted items not yet yielded.
+    """
+    pending: deque[Future[R]] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def prefetch[T](items: Iterable[T], max_size: int, name: str) -> Generator[T]:
+    """Iterate over items in a background thread, buffering them in a bounded queue.
+
+    Lets the work of producing items, e.g. reading and parsing source records, overlap
+    with the consumer's work on earlier items.  At most 'max_size' items are produced
+    ahead of the consumer.  Items must not depend on the iterator's state once
+    produced, e.g. an lxml element cleared when the iterator resumes.
+
+    Exceptions raised while producing items are re-raised to the consumer.  If the
+    consumer stops iterating early, the background thread stops producing items.
+
+    Args:
+        items: An iterable of items, consumed in the background thread.
+        max_size: Maximum number of produced items not yet yielded.
+        name: Name of the background thread.
+    """
+    buffer: queue.Queue[tuple[T | None, BaseException | None, bool]] = queue.Queue(
+        maxsize=max_size
+    )
+    stopped = threading.Event()
+
+    def put(item: T | None, exception: BaseException | None, *, done: bool) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put((item, exception, done), timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item, None, done=False):
+                    return
+        except BaseException as exception:  # noqa: BLE001
+            put(None, exception, done=True)
+        else:
+            put(None, None, done=True)
+
+    thread = threading.Thread(target=produce, name=name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exception, done = buffer.get()
+            if exception is not None:
+                raise exception
+            if done:
+                return
+            yield item  # type: ignore[misc]
+    finally:
+        stopped.set()
+        thread.join()
+
+
+def expand_source_files(source_files: Iterable[str]) -> list[str]:
+    """Expand source file paths, glob patterns, directories, and S3 prefixes.
+
+    Each of the source files may be:
+        - a local or S3 file path, used as is
+        - a local or S3 glob pattern, e.g. 'alma-2024-01-01-full-*.xml'
+        - a local directory, or an S3 prefix ending with '/', expanded to the files
+          directly within it
+
+    The files matched by each path are sorted so that numbered files are in numeric
+    order, e.g. '_2' before '_10'.  Files matched by more than one path are included
+    once.
+
+    Args:
+        source_files: Source file paths, glob patterns, directories, or S3 prefixes.
+
+    Raises:
+        ValueError: A glob pattern, directory, or S3 prefix matched no files.
+    """
+    expanded_source_files: dict[str, None] = {}
+    for source_file in source_files:
+        if source_file.startswith("s3://") and (
+            source_file.endswith("/") or GLOB_PATTERN_CHARACTERS.search(source_file)
+        ):
+            matches = list_s3_source_files(source_file)
+        elif GLOB_PATTERN_CHARACTERS.search(source_file):
+            matches = [path for path in glob.glob(source_file) if os.path.isfile(path)]
+        elif os.path.isdir(source_file):
+            matches = [entry.path for entry in os.scandir(source_file) if entry.is_file()]
+        else:
+            matches = [source_file]
+        if not matches:
+            message = f"No source files found matching: {source_file}"
+            raise ValueError(message)
+        expanded_source_files.update(dict.fromkeys(sorted(matches, key=natural_sort_key)))
+    return list(expanded_source_files)
+
+
+def list_s3_source_files(s3_path: str) -> list[str]:
+    """List the S3 objects directly within a prefix, or matching a glob pattern.
+
+    Glob characters are only supported in the last part of the path.
+
+    Args:
+        s3_path: S3 prefix ending with '/', e.g. 's3://bucket/alma/', or glob pattern,
+            e.g. 's3://bucket/alma/alma-2024-01-01-full-*.xml'.
+    """
+    import boto3  # type: ignore[import-untyped]  # noqa: PLC0415
+
+    bucket, _, key_pattern = s3_path.removeprefix("s3://").partition("/")
+    if key_pattern.endswith("/"):
+        key_pattern += "*"
+    directory = key_pattern.rpartition("/")[0]
+    # list the objects under the longest prefix of the pattern without glob characters
+    prefix = GLOB_PATTERN_CHARACTERS.split(key_pattern, maxsplit=1)[0]
+    pages = (
+        boto3.client("s3")
+        .get_paginator("list_objects_v2")
+        .paginate(Bucket=bucket, Prefix=prefix)
+    )
+    return [
+        f"s3://{bucket}/{s3_object['Key']}"
+        for page in pages
+        for s3_object in page.get("Contents", [])
+        # as with a local glob, objects in nested prefixes are not matched
+        if s3_object["Key"].rpartition("/")[0] == directory
+        and fnmatch.fnmatchcase(s3_object["Key"], key_pattern)
+    ]
+
+
+def natural_sort_key(path: str) -> list[str | int]:
+    """Return a sort key ordering the numbers in paths numerically.
+
+    Args:
+        path: A file path, e.g. 'alma-2024-01-01-full-extracted-records-to-index_10.xml'.
+    """
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)]
@@ -0,0 +1,106 @@
+"""Hashes of source records already indexed, for incremental transforms."""
+
+from __future__ import annotations
+
+import logging
+from hashlib import blake2b
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from transmogrifier.exceptions import CriticalError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+# bytes of each blake2b digest, kept as an int to minimize memory per record
+SOURCE_RECORD_HASH_BYTES = 8
+
+
+def hash_source_record(raw_source_record: bytes) -> int:
+    """Return a fast hash of the raw bytes of a source record.
+
+    Args:
+        raw_source_record: Raw bytes of a source record, as written to the dataset.
+    """
+    return int.from_bytes(
+        blake2b(raw_source_record, digest_size=SOURCE_RECORD_HASH_BYTES).digest()
+    )
+
+
+class SourceRecordHashes:
+    """Set of hashes of the raw source records of a source's current indexed records.
+
+    A source record with the same raw bytes as the current version of an indexed
+    record is unchanged, as its raw bytes include its identifier, and does not need to
+    be transformed again.  Hashes are checked before records are parsed, so the set is
+    keyed by hash rather than TIMDEX record id.
+    """
+
+    __slots__ = ("_hashes",)
+
+    def __init__(self, raw_source_records: Iterable[bytes] = ()) -> None:
+        self._hashes: set[int] = {
+            hash_source_record(raw_source_record)
+            for raw_source_record in raw_source_records
+        }
+
+    def __contains__(self, raw_source_record: object) -> bool:
+        """Return True if the raw bytes of a source record are already indexed."""
+        return (
+            isinstance(raw_source_record, bytes)
+            and hash_source_record(raw_source_record) in self._hashes
+        )
+
+    def __len__(self) -> int:
+        """Return the number of unique hashes."""
+        return len(self._hashes)
+
+    def __repr__(self) -> str:
+        """Return the class name and number of hashes."""
+        return f"<{self.__class__.__name__} hashes={len(self)}>"
+
+    @classmethod
+    def load(cls, dataset_location: str, source: str) -> SourceRecordHashes:
+        """Load the hashes of a source's current indexed records from a TIMDEX dataset.
+
+        Only the source_record column of the current version of each record is read,
+        and only records whose current action is 'index', so records that were
+        since deleted, skipped, or failed to transform are transformed again.
+
+        Args:
+            dataset_location: Location of the TIMDEX parquet dataset.
+            source: Source to load the current records of.
+
+        Raises:
+            On error reading the dataset, raises CriticalError which will terminate the
+            run.
+        """
+        from timdex_dataset_api import (  # type: ignore[import-untyped, import-not-found]  # noqa: PLC0415
+            TIMDEXDataset,
+        )
+
+        start_time = perf_counter()
+        try:
+            timdex_dataset = TIMDEXDataset(location=dataset_location)
+            source_record_hashes = cls(
+                row["source_record"]
+                for row in timdex_dataset.records.read_dicts_iter(
+                    table="current_records",
+                    columns=["source_record"],
+                    source=source,
+                    action="index",
+                )
+            )
+        except Exception as exc:
+            raise CriticalError(f"Could not load source record hashes: {exc}") from exc
+
+        logger.info(
+            "Loaded %d source record hashes for source %s from %s in %.3f seconds",
+            len(source_record_hashes),
+            source,
+            dataset_location,
+            perf_counter() - start_time,
+        )
+        return source_record_hashes
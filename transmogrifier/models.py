@@ -1,8 +1,10 @@
+import json
 from collections.abc import Callable
-from typing import Any
+from types import NoneType, UnionType
+from typing import Any, get_args, get_origin
 
 import attrs
-from attrs import asdict, define, field, validators
+from attrs import asdict, define, field, frozen, validators
 from attrs.validators import instance_of, optional
 
 
@@ -43,23 +45,32 @@ def not_empty(
         raise ValueError(message)
 
 
+def hashable_value(value: Any) -> Any:  # noqa: ANN401
+    """Return a value as used to compare and hash TIMDEX objects.
+
+    Lists are converted to tuples, so TIMDEX objects with list attributes are hashable.
+    """
+    return tuple(value) if isinstance(value, list) else value
+
+
 def timdex_object_hash(timdex_object: Any) -> int:  # noqa: ANN401
-    """Hash method for TIMDEX objects.
+    """Hash method for mutable TIMDEX objects.
 
-    This method is set as the hash method for TIMDEX objects.
-    The method generates a unique hash using a tuple
-    comprised of the class name and attribute values.
-    By making TIMDEX objects hashable, dedupe methods
-    can be applied to a list of TIMDEX objects.
+    This method is set as the hash method for TIMDEX objects that transformers modify
+    after creating them, e.g. Date.  The method generates a hash from a tuple comprised
+    of the class name and attribute values.  Frozen TIMDEX objects instead use the hash
+    generated by attrs, computed once and cached.  By making TIMDEX objects hashable,
+    dedupe methods can be applied to a list of TIMDEX objects.
     """
-    values = (timdex_object.__class__.__name__,)
-    values += tuple(
-        [
-            tuple(attrib) if isinstance(attrib, list) else attrib
-            for attrib in attrs.astuple(timdex_object)
-        ]
+    return hash(
+        (
+            timdex_object.__class__.__name__,
+            *[
+                hashable_value(getattr(timdex_object, attribute.name))
+                for attribute in attrs.fields(timdex_object.__class__)
+            ],
+        )
     )
-    return hash(values)
 
 
 def dedupe(item_list: list | Any) -> list | None:  # noqa: ANN401
@@ -73,28 +84,164 @@ def dedupe(item_list: list | Any) -> list | None:  # noqa: ANN401
     return list(dict.fromkeys(item_list))
 
 
-@define
+# encodes dicts of JSON values exactly as json.dumps() with default arguments does,
+# without tracking containers for circular references as encoded values are never shared
+TIMDEX_JSON_ENCODER = json.JSONEncoder(check_circular=False)
+
+
+def create_timdex_object_encoder(
+    cls: type, encoders: dict[type, Callable[[Any], dict[str, Any]]]
+) -> Callable[[Any], dict[str, Any]]:
+    """Create a function encoding an instance of a TIMDEX class as a dict.
+
+    The encoder is equivalent to attrs.asdict() with a filter omitting None values, but
+    how each attribute is encoded is decided once from the attribute's type, instead of
+    for every value of every instance.  Values of a TIMDEX class type, or lists of them,
+    are encoded with the encoder for that class; other values are used as is.
+
+    Args:
+        cls: A TIMDEX attrs class.
+        encoders: Encoders for the TIMDEX classes used by the attributes of cls.
+    """
+    field_encoders: list[tuple[str, Callable[[Any], Any] | None]] = []
+    for attribute in attrs.fields(cls):
+        value_types = [
+            value_type
+            for value_type in (
+                get_args(attribute.type)
+                if isinstance(attribute.type, UnionType)
+                else (attribute.type,)
+            )
+            if value_type is not NoneType
+        ]
+        value_type = value_types[0] if len(value_types) == 1 else None
+        if value_type in encoders:
+            field_encoders.append((attribute.name, encoders[value_type]))
+        elif get_origin(value_type) is list and (
+            item_encoder := encoders.get(get_args(value_type)[0])
+        ):
+            field_encoders.append((attribute.name, _list_encoder(item_encoder)))
+        else:
+            field_encoders.append((attribute.name, None))
+
+    def encode_timdex_object(timdex_object: Any) -> dict[str, Any]:  # noqa: ANN401
+        encoded = {}
+        for field_name, encode_value in field_encoders:
+            if (value := getattr(timdex_object, field_name)) is not None:
+                encoded[field_name] = (
+                    value if encode_value is None else encode_value(value)
+                )
+        return encoded
+
+    return encode_timdex_object
+
+
+def _list_encoder(
+    item_encoder: Callable[[Any], dict[str, Any]],
+) -> Callable[[list], list[dict[str, Any]]]:
+    def encode_list(items: list) -> list[dict[str, Any]]:
+        return [item_encoder(item) for item in items]
+
+    return encode_list
+
+
+def create_timdex_object_validator(
+    cls: type, validators: dict[type, Callable[[Any], None]]
+) -> Callable[[Any], None]:
+    """Create a function validating an instance of a TIMDEX class and its values.
+
+    The validator checks the same types as the attrs validators of cls, for a whole
+    object at once after it is complete, instead of on each assignment.  Values of a
+    TIMDEX class type, or lists of them, are validated with the validator for that
+    class.  If a value fails a check, the attribute's attrs validator is run to raise
+    the same exception as on assignment.  Attributes holding a single TIMDEX object,
+    e.g. Date.range, also run their attrs validator, which may check more than types.
+
+    Args:
+        cls: A TIMDEX attrs class.
+        validators: Validators for the TIMDEX classes used by the attributes of cls.
+    """
+    field_validators = [
+        _create_attribute_validator(attribute, validators)
+        for attribute in attrs.fields(cls)
+    ]
+
+    def validate_timdex_object(timdex_object: Any) -> None:  # noqa: ANN401
+        for validate_attribute in field_validators:
+            validate_attribute(timdex_object)
+
+    return validate_timdex_object
+
+
+def _create_attribute_validator(
+    attribute: attrs.Attribute, validators: dict[type, Callable[[Any], None]]
+) -> Callable[[Any], None]:
+    attribute_types = (
+        get_args(attribute.type)
+        if isinstance(attribute.type, UnionType)
+        else (attribute.type,)
+    )
+    is_optional = NoneType in attribute_types
+    value_type = next(
+        value_type for value_type in attribute_types if value_type is not NoneType
+    )
+    is_list = get_origin(value_type) is list
+    item_type: type = get_args(value_type)[0] if is_list else value_type  # type: ignore[assignment]
+    validate_item = validators.get(item_type)
+    name = attribute.name
+
+    def raise_attribute_error(timdex_object: Any, value: Any) -> None:  # noqa: ANN401
+        attribute.validator(timdex_object, attribute, value)  # type: ignore[misc]
+        message = f"'{name}' must be {attribute.type}, received: {value!r}"
+        raise TypeError(message)
+
+    def validate_attribute(timdex_object: Any) -> None:  # noqa: ANN401
+        value = getattr(timdex_object, name)
+        if value is None and is_optional:
+            return
+        if is_list:
+            if not (
+                isinstance(value, list)
+                and value
+                and all(isinstance(item, item_type) for item in value)
+            ):
+                raise_attribute_error(timdex_object, value)
+            if validate_item is not None:
+                for item in value:
+                    validate_item(item)
+        elif not isinstance(value, item_type):
+            raise_attribute_error(timdex_object, value)
+        elif validate_item is not None:
+            validate_item(value)
+            attribute.validator(timdex_object, attribute, value)  # type: ignore[misc]
+
+    return validate_attribute
+
+
+# TIMDEX objects are frozen, so their hashes are computed once when deduped and cached,
+# except Date and Funder, which transformers set the attributes of after creating them
+@frozen(cache_hash=True)
 class AlternateTitle:
     value: str = field(validator=instance_of(str))  # Required subfield
     kind: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
 
-
-@define
+@frozen(cache_hash=True)
 class Contributor:
     value: str = field(validator=instance_of(str))  # Required subfield
-    affiliation: list[str] | None = field(default=None, validator=optional(list_of(str)))
-    identifier: list[str] | None = field(default=None, validator=optional(list_of(str)))
+    affiliation: list[str] | None = field(
+        default=None, validator=optional(list_of(str)), eq=hashable_value
+    )
+    identifier: list[str] | None = field(
+        default=None, validator=optional(list_of(str)), eq=hashable_value
+    )
     kind: str | None = field(default=None, validator=optional(instance_of(str)))
     mit_affiliated: bool | None = field(
         default=None, validator=optional(instance_of(bool))
     )
 
-    __hash__ = timdex_object_hash
-
 
-@define
+@frozen(cache_hash=True)
 class DateRange:
     gt: str | None = field(default=None, validator=optional(instance_of(str)))
     gte: str | None = field(default=None, validator=optional(instance_of(str)))
@@ -130,7 +277,7 @@ class Funder:
     __hash__ = timdex_object_hash
 
 
-@define
+@frozen(cache_hash=True)
 class Holding:
     call_number: str | None = field(default=None, validator=optional(instance_of(str)))
     collection: str | None = field(default=None, validator=optional(instance_of(str)))
@@ -138,89 +285,73 @@ class Holding:
     location: str | None = field(default=None, validator=optional(instance_of(str)))
     note: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
 
-
-@define
+@frozen(cache_hash=True)
 class Identifier:
     value: str = field(validator=instance_of(str))  # Required subfield
     kind: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
-
 
-@define
+@frozen(cache_hash=True)
 class Link:
     url: str = field(validator=instance_of(str))  # Required subfield
     kind: str | None = field(default=None, validator=optional(instance_of(str)))
     restrictions: str | None = field(default=None, validator=optional(instance_of(str)))
     text: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
 
-
-@define
+@frozen(cache_hash=True)
 class Location:
     value: str | None = field(default=None, validator=optional(instance_of(str)))
     kind: str | None = field(default=None, validator=optional(instance_of(str)))
     geoshape: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
 
-
-@define
+@frozen(cache_hash=True)
 class Note:
-    value: list[str] = field(validator=list_of(str))  # Required subfield
+    value: list[str] = field(  # Required subfield
+        validator=list_of(str), eq=hashable_value
+    )
     kind: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
-
 
-@define
+@frozen(cache_hash=True)
 class Publisher:
     name: str | None = field(default=None, validator=optional(instance_of(str)))
     date: str | None = field(default=None, validator=optional(instance_of(str)))
     location: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
-
 
-@define
+@frozen(cache_hash=True)
 class RelatedItem:
     description: str | None = field(default=None, validator=optional(instance_of(str)))
     item_type: str | None = field(default=None, validator=optional(instance_of(str)))
     relationship: str | None = field(default=None, validator=optional(instance_of(str)))
     uri: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
-
 
-@define
+@frozen(cache_hash=True)
 class Rights:
     description: str | None = field(default=None, validator=optional(instance_of(str)))
     kind: str | None = field(default=None, validator=optional(instance_of(str)))
     uri: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
-
 
-@define
+@frozen(cache_hash=True)
 class Subject:
-    value: list[str] = field(validator=list_of(str))  # Required subfield
+    value: list[str] = field(  # Required subfield
+        validator=list_of(str), eq=hashable_value
+    )
     kind: str | None = field(default=None, validator=optional(instance_of(str)))
 
-    __hash__ = timdex_object_hash
-
 
-@define
+@frozen(cache_hash=True)
 class TimdexProvenance:
     source: str = field(default=None, validator=instance_of(str))
     run_date: str = field(default=None, validator=instance_of(str))
     run_id: str = field(default=None, validator=instance_of(str))
     run_record_offset: int = field(default=None, validator=instance_of(int))
 
-    __hash__ = timdex_object_hash
-
 
 @define
 class TimdexRecord:
@@ -308,6 +439,16 @@ class TimdexRecord:
     def asdict(self) -> dict[str, Any]:
         return asdict(self, filter=lambda _, value: value is not None)
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the record to JSON bytes, omitting fields with None values.
+
+        Produces the same bytes as json.dumps(self.asdict()).encode(), using encoders
+        compiled once per TIMDEX class instead of attrs.asdict().
+        """
+        return TIMDEX_JSON_ENCODER.encode(
+            TIMDEX_OBJECT_ENCODERS[TimdexRecord](self)
+        ).encode()
+
     @classmethod
     def get_required_field_names(cls) -> list[str]:
         return [
@@ -323,3 +464,45 @@ class TimdexRecord:
             for field, attribute in attrs.fields_dict(cls).items()
             if attribute.default is None
         ]
+
+
+TIMDEX_OBJECT_ENCODERS: dict[type, Callable[[Any], dict[str, Any]]] = {}
+TIMDEX_OBJECT_VALIDATORS: dict[type, Callable[[Any], None]] = {}
+# classes are ordered so the encoders and validators of attribute types are created
+# first
+for timdex_class in (
+    AlternateTitle,
+    Contributor,
+    DateRange,
+    Date,
+    Funder,
+    Holding,
+    Identifier,
+    Link,
+    Location,
+    Note,
+    Publisher,
+    RelatedItem,
+    Rights,
+    Subject,
+    TimdexProvenance,
+    TimdexRecord,
+):
+    TIMDEX_OBJECT_ENCODERS[timdex_class] = create_timdex_object_encoder(
+        timdex_class, TIMDEX_OBJECT_ENCODERS
+    )
+    TIMDEX_OBJECT_VALIDATORS[timdex_class] = create_timdex_object_validator(
+        timdex_class, TIMDEX_OBJECT_VALIDATORS
+    )
+
+
+def validate_timdex_record(timdex_record: TimdexRecord) -> None:
+    """Validate a TimdexRecord built with attrs validators disabled.
+
+    Raises the same exception as the attrs validator of the first invalid attribute,
+    see create_timdex_object_validator().
+
+    Args:
+        timdex_record: A complete TimdexRecord.
+    """
+    TIMDEX_OBJECT_VALIDATORS[TimdexRecord](timdex_record)
@@ -0,0 +1,98 @@
+"""Profiling of time spent in transformer field methods."""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import smart_open  # type: ignore[import-untyped]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class FieldProfiler:
+    """Cumulative wall time and call counts for the methods used to transform records.
+
+    A Transformer given a profiler measures each optional field method (get_<field>),
+    get_valid_title, generate_derived_fields, the serialization of source and
+    transformed records, and the writing of each batch to the dataset.  Profilers from
+    worker processes are merged into the profiler of the parent process.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.seconds: defaultdict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Add the wall time of the block, including if it raises, to a method's total.
+
+        Args:
+            name: Name of the method being measured.
+        """
+        start_time = perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += perf_counter() - start_time
+            self.calls[name] += 1
+
+    def merge(self, other: FieldProfiler) -> None:
+        """Add the timings of another profiler, e.g. from a worker process.
+
+        Args:
+            other: Profiler with timings to add to this profiler.
+        """
+        self.calls.update(other.calls)
+        for name, seconds in other.seconds.items():
+            self.seconds[name] += seconds
+
+    def report(self) -> list[dict[str, Any]]:
+        """Return timings for each method, sorted by total time descending."""
+        return [
+            {
+                "method": name,
+                "calls": self.calls[name],
+                "total_seconds": round(seconds, 6),
+                "mean_microseconds": round(seconds / self.calls[name] * 1_000_000, 3),
+            }
+            for name, seconds in sorted(
+                self.seconds.items(), key=lambda item: (-item[1], item[0])
+            )
+        ]
+
+    def format_table(self) -> str:
+        """Return the report as a plain text table."""
+        rows = [("method", "calls", "total (s)", "mean (us)")]
+        rows.extend(
+            (
+                timing["method"],
+                str(timing["calls"]),
+                f"{timing['total_seconds']:.6f}",
+                f"{timing['mean_microseconds']:.3f}",
+            )
+            for timing in self.report()
+        )
+        name_width = max(len(row[0]) for row in rows)
+        return "\n".join(
+            f"{row[0]:<{name_width}}  {row[1]:>10}  {row[2]:>12}  {row[3]:>12}"
+            for row in rows
+        )
+
+    def write_report(self, report_path: str, **run_data: Any) -> None:  # noqa: ANN401
+        """Write the report as JSON to path (S3 or local filesystem).
+
+        Args:
+            report_path: Path of the JSON report file.
+            **run_data: Details of the run included in the report, e.g. source.
+        """
+        with smart_open.open(report_path, "w") as report_file:
+            json.dump({**run_data, "methods": self.report()}, report_file, indent=2)
+        logger.info("Wrote transform profiling report to %s", report_path)
@@ -141,6 +141,9 @@ class LibGuides(JSONTransformer):
     # attach LibGuidesAPIClient singleton to class
     api_client = libguides_api_client
 
+    # records depend on API data and the run timestamp, so are not cached
+    cacheable = False
+
     # cached class level property
     _allowed_guides_df: pd.DataFrame | None = None
 
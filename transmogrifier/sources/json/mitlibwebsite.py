@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 
 
 class MITLibWebsite(JSONTransformer):
+    # records depend on the run timestamp, so are not cached
+    cacheable = False
+
     @classmethod
     @lru_cache(maxsize=8)
     def parse_html(cls, html_base64: str) -> Tag:
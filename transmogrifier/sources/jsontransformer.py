@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from abc import abstractmethod
 from typing import TYPE_CHECKING, final
 
@@ -31,6 +32,45 @@ class JSONTransformer(Transformer):
         with jsonlines.Reader(smart_open.open(source_file, "r")) as records:
             yield from records.iter(type=dict)
 
+    @final
+    @classmethod
+    def read_source_file(cls, source_file: str, start: int = 0) -> Iterator[str]:
+        """
+        Read JSON file and return the unparsed lines of source records via an iterator.
+
+        May not be overridden.
+
+        Args:
+            source_file: A file containing source records to be transformed.
+            start: Number of lines at the start of the file to skip, without decoding
+                them as JSON.
+        """
+        with smart_open.open(source_file, "r") as file:
+            yield from itertools.islice(file, start, None)
+
+    @classmethod
+    def parse_source_record(cls, source_record: str) -> dict[str, JSON]:  # type: ignore[override]
+        """
+        Parse a single line of a JSON file into a JSON object.
+
+        Validates that the record is a dict for proper processing.
+
+        Args:
+            source_record: A single line of a JSON lines file.
+        """
+        with jsonlines.Reader([source_record]) as records:
+            return records.read(type=dict)
+
+    @classmethod
+    def get_raw_source_record(cls, source_record: str) -> bytes:  # type: ignore[override]
+        """
+        Return the UTF-8 bytes of a single line of a JSON file, without the line ending.
+
+        Args:
+            source_record: A single line of a JSON lines file.
+        """
+        return source_record.rstrip("\r\n").encode()
+
     @classmethod
     @abstractmethod
     def get_main_titles(cls, source_record: dict[str, JSON]) -> list[str]:
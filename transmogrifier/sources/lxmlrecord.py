@@ -0,0 +1,341 @@
+"""Native lxml XML record model.
+
+By default XML source records are parsed twice: once by lxml while iterating over the
+source file, and again by BeautifulSoup for the transformers to search.  The classes in
+this module wrap the lxml elements produced by the first parse directly, exposing the
+subset of the BeautifulSoup Tag interface used by the XML transformers (find, find_all,
+attribute access, .string, .children, etc.).  Searches are delegated to lxml's
+ElementPath iteration, which runs in C, instead of walking a pure-Python tree.
+
+The following BeautifulSoup semantics are preserved so transformers produce the same
+output with either record type:
+    - tag names match either the local name or 'prefix:local name'
+    - attribute keys for namespaced attributes use 'prefix:name'
+    - .string descends through single children and treats comments as strings
+    - strings made up only of whitespace are collapsed to a single newline or space
+
+Searches only return elements; searching for strings without a tag name is not
+supported.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from lxml import etree
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+type NameFilter = str | list[str] | bool | None
+
+# whitespace characters collapsed by BeautifulSoup, see bs4.BeautifulSoup.ASCII_SPACES
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+ASCII_SPACES_TABLE = str.maketrans("", "", ASCII_SPACES)
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+def collapse_whitespace(text: str) -> str:
+    """Collapse a string containing only whitespace as BeautifulSoup does.
+
+    Args:
+        text: A text node from an lxml element.
+    """
+    if text.translate(ASCII_SPACES_TABLE):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+class LxmlTag:
+    """BeautifulSoup Tag compatible wrapper around an lxml element."""
+
+    __slots__ = ("_element",)
+
+    def __init__(self, element: etree._Element) -> None:
+        self._element = element
+
+    def __getattr__(self, name: str) -> LxmlTag | None:
+        """Return the first descendant element with the given name, like bs4."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.find(name)
+
+    def __getitem__(self, key: str) -> str:
+        """Return an attribute value, raising KeyError if missing, like bs4."""
+        return self.attrs[key]
+
+    def __repr__(self) -> str:
+        """Return the class and tag name of the element."""
+        return f"<{self.__class__.__name__} {self.name}>"
+
+    def __str__(self) -> str:
+        """Return the element serialized as XML."""
+        return self.decode()
+
+    @property
+    def element(self) -> etree._Element:
+        return self._element
+
+    @property
+    def name(self) -> str:
+        return etree.QName(self._element).localname
+
+    @property
+    def prefix(self) -> str | None:
+        return self._element.prefix
+
+    @property
+    def parent(self) -> LxmlTag | None:
+        """Return the parent element, or the document for the record element."""
+        if (parent := self._element.getparent()) is not None:
+            return LxmlTag(parent)
+        return LxmlRecord(self._element)
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        """Return attributes keyed as BeautifulSoup keys them for XML documents.
+
+        Includes namespace declarations made on the element, e.g. 'xmlns:dim'.
+        """
+        element = self._element
+        parent = element.getparent()
+        parent_nsmap = parent.nsmap if parent is not None else {}
+        attributes = {
+            ("xmlns" if prefix is None else f"xmlns:{prefix}"): namespace
+            for prefix, namespace in element.nsmap.items()
+            if parent_nsmap.get(prefix) != namespace
+        }
+        for key, value in element.attrib.items():
+            attributes[self._attribute_name(str(key))] = str(value)
+        return attributes
+
+    @property
+    def string(self) -> str | None:
+        """Return the only string child, descending through single element children.
+
+        Mirrors bs4's Tag.string: None is returned if the element has more than one
+        child or no children.
+        """
+        element = self._element
+        while True:
+            text = element.text
+            if len(element) == 0:
+                if element is not self._element and not _is_element(element):
+                    return text
+                return collapse_whitespace(text) if text else None
+            if text or len(element) > 1:
+                return None
+            child = element[0]
+            if child.tail:
+                return None
+            element = child
+
+    @property
+    def children(self) -> Iterator[LxmlTag | str]:
+        """Iterate over child elements and strings in document order."""
+        element = self._element
+        if element.text:
+            yield collapse_whitespace(element.text)
+        for child in element:
+            if _is_element(child):
+                yield LxmlTag(child)
+            elif child.text is not None:
+                yield child.text
+            if child.tail:
+                yield collapse_whitespace(child.tail)
+
+    @property
+    def contents(self) -> list[LxmlTag | str]:
+        return list(self.children)
+
+    def get(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        if ":" in key or key.startswith("xmlns"):
+            return self.attrs.get(key, default)
+        return self._element.get(key, default)
+
+    def has_attr(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def find(
+        self,
+        name: NameFilter = None,
+        attrs: dict | None = None,
+        recursive: bool = True,  # noqa: FBT001, FBT002
+        string: str | bool | None = None,
+        **kwargs: str | list[str] | bool | None,
+    ) -> LxmlTag | None:
+        """Return the first matching element, see find_all()."""
+        return next(
+            self._search(name, attrs, recursive=recursive, string=string, **kwargs),
+            None,
+        )
+
+    def find_all(
+        self,
+        name: NameFilter = None,
+        attrs: dict | None = None,
+        recursive: bool = True,  # noqa: FBT001, FBT002
+        string: str | bool | None = None,
+        limit: int | None = None,
+        **kwargs: str | list[str] | bool | None,
+    ) -> list[LxmlTag]:
+        """Return matching descendant elements in document order.
+
+        Args:
+            name: Tag name, list of tag names, or True for any element.
+            attrs: Attribute filters, combined with keyword argument filters.
+            recursive: If False, only direct children are searched.
+            string: If True, only elements with a .string are matched.  If a string,
+                only elements whose .string equals it are matched.
+            limit: Maximum number of elements to return.
+            **kwargs: Attribute filters.  A string value must equal the attribute
+                value, a list must contain it, and True or None require the attribute
+                to be present or absent.
+        """
+        matches = self._search(name, attrs, recursive=recursive, string=string, **kwargs)
+        if limit:
+            return [match for _, match in zip(range(limit), matches, strict=False)]
+        return list(matches)
+
+    def decode(self) -> str:
+        return etree.tostring(self._element, encoding="unicode", with_tail=False)
+
+    def encode(self, encoding: str = "utf-8") -> bytes:
+        encoded: bytes = etree.tostring(self._element, encoding=encoding, with_tail=False)  # type: ignore[assignment]
+        return encoded
+
+    def _candidates(
+        self, tags: list[str], *, recursive: bool
+    ) -> Iterator[etree._Element]:
+        if recursive:
+            return self._element.iterdescendants(*tags)
+        return self._element.iterchildren(*tags)
+
+    def _search(
+        self,
+        name: NameFilter,
+        attrs: dict | None,
+        *,
+        recursive: bool,
+        string: str | bool | None,
+        **kwargs: str | list[str] | bool | None,
+    ) -> Iterator[LxmlTag]:
+        names = [name] if isinstance(name, str) else name
+        if isinstance(names, list):
+            tags = [f"{{*}}{tag_name.rsplit(':', 1)[-1]}" for tag_name in names]
+            prefixed = {tag_name for tag_name in names if ":" in tag_name}
+        else:
+            tags = [etree.Element]  # type: ignore[list-item]
+            prefixed = set()
+        attribute_filters = {**(attrs or {}), **kwargs}
+
+        for element in self._candidates(tags, recursive=recursive):
+            if prefixed and not self._matches_name(element, names):  # type: ignore[arg-type]
+                continue
+            tag = LxmlTag(element)
+            if attribute_filters and not tag._matches_attributes(attribute_filters):
+                continue
+            if string is not None:
+                element_string = tag.string
+                if string is True and element_string is None:
+                    continue
+                if isinstance(string, str) and element_string != string:
+                    continue
+            yield tag
+
+    @staticmethod
+    def _matches_name(element: etree._Element, names: list[str]) -> bool:
+        local_name = etree.QName(element).localname
+        prefixed_name = f"{element.prefix}:{local_name}" if element.prefix else None
+        return any(tag_name in (local_name, prefixed_name) for tag_name in names)
+
+    def _matches_attributes(self, attribute_filters: dict) -> bool:
+        for key, expected in attribute_filters.items():
+            value = self.get(key)
+            if expected is True:
+                matched = value is not None
+            elif expected is None or expected is False:
+                matched = value is None
+            elif isinstance(expected, list | tuple | set):
+                matched = value in expected
+            else:
+                matched = value == expected
+            if not matched:
+                return False
+        return True
+
+    def _attribute_name(self, key: str) -> str:
+        if not key.startswith("{"):
+            return key
+        qualified_name = etree.QName(key)
+        if qualified_name.namespace == XML_NAMESPACE:
+            return f"xml:{qualified_name.localname}"
+        for prefix, namespace in self._element.nsmap.items():
+            if prefix and namespace == qualified_name.namespace:
+                return f"{prefix}:{qualified_name.localname}"
+        return qualified_name.localname
+
+
+class LxmlRecord(LxmlTag):
+    """Document-level wrapper for a single XML record.
+
+    Mirrors a BeautifulSoup object created from a record: the record element itself is
+    included when searching, as it is the document's only child.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """Return the class and tag name of the record element."""
+        return f"<{self.__class__.__name__} {etree.QName(self._element).localname}>"
+
+    @property
+    def name(self) -> str:
+        return "[document]"
+
+    @property
+    def prefix(self) -> str | None:
+        return None
+
+    @property
+    def parent(self) -> LxmlTag | None:
+        return None
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        return {}
+
+    @property
+    def string(self) -> str | None:
+        return LxmlTag(self._element).string
+
+    @property
+    def children(self) -> Iterator[LxmlTag | str]:
+        yield LxmlTag(self._element)
+
+    def get(self, _key: str, default: Any = None) -> Any:  # noqa: ANN401
+        return default
+
+    def _candidates(
+        self, tags: list[str], *, recursive: bool
+    ) -> Iterator[etree._Element]:
+        if recursive:
+            return self._element.iter(*tags)
+        # the record element is the document's only child, and is yielded first by
+        # iter() when it matches
+        first_match = next(self._element.iter(*tags), None)
+        return iter([first_match] if first_match is self._element else [])
+
+    @classmethod
+    def from_bytes(cls, source_record: bytes) -> LxmlRecord:
+        """Parse the bytes of a single XML record.
+
+        Args:
+            source_record: Bytes of a single XML record.
+        """
+        return cls(etree.fromstring(source_record))
+
+
+def _is_element(node: etree._Element) -> bool:
+    """Return False for comments and processing instructions."""
+    return isinstance(node.tag, str)
@@ -6,54 +6,145 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
 import os
 import re
 import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from datetime import UTC, datetime
 from importlib import import_module
-from typing import TYPE_CHECKING, final
+from itertools import islice, tee
+from time import perf_counter
+from typing import IO, TYPE_CHECKING, ClassVar, final
 
-import smart_open  # type: ignore[import-untyped]
-from bs4 import Tag  # type: ignore[import-untyped]
-from timdex_dataset_api import (  # type: ignore[import-untyped, import-not-found]
-    DatasetRecord,
-    TIMDEXDataset,
-)
+import attrs
+from attrs import define
 
 import transmogrifier.models as timdex
-from transmogrifier.config import SOURCES
+from transmogrifier.cache import (
+    TransformedRecordCache,
+    add_timdex_provenance,
+    get_transformer_version,
+    remove_timdex_provenance,
+)
+from transmogrifier.checkpoints import Checkpoint, SourceFilePositions
+from transmogrifier.config import (
+    PARQUET_DATASET_BATCH_BYTES,
+    PARQUET_DATASET_BATCH_ROWS,
+    SOURCES,
+    ValidationMode,
+    configure_logger,
+)
 from transmogrifier.exceptions import (
     CriticalError,
     DeletedRecordEvent,
     SkippedRecordEvent,
 )
+from transmogrifier.exclusions import ExclusionList
 from transmogrifier.helpers import (
     generate_citation,
+    map_in_order,
+    parse_date_from_string,
+    prefetch,
     validate_date,
 )
+from transmogrifier.profiling import FieldProfiler
 
+# bs4, lxml, smart_open, and timdex_dataset_api are slow to import, and are imported
+# by the XML transformers, and by the methods reading and writing files, that use them
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
 
+    from bs4 import Tag  # type: ignore[import-untyped]
+    from timdex_dataset_api import (  # type: ignore[import-untyped, import-not-found]
+        DatasetRecord,
+        TIMDEXDataset,
+    )
+
+    from transmogrifier.incremental import SourceRecordHashes
+    from transmogrifier.sources.lxmlrecord import LxmlTag
+    from transmogrifier.sources.xmlparsing import RecordType
+
 logger = logging.getLogger(__name__)
 
 type JSON = dict[str, "JSON"] | list["JSON"] | str | int | float | bool | None
 
-PARQUET_DATASET_BATCH_SIZE = 1_000
+# maximum number of source records read ahead of the transform stage when pipelined
+PIPELINE_READ_AHEAD = 100
+PARALLEL_TRANSFORM_CHUNK_SIZE = 100
+
+# context used in place of a profiler measurement when profiling is not enabled
+NOT_PROFILED: AbstractContextManager[None] = nullcontext()
+
+
+@define
+class SourceRecord:
+    """A parsed source record and the raw bytes it was parsed from.
+
+    The raw bytes are written as the source record of the run's DatasetRecords, so the
+    parsed record does not have to be serialized again.  If raw is None, the parsed
+    record is serialized with Transformer.serialize_source_record().
+    """
+
+    record: dict[str, JSON] | Tag | LxmlTag
+    raw: bytes | None
+
+
+@define
+class SourceFile:
+    """Marks the start of the source records of a file in a run of several files.
+
+    Records of each file have their own run data, parsed from the file's name, and
+    run record offsets continuing from the records of the previous file, so records
+    of the run have distinct offsets under its shared run id.  A resumed run starts
+    its first file at the run record offset of its checkpoint.
+    """
+
+    path: str
+    run_data: dict
+    first_run_record_offset: int = 0
+
+
+@define
+class UnchangedSourceRecord:
+    """Marks a source record skipped by an incremental run as already indexed.
+
+    The record is neither parsed nor transformed, and no DatasetRecord is written for
+    it, but it is counted and keeps its run record offset.
+    """
+
+
+UNCHANGED_SOURCE_RECORD = UnchangedSourceRecord()
 
 
 class Transformer(ABC):
     """Base transformer class."""
 
+    # optional TIMDEX field names and method names, set per class on first use
+    _optional_field_method_names: ClassVar[tuple[tuple[str, str], ...]]
+    # False for sources whose records depend on more than the source record, e.g. the
+    # run timestamp or API data, so are not kept in a transformed record cache
+    cacheable: ClassVar[bool] = True
+
     def __init__(
         self,
         source: str,
-        source_records: Iterator[dict[str, JSON] | Tag],
+        source_records: Iterator[
+            dict[str, JSON] | Tag | SourceRecord | SourceFile | UnchangedSourceRecord
+        ],
         exclusion_list_path: str | None = None,
         source_file: str | None = None,
         run_id: str | None = None,
         run_timestamp: str | None = None,
+        workers: int = 1,
+        deleted_records_path: str | None = None,
+        profiler: FieldProfiler | None = None,
+        checkpoint_path: str | None = None,
+        source_record_hashes: SourceRecordHashes | None = None,
+        transformed_record_cache: TransformedRecordCache | None = None,
+        validation_mode: ValidationMode = "full",
     ) -> None:
         """
         Initialize Transformer instance.
@@ -62,23 +153,71 @@ class Transformer(ABC):
             source: Source repository label. Must match a source key from config.SOURCES.
             exclusion_list_path: S3 or local filepath to exclusion list CSV file.
             exclsion_list: The exclusion list for this particular source.
-            source_records: A set of source records to be processed.
+            source_records: A set of source records to be processed, optionally as
+                SourceRecords with their raw bytes.  If workers is greater than 1,
+                these are unparsed source records as returned by read_source_file().
+                Records from more than one file are preceded by a SourceFile, see
+                read_source_files().
             source_file: Filepath of the input source file.
             run_id: A unique identifier associated with this ETL run.
             run_timestamp: A timestamp associated with this ETL run.
+            workers: Number of processes used to transform records.  If greater than 1,
+                records are parsed and transformed in a pool of worker processes.
+            deleted_records_path: S3 or local filepath where the TIMDEX record ids of
+                deleted records are written, one per line, as they are transformed.
+                Compressed if the path ends with a compression extension, e.g. '.gz'.
+            profiler: If set, time spent in each field method is recorded.
+            checkpoint_path: S3 or local filepath where a Checkpoint is written after
+                each batch is written to the TIMDEX dataset, see Transformer.load().
+            source_record_hashes: If set, source records with raw bytes matching one of
+                these hashes are skipped by read_source_files() as unchanged.
+            transformed_record_cache: If set, and the transformer is cacheable, source
+                records are looked up in the cache before they are transformed, and the
+                results of transforming them added to it.
+            validation_mode: 'full' to validate TIMDEX objects on each assignment, or
+                'record' to validate each complete TimdexRecord once, see transform().
         """
         self.source: str = source
         self.exclusion_list_path: str | None = exclusion_list_path
-        self._exclusion_list: list[str] | None = None
+        self._exclusion_list: ExclusionList | None = None
         self.source_base_url: str = SOURCES[source]["base-url"]
         self.source_name = SOURCES[source]["name"]
-        self.source_records: Iterator[JSON | Tag] = source_records
+        self.source_records: Iterator[
+            JSON | Tag | SourceRecord | SourceFile | UnchangedSourceRecord
+        ] = source_records
         self.processed_record_count: int = 0
         self.transformed_record_count: int = 0
         self.skipped_record_count: int = 0
         self.error_record_count: int = 0
-        self.deleted_records: list[str] = []
+        self.deleted_record_count: int = 0
+        self.unchanged_record_count: int = 0
+        # parse_date_from_string() cache hits and misses of worker processes, whose
+        # caches are separate from this process's cache
+        self.worker_date_cache_hits: int = 0
+        self.worker_date_cache_misses: int = 0
+        self.deleted_records_path: str | None = deleted_records_path
+        self._deleted_records_file: IO[str] | None = None
+        self._deleted_records_file_closed: bool = False
+        self.profiler: FieldProfiler | None = profiler
+        self._optional_field_methods: tuple[tuple[str, Callable], ...] | None = None
         self.source_file = source_file
+        # processed record count when the current source file was started
+        self._source_file_start_count: int = 0
+        self.workers = workers
+        self._parallel_dataset_records: Iterator[DatasetRecord] | None = None
+        self.checkpoint_path: str | None = checkpoint_path
+        # source files read by read_source_files(), and records and deleted record ids
+        # written by earlier runs this run resumed from a checkpoint
+        self.source_files: list[str] = [source_file] if source_file else []
+        self.source_file_positions = SourceFilePositions()
+        self.resumed_record_count: int = 0
+        self.resumed_deleted_record_ids: list[str] = []
+        self.source_record_hashes: SourceRecordHashes | None = source_record_hashes
+        self.transformed_record_cache: TransformedRecordCache | None = (
+            transformed_record_cache if self.cacheable else None
+        )
+        self._transformer_version: str | None = None
+        self.validation_mode: ValidationMode = validation_mode
 
         self.run_data = self.get_run_data(
             source_file,
@@ -86,42 +225,51 @@ class Transformer(ABC):
             run_timestamp=run_timestamp,
         )
 
+    def __getstate__(self) -> dict:
+        """Return state for pickling, excluding source records not sent to workers."""
+        state = self.__dict__.copy()
+        state["source_records"] = iter(())
+        state["_parallel_dataset_records"] = None
+        state["deleted_records_path"] = None
+        state["_deleted_records_file"] = None
+        state["resumed_deleted_record_ids"] = []
+        state["_optional_field_methods"] = None
+        state["source_record_hashes"] = None
+        return state
+
     @property
     def run_record_offset(self) -> int:
-        return self.processed_record_count - 1
+        return self.processed_record_count - self._source_file_start_count - 1
+
+    @property
+    def transformer_version(self) -> str:
+        """Version of this transformer's output, for the transformed record cache."""
+        if self._transformer_version is None:
+            self._transformer_version = get_transformer_version(
+                type(self),
+                self.source,
+                self.exclusion_list,
+                self.get_parsing_record_type(),
+            )
+        return self._transformer_version
 
     @property
-    def exclusion_list(self) -> list[str] | None:
+    def exclusion_list(self) -> ExclusionList | None:
         if self.exclusion_list_path and self._exclusion_list is None:
             self._exclusion_list = self.load_exclusion_list()
         return self._exclusion_list
 
-    def load_exclusion_list(self) -> list[str]:
+    def load_exclusion_list(self) -> ExclusionList:
         """
-        Load a CSV file from path (S3 or local filesystem) and return values as a list.
+        Load the exclusion list from path (S3 or local filesystem).
 
-        CSV file has no headers and contains identifiers to exclude, one per line.
-
-        Args:
-            exclusion_list_path: Path to exclusion list file (s3://bucket/key or local
-            path).
+        See ExclusionList.load() for the expected file format.
 
         Raises:
             On error loading or parsing the file, raises CriticalError which will
             terminate the run.
         """
-        try:
-            with smart_open.open(self.exclusion_list_path, "r") as exclusion_list:
-                rows = exclusion_list.readlines()
-            exclusion_list = [row.strip() for row in rows if row.strip()]
-        except Exception as exc:
-            raise CriticalError(f"Could not load exclusion list: {exc}") from exc
-
-        logger.info(
-            f"Loaded exclusion list from {self.exclusion_list_path} with "
-            f"{len(exclusion_list)} entries"
-        )
-        return exclusion_list
+        return ExclusionList.load(self.exclusion_list_path)  # type: ignore[arg-type]
 
     @final
     def __iter__(self) -> Iterator[DatasetRecord]:
@@ -131,55 +279,347 @@ class Transformer(ABC):
     @final
     def __next__(self) -> DatasetRecord:
         """Return next transformed record."""
-        while True:
-            transformed_record = None
-            timdex_record_id = None
+        try:
+            if self.workers > 1:
+                if self._parallel_dataset_records is None:
+                    self._parallel_dataset_records = self._transform_in_worker_processes()
+                dataset_record = next(self._parallel_dataset_records)
+                self.processed_record_count += 1
+            else:
+                source_record = next(self.source_records)
+                while isinstance(source_record, SourceFile | UnchangedSourceRecord):
+                    if isinstance(source_record, SourceFile):
+                        self.start_source_file(source_record)
+                    else:
+                        self.processed_record_count += 1
+                        self.unchanged_record_count += 1
+                    source_record = next(self.source_records)
+                self.processed_record_count += 1
+                if isinstance(source_record, SourceRecord):
+                    dataset_record = self.get_cached_dataset_record(
+                        source_record.raw, self.run_record_offset
+                    ) or self.transform_source_record(
+                        source_record.record,
+                        self.run_record_offset,
+                        source_record.raw,
+                    )
+                else:
+                    dataset_record = self.transform_source_record(
+                        source_record,  # type: ignore[arg-type]
+                        self.run_record_offset,
+                    )
+        except StopIteration:
+            self.close_deleted_records_file()
+            if self.transformed_record_cache is not None:
+                self.transformed_record_cache.close()
+            raise
+        self._count_dataset_record(dataset_record)
+        return dataset_record
 
-            source_record = next(self.source_records)
-            self.processed_record_count += 1
+    def start_source_file(self, source_file: SourceFile) -> None:
+        """Set the run data and record offsets for the records of the next source file.
 
-            try:
-                transformed_record = self.transform(source_record)
-                timdex_record_id = transformed_record.timdex_record_id
-                transformed_record.timdex_provenance = timdex.TimdexProvenance(
-                    source=self.run_data["source"],
-                    run_date=self.run_data["run_date"],
-                    run_id=self.run_data["run_id"],
-                    run_record_offset=self.run_record_offset,
+        Args:
+            source_file: Marker preceding the records of the file.
+        """
+        logger.info("Transforming source file %s", source_file.path)
+        self.source_file = source_file.path
+        self.run_data = source_file.run_data
+        self._source_file_start_count = (
+            self.processed_record_count - source_file.first_run_record_offset
+        )
+
+    @final
+    def transform_source_record(
+        self,
+        source_record: dict[str, JSON] | Tag,
+        run_record_offset: int,
+        raw_source_record: bytes | None = None,
+    ) -> DatasetRecord:
+        """Transform a single source record into a DatasetRecord.
+
+        Record counts are not updated, allowing this method to be called from worker
+        processes; see _count_dataset_record().
+
+        May not be overridden.
+
+        Args:
+            source_record: A single source record.
+            run_record_offset: Position of the source record in the run.
+            raw_source_record: Raw bytes the source record was parsed from, written as
+                the DatasetRecord's source record if set.
+        """
+        from timdex_dataset_api import (  # type: ignore[import-untyped, import-not-found]  # noqa: PLC0415
+            DatasetRecord,
+        )
+
+        transformed_record = None
+        timdex_record_id = None
+
+        try:
+            transformed_record = self.transform(source_record)
+            timdex_record_id = transformed_record.timdex_record_id
+            transformed_record.timdex_provenance = timdex.TimdexProvenance(
+                source=self.run_data["source"],
+                run_date=self.run_data["run_date"],
+                run_id=self.run_data["run_id"],
+                run_record_offset=run_record_offset,
+            )
+            action = "index"
+
+        except DeletedRecordEvent as error:
+            timdex_record_id = error.timdex_record_id
+            action = "delete"
+
+        except SkippedRecordEvent:
+            action = "skip"
+
+        except CriticalError:
+            raise
+
+        except Exception as exception:
+            message = f"Unhandled exception during record transformation: {exception}"
+            logger.exception(message)
+            action = "error"
+
+        serialized_source_record: bytes | None
+        if raw_source_record is not None:
+            serialized_source_record = raw_source_record
+        else:
+            with self.measure("serialize_source_record"):
+                serialized_source_record = self.serialize_source_record(source_record)
+        with self.measure("serialize_transformed_record"):
+            serialized_transformed_record = self.serialize_transformed_record(
+                transformed_record
+            )
+        if (
+            self.transformed_record_cache is not None
+            and raw_source_record is not None
+            and action in {"index", "delete"}
+        ):
+            self.transformed_record_cache.put(
+                self.source,
+                self.transformer_version,
+                raw_source_record,
+                timdex_record_id,
+                action,
+                serialized_transformed_record
+                and remove_timdex_provenance(serialized_transformed_record),
+            )
+
+        return DatasetRecord(
+            timdex_record_id=timdex_record_id,
+            source_record=serialized_source_record,
+            transformed_record=serialized_transformed_record,
+            action=action,
+            run_record_offset=run_record_offset,
+            **self.run_data,
+        )
+
+    def get_cached_dataset_record(
+        self, raw_source_record: bytes | None, run_record_offset: int
+    ) -> DatasetRecord | None:
+        """Return a DatasetRecord from the transformed record cache, if cached.
+
+        The cached transformed record is given the provenance of this run.
+
+        Args:
+            raw_source_record: Raw bytes of the source record.
+            run_record_offset: Position of the source record in the run.
+        """
+        if self.transformed_record_cache is None or raw_source_record is None:
+            return None
+        from timdex_dataset_api import (  # type: ignore[import-untyped, import-not-found]  # noqa: PLC0415
+            DatasetRecord,
+        )
+
+        with self.measure("get_cached_dataset_record"):
+            cached = self.transformed_record_cache.get(
+                self.source, self.transformer_version, raw_source_record
+            )
+            if cached is None:
+                return None
+            timdex_record_id, action, transformed_record = cached
+            if transformed_record is not None:
+                transformed_record = add_timdex_provenance(
+                    transformed_record,
+                    timdex.TimdexProvenance(
+                        source=self.run_data["source"],
+                        run_date=self.run_data["run_date"],
+                        run_id=self.run_data["run_id"],
+                        run_record_offset=run_record_offset,
+                    ),
                 )
-                self.transformed_record_count += 1
-                action = "index"
+        return DatasetRecord(
+            timdex_record_id=timdex_record_id,
+            source_record=raw_source_record,
+            transformed_record=transformed_record,
+            action=action,
+            run_record_offset=run_record_offset,
+            **self.run_data,
+        )
 
-            except DeletedRecordEvent as error:
-                self.deleted_records.append(error.timdex_record_id)
-                timdex_record_id = error.timdex_record_id
-                action = "delete"
+    def measure(self, method_name: str) -> AbstractContextManager[None]:
+        """Return a context that records time spent in a method, if profiling.
 
-            except SkippedRecordEvent:
+        Args:
+            method_name: Name of the method being measured.
+        """
+        if self.profiler is None:
+            return NOT_PROFILED
+        return self.profiler.measure(method_name)
+
+    def _count_dataset_record(self, dataset_record: DatasetRecord) -> None:
+        """Update record counts based on the action of a DatasetRecord."""
+        match dataset_record.action:
+            case "index":
+                self.transformed_record_count += 1
+            case "delete":
+                self.deleted_record_count += 1
+                if self.deleted_records_path:
+                    self._write_deleted_record(
+                        self.deleted_records_path, dataset_record.timdex_record_id
+                    )
+            case "skip":
                 self.skipped_record_count += 1
-                action = "skip"
+            case "error":
+                self.error_record_count += 1
 
-            except CriticalError:
-                raise
+    def _write_deleted_record(
+        self, deleted_records_path: str, timdex_record_id: str
+    ) -> None:
+        """Append the TIMDEX record id of a deleted record to the deleted records file.
 
-            except Exception as exception:
-                self.error_record_count += 1
-                message = f"Unhandled exception during record transformation: {exception}"
-                logger.exception(message)
-                action = "error"
-
-            return DatasetRecord(
-                timdex_record_id=timdex_record_id,
-                source_record=self.serialize_source_record(source_record),
-                transformed_record=(
-                    json.dumps(transformed_record.asdict()).encode()
-                    if transformed_record
-                    else None
-                ),
-                action=action,
-                run_record_offset=self.run_record_offset,
-                **self.run_data,
+        The file is opened on the first deleted record, and ids are streamed to it so
+        memory use does not grow with the number of deleted records.
+        """
+        if self._deleted_records_file is None:
+            self._deleted_records_file = self._open_deleted_records_file(
+                deleted_records_path
+            )
+        self._deleted_records_file.write(f"{timdex_record_id}\n")
+
+    def _open_deleted_records_file(self, deleted_records_path: str) -> IO[str]:
+        """Open the deleted records file, writing ids deleted by any resumed runs.
+
+        A resumed run rewrites the file, rather than appending to it, because S3 and
+        compressed files cannot be appended to.  The ids of deleted records written to
+        the dataset before the checkpoint are written first, so the file has every
+        deleted record of the run.
+        """
+        import smart_open  # type: ignore[import-untyped]  # noqa: PLC0415
+
+        try:
+            deleted_records_file = smart_open.open(deleted_records_path, "w")
+        except Exception as exc:
+            raise CriticalError(f"Could not open deleted records file: {exc}") from exc
+        deleted_records_file.writelines(
+            f"{timdex_record_id}\n"
+            for timdex_record_id in self.resumed_deleted_record_ids
+        )
+        return deleted_records_file
+
+    def close_deleted_records_file(self) -> None:
+        """Close the deleted records file, if configured.
+
+        Called when all source records have been transformed.  If there were no deleted
+        records, an empty file, or a file with the ids deleted by any resumed runs, is
+        written so the file always exists for the run.
+        """
+        if not self.deleted_records_path or self._deleted_records_file_closed:
+            return
+        if self._deleted_records_file is None:
+            self._deleted_records_file = self._open_deleted_records_file(
+                self.deleted_records_path
             )
+        self._deleted_records_file.close()
+        self._deleted_records_file = None
+        self._deleted_records_file_closed = True
+        logger.info(
+            "Wrote %d deleted record id(s) to %s",
+            len(self.resumed_deleted_record_ids) + self.deleted_record_count,
+            self.deleted_records_path,
+        )
+
+    def _transform_in_worker_processes(self) -> Iterator[DatasetRecord]:
+        """Transform unparsed source records in a pool of worker processes.
+
+        Source records are sent to workers in chunks along with their run record offset
+        and the run data of their source file, see chunk_source_records().  Each worker
+        parses and transforms its chunk with its own copy of this transformer, and
+        DatasetRecords are yielded in the original record order.  If
+        profiling, the timings of each chunk are merged into this transformer's profiler,
+        and if caching transformed records, the cache hits and misses of each chunk
+        are added to this transformer's cache.  The date cache hits and misses of each
+        chunk are added to worker_date_cache_hits and worker_date_cache_misses.
+        """
+        # load the exclusion list, and version of the transformer if caching
+        # transformed records, once, to be sent to workers with this transformer
+        _ = self.exclusion_list
+        if self.transformed_record_cache is not None:
+            _ = self.transformer_version
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_transform_worker,
+            initargs=(
+                self,
+                self.get_parsing_record_type(),
+                logging.getLogger().getEffectiveLevel(),
+            ),
+        ) as executor:
+            # source records are unparsed records from read_source_file() here
+            for (
+                dataset_records,
+                chunk_profiler,
+                chunk_cache_counts,
+                chunk_date_cache_counts,
+            ) in map_in_order(
+                executor,
+                _transform_in_worker,  # type: ignore[arg-type]
+                self.chunk_source_records(),
+                self.workers * 2,
+            ):
+                if self.profiler is not None and chunk_profiler is not None:
+                    self.profiler.merge(chunk_profiler)
+                if self.transformed_record_cache is not None:
+                    self.transformed_record_cache.hits += chunk_cache_counts[0]
+                    self.transformed_record_cache.misses += chunk_cache_counts[1]
+                self.worker_date_cache_hits += chunk_date_cache_counts[0]
+                self.worker_date_cache_misses += chunk_date_cache_counts[1]
+                yield from dataset_records
+
+    def chunk_source_records(
+        self,
+    ) -> Iterator[tuple[dict, tuple[tuple[int, bytes | str | JSON], ...]]]:
+        """Group unparsed source records into chunks to transform in worker processes.
+
+        Yields the run data of each chunk with tuples of run record offset and source
+        record.  A chunk only contains records of a single source file.  Unchanged
+        source records are counted here, and not sent to workers.
+        """
+        chunk: list[tuple[int, bytes | str | JSON]] = []
+        run_record_offset = 0
+        for source_record in self.source_records:
+            if isinstance(source_record, SourceFile):
+                if chunk:
+                    yield self.run_data, tuple(chunk)
+                    chunk = []
+                self.start_source_file(source_record)
+                run_record_offset = source_record.first_run_record_offset
+                continue
+            if isinstance(source_record, UnchangedSourceRecord):
+                self.processed_record_count += 1
+                self.unchanged_record_count += 1
+                run_record_offset += 1
+                continue
+            chunk.append((run_record_offset, source_record))  # type: ignore[arg-type]
+            run_record_offset += 1
+            if len(chunk) == PARALLEL_TRANSFORM_CHUNK_SIZE:
+                yield self.run_data, tuple(chunk)
+                chunk = []
+        if chunk:
+            yield self.run_data, tuple(chunk)
 
     @final
     @classmethod
@@ -202,31 +642,217 @@ class Transformer(ABC):
     def load(
         cls,
         source: str,
-        source_file: str,
+        source_file: str | list[str],
         exclusion_list_path: str | None = None,
         run_id: str | None = None,
         run_timestamp: str | None = None,
+        workers: int = 1,
+        deleted_records_path: str | None = None,
+        profiler: FieldProfiler | None = None,
+        checkpoint_path: str | None = None,
+        source_record_hashes: SourceRecordHashes | None = None,
+        transformed_record_cache: TransformedRecordCache | None = None,
+        validation_mode: ValidationMode = "full",
+        *,
+        resume: bool = False,
     ) -> Transformer:
         """
         Instantiate specified transformer class and populate with source records.
 
+        If a list of source files is passed, the records of every file are transformed
+        by one transformer, see read_source_files().
+
+        If checkpoint_path is set, a Checkpoint with the position of the next record to
+        transform is written to it after each batch is passed to the TIMDEX dataset
+        writer.  If resume is also set, the run continues from the checkpoint already
+        at checkpoint_path, if there is one: records before its position are skipped
+        without being transformed, and records are written with its run id and run
+        timestamp.  Source files are still read from the start of the file with the
+        next record.
+
         Args:
             source: Source repository label. Must match a source key from config.SOURCES.
-            source_file: A file containing source records to be transformed.
+            source_file: A file, or list of files, containing source records to be
+                transformed.
             exclusion_list_path: CSV filepath to use for explicitly skipping records.
             run_id: A unique identifier associated with this ETL run.
             run_timestamp: A timestamp associated with this ETL run.
+            workers: Number of processes used to transform records.
+            deleted_records_path: Filepath to write deleted TIMDEX record ids to.
+            profiler: If set, time spent in each field method is recorded.
+            checkpoint_path: Filepath to write a Checkpoint to after each batch.
+            source_record_hashes: If set, source records already indexed with the same
+                raw bytes are skipped, see SourceRecordHashes.
+            transformed_record_cache: If set, transformed records are cached, see
+                TransformedRecordCache.
+            validation_mode: How TimdexRecords are validated, see transform().
+            resume: If True, resume from the Checkpoint at checkpoint_path.
         """
         transformer_class = cls.get_transformer(source)
-        source_records = transformer_class.parse_source_file(source_file)
-        return transformer_class(
+        source_files = [source_file] if isinstance(source_file, str) else source_file
+        checkpoint = None
+        if resume and checkpoint_path:
+            checkpoint = Checkpoint.load(checkpoint_path)
+        if checkpoint:
+            checkpoint.validate(source, source_files, run_id, run_timestamp)
+            run_id = checkpoint.run_id
+            run_timestamp = checkpoint.run_timestamp
+            logger.info(
+                "Resuming run %s from source file %s at run record offset %d",
+                run_id,
+                source_files[checkpoint.source_file_index],
+                checkpoint.run_record_offset,
+            )
+        transformer = transformer_class(
             source,
-            source_records,
+            iter(()),
             exclusion_list_path,
-            source_file=source_file,
+            source_file=source_files[checkpoint.source_file_index if checkpoint else 0],
             run_id=run_id,
             run_timestamp=run_timestamp,
+            workers=workers,
+            deleted_records_path=deleted_records_path,
+            profiler=profiler,
+            checkpoint_path=checkpoint_path,
+            source_record_hashes=source_record_hashes,
+            transformed_record_cache=transformed_record_cache,
+            validation_mode=validation_mode,
+        )
+        if checkpoint:
+            transformer.resumed_record_count = checkpoint.written_record_count
+            if deleted_records_path:
+                transformer.resumed_deleted_record_ids = (
+                    checkpoint.load_deleted_record_ids()
+                )
+            transformer.source_records = transformer.read_source_files(
+                source_files,
+                checkpoint.source_file_index,
+                checkpoint.run_record_offset,
+                checkpoint.source_file_run_record_offset,
+            )
+        else:
+            transformer.source_records = transformer.read_source_files(source_files)
+        return transformer
+
+    def read_source_files(
+        self,
+        source_files: list[str],
+        start_source_file_index: int = 0,
+        start_run_record_offset: int = 0,
+        start_source_file_run_record_offset: int = 0,
+    ) -> Iterator[bytes | str | JSON | SourceRecord | SourceFile | UnchangedSourceRecord]:
+        """Read the source records of one or more files, in order.
+
+        Records are unparsed if workers is greater than 1, and otherwise parsed along
+        with their raw bytes.  The records of each file after the first are preceded by
+        a SourceFile with the file's run data, which shares the run id and run timestamp
+        of the first file.  Each file keeps the run type and run date of its own name,
+        and run record offsets continue from one file to the next.
+
+        When resuming from a checkpoint, reading starts at a run record offset of one of
+        the files, and earlier records of the file are skipped by read_source_file()
+        without being transformed.  XML files are still iterparsed from their start.
+
+        If source_record_hashes is set, records with raw bytes already indexed are
+        replaced by UNCHANGED_SOURCE_RECORD before they are parsed.  The first record
+        of each file, and the first record after any unchanged records, are added to
+        source_file_positions for writing checkpoints, as records written to the
+        dataset are then no longer consecutive records of the file.
+
+        Args:
+            source_files: Files containing source records to be transformed.
+            start_source_file_index: Index of the file to start reading from.
+            start_run_record_offset: Run record offset of the first record to read
+                from the start file.
+            start_source_file_run_record_offset: Run record offset of the first record
+                of the start file.
+        """
+        self.source_files = source_files
+        records_read = 0
+        source_file_run_record_offset = start_source_file_run_record_offset
+        for index in range(start_source_file_index, len(source_files)):
+            source_file = source_files[index]
+            run_record_offset = (
+                start_run_record_offset
+                if index == start_source_file_index
+                else source_file_run_record_offset
+            )
+            # number of records at the start of the file to skip
+            start = run_record_offset - source_file_run_record_offset
+            if index > start_source_file_index or run_record_offset:
+                yield SourceFile(
+                    source_file,
+                    self.get_run_data(
+                        source_file,
+                        run_id=self.run_data["run_id"],
+                        run_timestamp=self.run_data["run_timestamp"],
+                    ),
+                    run_record_offset,
+                )
+            self.source_file_positions.add(
+                records_read, index, source_file_run_record_offset, run_record_offset
+            )
+            source_records: Iterator[
+                bytes | str | JSON | SourceRecord | UnchangedSourceRecord
+            ]
+            if self.source_record_hashes is not None:
+                source_records = self.read_changed_source_records(source_file, start)
+            elif self.workers > 1:
+                source_records = self.read_source_file(source_file, start)
+            else:
+                source_records = self.parse_source_file_with_raw(source_file, start)
+            follows_unchanged = False
+            for source_record in source_records:
+                run_record_offset += 1
+                if source_record is UNCHANGED_SOURCE_RECORD:
+                    follows_unchanged = True
+                elif follows_unchanged:
+                    self.source_file_positions.add(
+                        records_read,
+                        index,
+                        source_file_run_record_offset,
+                        run_record_offset - 1,
+                    )
+                    follows_unchanged = False
+                    records_read += 1
+                else:
+                    records_read += 1
+                yield source_record
+            source_file_run_record_offset = run_record_offset
+
+    def read_changed_source_records(
+        self, source_file: str, start: int = 0
+    ) -> Iterator[bytes | str | JSON | SourceRecord | UnchangedSourceRecord]:
+        """Read the source records of a file, replacing unchanged records by a marker.
+
+        Records are unparsed if workers is greater than 1, and otherwise parsed along
+        with their raw bytes by parse_source_records_with_raw(), which only receives
+        changed records.
+
+        Args:
+            source_file: A file containing source records to be transformed.
+            start: Number of records at the start of the file to skip.
+        """
+        source_record_hashes = self.source_record_hashes
+        checked_records, changed_checked_records = tee(
+            (
+                source_record,
+                self.get_raw_source_record(source_record) in source_record_hashes,  # type: ignore[operator]
+            )
+            for source_record in self.read_source_file(source_file, start)
+        )
+        changed_records: Iterator[bytes | str | JSON | SourceRecord] = (
+            source_record
+            for source_record, is_unchanged in changed_checked_records
+            if not is_unchanged
         )
+        if self.workers <= 1:
+            changed_records = self.parse_source_records_with_raw(changed_records)  # type: ignore[arg-type]
+        for _, is_unchanged in checked_records:
+            if is_unchanged:
+                yield UNCHANGED_SOURCE_RECORD
+            else:
+                yield next(changed_records)
 
     @staticmethod
     def get_run_data(
@@ -325,13 +951,27 @@ class Transformer(ABC):
 
         return run_data
 
-    def serialize_source_record(self, source_record: Tag | dict) -> bytes | None:
-        if isinstance(source_record, Tag):
-            return source_record.encode()
+    def get_parsing_record_type(self) -> RecordType | None:
+        """Return the XML record type configured for parsing, for worker processes.
+
+        Returns None for transformers that do not parse XML.
+        """
+        return None
+
+    def serialize_source_record(
+        self, source_record: Tag | LxmlTag | dict
+    ) -> bytes | None:
         if isinstance(source_record, dict):
             return json.dumps(source_record).encode()
         return None
 
+    def serialize_transformed_record(
+        self, transformed_record: timdex.TimdexRecord | None
+    ) -> bytes | None:
+        if transformed_record is None:
+            return None
+        return transformed_record.to_json_bytes()
+
     @final
     def transform(self, source_record: dict[str, JSON] | Tag) -> timdex.TimdexRecord:
         """
@@ -344,6 +984,12 @@ class Transformer(ABC):
         After optional fields are set, derived fields are generated from the required
         optional field values set by the source transformer.
 
+        If validation_mode is 'record', TIMDEX objects are not validated as they are
+        created and assigned, but the TimdexRecord is validated once by
+        models.validate_timdex_record(), which raises the same exceptions, before
+        derived fields are generated.  Derived fields are validated as they are set in
+        either mode.
+
         May not be overridden.
 
         Args:
@@ -357,20 +1003,42 @@ class Transformer(ABC):
             logger.debug(f"Record ID {source_record_id} is excluded, skipping.")
             raise SkippedRecordEvent(source_record_id)
 
-        timdex_record = timdex.TimdexRecord(
-            source=self.source_name,
-            source_link=self.get_source_link(source_record),
-            timdex_record_id=self.get_timdex_record_id(source_record),
-            title=self.get_valid_title(source_record),
-        )
+        # in 'record' mode, attrs validators are disabled while fields are set, and the
+        # record is validated once before derived fields are generated from it
+        with (
+            attrs.validators.disabled()
+            if self.validation_mode == "record"
+            else nullcontext()
+        ):
+            timdex_record = timdex.TimdexRecord(
+                source=self.source_name,
+                source_link=self.get_source_link(source_record),
+                timdex_record_id=self.get_timdex_record_id(source_record),
+                title=self._get_measured_valid_title(source_record),
+            )
+
+            for field_name, field_method in self.get_optional_field_methods():
+                with self.measure(field_method.__name__):
+                    setattr(timdex_record, field_name, field_method(source_record))
 
-        for field_name, field_method in self.get_optional_field_methods():
-            setattr(timdex_record, field_name, field_method(source_record))
+        if self.validation_mode == "record":
+            with self.measure("validate_timdex_record"):
+                timdex.validate_timdex_record(timdex_record)
 
-        self.generate_derived_fields(timdex_record)
+        with self.measure("generate_derived_fields"):
+            self.generate_derived_fields(timdex_record)
 
         return timdex_record
 
+    def _get_measured_valid_title(self, source_record: dict[str, JSON] | Tag) -> str:
+        """Return get_valid_title() of a source record, measured if profiling.
+
+        Called for the title argument of TimdexRecord, so the title is retrieved after
+        the source link and TIMDEX record id, as their exceptions take precedence.
+        """
+        with self.measure("get_valid_title"):
+            return self.get_valid_title(source_record)
+
     def record_is_excluded(self, _source_record: dict[str, JSON] | Tag) -> bool:
         """
         Determine whether a source record should be excluded.
@@ -380,10 +1048,137 @@ class Transformer(ABC):
         """
         return False
 
-    def write_to_parquet_dataset(self, dataset_location: str) -> list:
-        """Write output to TIMDEX dataset."""
+    def write_to_parquet_dataset(
+        self,
+        dataset_location: str,
+        batch_rows: int = PARQUET_DATASET_BATCH_ROWS,
+        batch_bytes: int = PARQUET_DATASET_BATCH_BYTES,
+        *,
+        pipeline: bool = False,
+    ) -> list:
+        """Write output to TIMDEX dataset in batches.
+
+        Transformed records are collected into batches, each passed to the dataset
+        writer once it reaches batch_rows records or batch_bytes bytes of source and
+        transformed records, whichever comes first.  Sizing batches by bytes bounds the
+        memory used by sources with large records, e.g. libguides HTML, while sources
+        with small records are checkpointed in fewer, larger batches.  All batches are
+        written by a single call of the dataset's write, see _write_batches().
+
+        If pipeline is True, reading source records, transforming them, and writing
+        batches run as three stages in separate threads connected by bounded queues, so
+        reading from S3, transforming, and parquet writing overlap.  Up to
+        PIPELINE_READ_AHEAD source records are read ahead of the transform stage, and
+        the next batch is transformed while the previous batch is written.
+
+        The deleted records file is closed when writing ends, including when an
+        exception is raised, so a compressed or S3 file is complete and uploaded.
+
+        Args:
+            dataset_location: Location of the TIMDEX parquet dataset.
+            batch_rows: Maximum number of records in a batch.
+            batch_bytes: Maximum bytes of source and transformed records in a batch.
+            pipeline: If True, read, transform, and write in pipelined stages.
+        """
+        from timdex_dataset_api import (  # type: ignore[import-untyped, import-not-found]  # noqa: PLC0415
+            TIMDEXDataset,
+        )
+
         timdex_dataset = TIMDEXDataset(location=dataset_location)
-        return timdex_dataset.records.write(rows_iter=self)
+        batches = batch_dataset_records(self, batch_rows, batch_bytes)
+        try:
+            if not pipeline:
+                return self._write_batches(timdex_dataset, batches)
+
+            read_stage = prefetch(
+                self.source_records, PIPELINE_READ_AHEAD, "transform-pipeline-read"
+            )
+            self.source_records = read_stage
+            transform_stage = prefetch(batches, 1, "transform-pipeline-transform")
+            try:
+                return self._write_batches(timdex_dataset, transform_stage)
+            finally:
+                # stop the transform stage before the read stage it consumes from
+                transform_stage.close()
+                read_stage.close()
+        finally:
+            self.close_deleted_records_file()
+
+    def _write_batches(
+        self,
+        timdex_dataset: TIMDEXDataset,
+        batches: Iterator[tuple[list[DatasetRecord], int]],
+    ) -> list:
+        """Write batches of DatasetRecords to the dataset in a single write.
+
+        The records of every batch are passed to one call of the dataset's write, so
+        the dataset is not split into files and row groups of a batch each.  Once the
+        writer has consumed a batch, i.e. requests the record after it, the batch is
+        logged and a checkpoint written.
+        """
+        return timdex_dataset.records.write(rows_iter=self._batch_rows(batches))
+
+    def _batch_rows(
+        self, batches: Iterator[tuple[list[DatasetRecord], int]]
+    ) -> Iterator[DatasetRecord]:
+        """Yield the records of each batch, writing a checkpoint after each batch."""
+        records_written = 0
+        deleted_records_written = 0
+        batch_start_time = perf_counter()
+        for batch_number, (dataset_records, batch_size) in enumerate(batches, start=1):
+            with self.measure("write_dataset_batch"):
+                yield from dataset_records
+            records_written += len(dataset_records)
+            deleted_records_written += sum(
+                dataset_record.action == "delete" for dataset_record in dataset_records
+            )
+            if self.checkpoint_path:
+                self.write_checkpoint(
+                    self.checkpoint_path, records_written, deleted_records_written
+                )
+            elapsed_time = perf_counter() - batch_start_time
+            logger.info(
+                "Wrote batch %d: %d records, %.1f MB in %.2f seconds "
+                "(%.1f records/sec, %.2f MB/sec)",
+                batch_number,
+                len(dataset_records),
+                batch_size / 1_000_000,
+                elapsed_time,
+                len(dataset_records) / elapsed_time,
+                batch_size / 1_000_000 / elapsed_time,
+            )
+            batch_start_time = perf_counter()
+
+    def write_checkpoint(
+        self,
+        checkpoint_path: str,
+        records_written: int,
+        deleted_records_written: int = 0,
+    ) -> None:
+        """Write a Checkpoint with the position of the next record to transform.
+
+        Args:
+            checkpoint_path: S3 or local filepath to write the checkpoint to.
+            records_written: Number of records written to the dataset by this run.
+            deleted_records_written: Number of deleted records, of the records
+                written.
+        """
+        source_file_index, source_file_run_record_offset, run_record_offset = (
+            self.source_file_positions.position(records_written)
+        )
+        Checkpoint(
+            source=self.source,
+            source_files=self.source_files,
+            run_id=self.run_data["run_id"],
+            run_timestamp=self.run_data["run_timestamp"],
+            source_file_index=source_file_index,
+            source_file_run_record_offset=source_file_run_record_offset,
+            run_record_offset=run_record_offset,
+            written_record_count=self.resumed_record_count + records_written,
+            deleted_records_path=self.deleted_records_path,
+            deleted_record_count=len(self.resumed_deleted_record_ids)
+            + deleted_records_written,
+        ).write(checkpoint_path)
 
     @final
     def get_valid_title(self, source_record: dict[str, JSON] | Tag) -> str:
@@ -430,6 +1225,93 @@ class Transformer(ABC):
             source_file: A file containing source records to be transformed.
         """
 
+    @classmethod
+    def read_source_file(
+        cls, source_file: str, start: int = 0
+    ) -> Iterator[bytes | str | JSON]:
+        """
+        Read source file and return unparsed source records via an iterator.
+
+        Unparsed records are sent to worker processes when transforming with more
+        than one worker, and must be picklable.  Default behavior is to return the
+        parsed records from parse_source_file().
+
+        May be overridden by format subclasses, which should skip the first start
+        records without parsing them.
+
+        Args:
+            source_file: A file containing source records to be transformed.
+            start: Number of records at the start of the file to skip.
+        """
+        return islice(cls.parse_source_file(source_file), start, None)
+
+    @classmethod
+    def parse_source_record(
+        cls, source_record: bytes | str | JSON
+    ) -> dict[str, JSON] | Tag:
+        """
+        Parse a single unparsed source record returned by read_source_file().
+
+        May be overridden by format subclasses.
+
+        Args:
+            source_record: A single unparsed source record.
+        """
+        return source_record  # type: ignore[return-value]
+
+    @classmethod
+    def get_raw_source_record(cls, _source_record: bytes | str | JSON) -> bytes | None:
+        """
+        Return the raw bytes of an unparsed source record returned by read_source_file().
+
+        Default behavior is to return None, as unparsed records are not raw bytes unless
+        read_source_file() is overridden, and parsed records are serialized instead.
+
+        May be overridden by format subclasses.
+
+        Args:
+            source_record: A single unparsed source record.
+        """
+        return None
+
+    @classmethod
+    def parse_source_file_with_raw(
+        cls, source_file: str, start: int = 0
+    ) -> Iterator[SourceRecord]:
+        """
+        Parse source file and return source records with their raw bytes via an iterator.
+
+        Records returned by read_source_file() are parsed by
+        parse_source_records_with_raw().
+
+        May be overridden by format subclasses.
+
+        Args:
+            source_file: A file containing source records to be transformed.
+            start: Number of records at the start of the file to skip.
+        """
+        return cls.parse_source_records_with_raw(cls.read_source_file(source_file, start))
+
+    @classmethod
+    def parse_source_records_with_raw(
+        cls, source_records: Iterator[bytes | str | JSON]
+    ) -> Iterator[SourceRecord]:
+        """
+        Parse unparsed source records and return them with their raw bytes.
+
+        Default behavior is to parse each record with parse_source_record().
+
+        May be overridden by format subclasses.
+
+        Args:
+            source_records: Unparsed source records returned by read_source_file().
+        """
+        for source_record in source_records:
+            yield SourceRecord(
+                cls.parse_source_record(source_record),
+                cls.get_raw_source_record(source_record),
+            )
+
     @classmethod
     @abstractmethod
     def get_main_titles(cls, source_record: dict[str, JSON] | Tag) -> list[str]:
@@ -492,15 +1374,39 @@ class Transformer(ABC):
         """
 
     @final
-    def get_optional_field_methods(self) -> Iterator[tuple[str, Callable]]:
+    @classmethod
+    def get_optional_field_method_names(cls) -> tuple[tuple[str, str], ...]:
+        """
+        Return optional TIMDEX field names and names of the methods that set them.
+
+        Only fields with a get_<field name> method defined by the transformer class are
+        included.  The names are looked up once per class and cached.
+
+        May not be overridden.
+        """
+        if "_optional_field_method_names" not in cls.__dict__:
+            cls._optional_field_method_names = tuple(
+                (field_name, f"get_{field_name}")
+                for field_name in timdex.TimdexRecord.get_optional_field_names()
+                if getattr(cls, f"get_{field_name}", None)
+            )
+        return cls._optional_field_method_names
+
+    @final
+    def get_optional_field_methods(self) -> tuple[tuple[str, Callable], ...]:
         """
         Return optional TIMDEX field names and corresponding methods.
 
+        The bound methods are created on first use and reused for every record.
+
         May not be overridden.
         """
-        for field_name in timdex.TimdexRecord.get_optional_field_names():
-            if field_method := getattr(self, f"get_{field_name}", None):
-                yield field_name, field_method
+        if self._optional_field_methods is None:
+            self._optional_field_methods = tuple(
+                (field_name, getattr(self, method_name))
+                for field_name, method_name in self.get_optional_field_method_names()
+            )
+        return self._optional_field_methods
 
     @final
     def generate_derived_fields(
@@ -594,3 +1500,106 @@ class Transformer(ABC):
             for subject in spatial_subjects:
                 for place_name in subject.value:
                     yield timdex.Location(value=place_name, kind="Place Name")
+
+
+_worker_transformer: Transformer | None = None
+
+
+def _initialize_transform_worker(
+    transformer: Transformer,
+    record_type: RecordType | None,
+    log_level: int,
+) -> None:
+    """Set the transformer used by a worker process for the duration of a run.
+
+    Args:
+        transformer: A copy of the transformer being iterated in the parent process.
+        record_type: XML record type configured for the parent's parsing engine, or
+            None if the transformer does not parse XML.
+        log_level: Level of the parent's root logger.
+    """
+    global _worker_transformer  # noqa: PLW0603
+    configure_logger(logging.getLogger(), verbose=log_level <= logging.DEBUG)
+    if record_type is not None:
+        from transmogrifier.sources.xmlparsing import (  # noqa: PLC0415
+            configure_parsing_engine,
+        )
+
+        configure_parsing_engine(record_type=record_type)
+    transformer.workers = 1
+    _worker_transformer = transformer
+
+
+def _transform_in_worker(
+    chunk: tuple[dict, tuple[tuple[int, bytes | str | JSON], ...]],
+) -> tuple[list[DatasetRecord], FieldProfiler | None, tuple[int, int], tuple[int, int]]:
+    """Parse and transform a chunk of unparsed source records in a worker process.
+
+    Returns the DatasetRecords of the chunk, if profiling, a profiler with the timings
+    of the chunk only, the transformed record cache hits and misses of the chunk, and
+    the parse_date_from_string() cache hits and misses of the chunk.  Records found in
+    the transformed record cache are not parsed.
+
+    Args:
+        chunk: Run data of the chunk's source file, and tuples of run record offset
+            and unparsed source record.
+    """
+    transformer = _worker_transformer
+    if transformer is None:
+        message = "Transform worker process was not initialized"
+        raise RuntimeError(message)
+    transformer.run_data, chunk_records = chunk
+    if transformer.profiler is not None:
+        transformer.profiler = FieldProfiler()
+    cache = transformer.transformed_record_cache
+    cache_counts = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    date_cache_info = parse_date_from_string.cache_info()
+    dataset_records = []
+    for run_record_offset, source_record in chunk_records:
+        raw_source_record = transformer.get_raw_source_record(source_record)
+        dataset_record = transformer.get_cached_dataset_record(
+            raw_source_record, run_record_offset
+        ) or transformer.transform_source_record(
+            transformer.parse_source_record(source_record),
+            run_record_offset,
+            raw_source_record,
+        )
+        dataset_records.append(dataset_record)
+    if cache is not None:
+        cache.commit()
+        cache_counts = (cache.hits - cache_counts[0], cache.misses - cache_counts[1])
+    chunk_date_cache_info = parse_date_from_string.cache_info()
+    date_cache_counts = (
+        chunk_date_cache_info.hits - date_cache_info.hits,
+        chunk_date_cache_info.misses - date_cache_info.misses,
+    )
+    return dataset_records, transformer.profiler, cache_counts, date_cache_counts
+
+
+def batch_dataset_records(
+    dataset_records: Iterator[DatasetRecord], max_rows: int, max_bytes: int
+) -> Iterator[tuple[list[DatasetRecord], int]]:
+    """Group DatasetRecords into batches limited by record count and size in bytes.
+
+    Yields each batch with its size, the total bytes of its source and transformed
+    records.  A batch is yielded as soon as it reaches either limit, so a single record
+    larger than max_bytes is yielded as a batch of one.
+
+    Args:
+        dataset_records: DatasetRecords to batch, consumed lazily.
+        max_rows: Maximum number of records in a batch.
+        max_bytes: Maximum bytes of source and transformed records in a batch.
+    """
+    batch: list[DatasetRecord] = []
+    batch_size = 0
+    for dataset_record in dataset_records:
+        batch.append(dataset_record)
+        batch_size += len(dataset_record.source_record or b"") + len(
+            dataset_record.transformed_record or b""
+        )
+        if len(batch) >= max_rows or batch_size >= max_bytes:
+            yield batch, batch_size
+            batch = []
+            batch_size = 0
+    if batch:
+        yield batch, batch_size
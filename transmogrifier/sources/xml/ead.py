@@ -2,23 +2,25 @@ import logging
 import re
 from collections.abc import Generator
 
-from bs4 import NavigableString, Tag  # type: ignore[import-untyped]
+from bs4 import Tag  # type: ignore[import-untyped]
 
 import transmogrifier.models as timdex
-from transmogrifier.config import load_external_config
+from transmogrifier.config import ExternalConfig, load_json_config
 from transmogrifier.exceptions import SkippedRecordEvent
 from transmogrifier.helpers import validate_date, validate_date_range
+from transmogrifier.sources.lxmlrecord import LxmlTag
 from transmogrifier.sources.xmltransformer import XMLTransformer
 
 logger = logging.getLogger(__name__)
 
 
-aspace_type_crosswalk = load_external_config("config/aspace_type_crosswalk.json", "json")
-
-
 class Ead(XMLTransformer):
     """EAD transformer."""
 
+    aspace_type_crosswalk = ExternalConfig(
+        "config/aspace_type_crosswalk.json", load_json_config
+    )
+
     @classmethod
     def create_list_from_mixed_value(
         cls, xml_element: Tag, skipped_elements: list[str] | None = None
@@ -383,7 +385,7 @@ class Ead(XMLTransformer):
     def _get_note_kind(cls, note_element: Tag) -> str:
         if head_element := note_element.find("head", string=True):
             return str(head_element.string)
-        return aspace_type_crosswalk.get(note_element.name, note_element.name)
+        return cls.aspace_type_crosswalk.get(note_element.name, note_element.name)
 
     @classmethod
     def get_physical_description(cls, source_record: Tag) -> str | None:
@@ -430,7 +432,7 @@ class Ead(XMLTransformer):
                 related_items.append(
                     timdex.RelatedItem(
                         description=related_item,
-                        relationship=aspace_type_crosswalk.get(
+                        relationship=cls.aspace_type_crosswalk.get(
                             related_item_element.name, related_item_element.name
                         ),
                     )
@@ -462,7 +464,9 @@ class Ead(XMLTransformer):
         return [
             timdex.Rights(
                 description=rights,
-                kind=aspace_type_crosswalk.get(rights_element.name, rights_element.name),
+                kind=cls.aspace_type_crosswalk.get(
+                    rights_element.name, rights_element.name
+                ),
             )
             for rights_element in collection_description.find_all(
                 ["accessrestrict", "userestrict"], recursive=False
@@ -482,7 +486,7 @@ class Ead(XMLTransformer):
                 [
                     timdex.Subject(
                         value=[subject_value],
-                        kind=aspace_type_crosswalk.get(
+                        kind=cls.aspace_type_crosswalk.get(
                             subject_element.get("source"), subject_element.get("source")
                         )
                         or None,
@@ -565,7 +569,7 @@ class Ead(XMLTransformer):
     @classmethod
     def parse_mixed_value(
         cls,
-        item: NavigableString | Tag,
+        item: str | Tag | LxmlTag,
         skipped_elements: list[str] | None = None,
     ) -> Generator:
         """
@@ -573,15 +577,16 @@ class Ead(XMLTransformer):
         Recursive given the unpredictable structure of EAD values.
 
         Args:
-            item: An item in a mixed value that may be a BeautifulSoup NavigableString or
-            Tag.
+            item: An item in a mixed value that may be a string (including a
+            BeautifulSoup NavigableString) or an element (a BeautifulSoup Tag or
+            LxmlTag).
             skipped_elements: Elements that should be skipped when parsing the mixed
             value.
         """
         if skipped_elements is None:
             skipped_elements = []
-        if isinstance(item, NavigableString) and item.strip():
+        if isinstance(item, str) and item.strip():
             yield str(item.strip())
-        elif isinstance(item, Tag) and item.name not in skipped_elements:
+        elif isinstance(item, Tag | LxmlTag) and item.name not in skipped_elements:
             for child in item.children:
                 yield from cls.parse_mixed_value(child, skipped_elements)
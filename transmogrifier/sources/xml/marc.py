@@ -5,7 +5,11 @@ from collections.abc import Iterator
 from bs4 import Tag  # type: ignore[import-untyped]
 
 import transmogrifier.models as timdex
-from transmogrifier.config import load_external_config
+from transmogrifier.config import (
+    ExternalConfig,
+    load_json_config,
+    load_loc_code_crosswalk,
+)
 from transmogrifier.exceptions import SkippedRecordEvent
 from transmogrifier.helpers import validate_date
 from transmogrifier.sources.xmltransformer import XMLTransformer
@@ -13,24 +17,123 @@ from transmogrifier.sources.xmltransformer import XMLTransformer
 logger = logging.getLogger(__name__)
 
 
+class MarcRecordIndex:
+    """Control fields, datafields, and subfields of a single MARC record.
+
+    Marc field methods look up datafields by tag dozens of times per record.  This index
+    is built with a single pass over the record, so that each lookup reads a list instead
+    of searching the record again.
+
+    Attributes:
+        source_record: The indexed MARC XML record.
+        controlfields: The first control field with a string value, keyed by tag.
+        datafields: Datafields in record order, keyed by tag.
+        subfields: (name, code, string value) of each subfield with a string value,
+            keyed by the id() of a datafield in 'datafields'.
+    """
+
+    __slots__ = ("controlfields", "datafields", "source_record", "subfields")
+
+    def __init__(self, source_record: Tag) -> None:
+        self.source_record = source_record
+        self.controlfields: dict[str, Tag] = {}
+        self.datafields: defaultdict[str, list[Tag]] = defaultdict(list)
+        self.subfields: dict[int, list[tuple[str, str, str]]] = {}
+        for controlfield in source_record.find_all("controlfield", string=True):
+            self.controlfields.setdefault(controlfield.get("tag"), controlfield)
+        for datafield in source_record.find_all("datafield"):
+            self.datafields[datafield.get("tag")].append(datafield)
+            self.subfields[id(datafield)] = [
+                (subfield.name, subfield.get("code", ""), str(subfield.string))
+                for subfield in datafield.find_all(name=True, string=True)
+            ]
+
+
 class Marc(XMLTransformer):
     """Marc transformer."""
 
-    country_code_crosswalk = load_external_config("config/loc-countries.xml", "xml")
-    holdings_collection_crosswalk = load_external_config(
-        "config/holdings_collection_crosswalk.json", "json"
+    # index of the most recently transformed record, see get_record_index()
+    _record_index: MarcRecordIndex | None = None
+
+    # crosswalks are loaded when first used, see ExternalConfig
+    country_code_crosswalk = ExternalConfig(
+        "config/loc-countries.xml", load_loc_code_crosswalk
+    )
+    holdings_collection_crosswalk = ExternalConfig(
+        "config/holdings_collection_crosswalk.json", load_json_config
+    )
+    holdings_format_crosswalk = ExternalConfig(
+        "config/holdings_format_crosswalk.json", load_json_config
     )
-    holdings_format_crosswalk = load_external_config(
-        "config/holdings_format_crosswalk.json", "json"
+    holdings_location_crosswalk = ExternalConfig(
+        "config/holdings_location_crosswalk.json", load_json_config
     )
-    holdings_location_crosswalk = load_external_config(
-        "config/holdings_location_crosswalk.json", "json"
+    language_code_crosswalk = ExternalConfig(
+        "config/loc-languages.xml", load_loc_code_crosswalk
     )
-    language_code_crosswalk = load_external_config("config/loc-languages.xml", "xml")
-    marc_content_type_crosswalk = load_external_config(
-        "config/marc_content_type_crosswalk.json", "json"
+    marc_content_type_crosswalk = ExternalConfig(
+        "config/marc_content_type_crosswalk.json", load_json_config
     )
 
+    @staticmethod
+    def get_record_index(source_record: Tag) -> MarcRecordIndex:
+        """
+        Get the index of a MARC XML record, building it on first use.
+
+        Only the index of the most recent record is kept, as all field methods for a
+        record are called before the next record is transformed.
+
+        Args:
+            source_record: A BeautifulSoup Tag representing a single MARC XML record.
+        """
+        record_index = Marc._record_index
+        if record_index is None or record_index.source_record is not source_record:
+            record_index = Marc._record_index = MarcRecordIndex(source_record)
+        return record_index
+
+    @classmethod
+    def get_datafields(
+        cls, source_record: Tag, tag: str, **attributes: str | list[str]
+    ) -> list[Tag]:
+        """
+        Get the datafields of a MARC XML record with a specified tag.
+
+        Equivalent to source_record.find_all("datafield", tag=tag, **attributes), but
+        read from the record index.
+
+        Args:
+            source_record: A BeautifulSoup Tag representing a single MARC XML record.
+            tag: Variable data field tag which is denoted in the "tag" attribute of a
+                MARC 'datafield' XML element.
+            **attributes: Other attributes the datafields must have.  A list value
+                matches any of the values in the list.
+        """
+        datafields = cls.get_record_index(source_record).datafields.get(tag, [])
+        if not attributes:
+            return datafields
+        return [
+            datafield
+            for datafield in datafields
+            if all(
+                datafield.get(name) in value
+                if isinstance(value, list)
+                else datafield.get(name) == value
+                for name, value in attributes.items()
+            )
+        ]
+
+    @staticmethod
+    def _get_indexed_subfields(xml_element: Tag) -> list[tuple[str, str, str]]:
+        """Get (name, code, string value) of subfields, using the record index if able."""
+        if (record_index := Marc._record_index) and (
+            subfields := record_index.subfields.get(id(xml_element))
+        ) is not None:
+            return subfields
+        return [
+            (subfield.name, subfield.get("code", ""), str(subfield.string))
+            for subfield in xml_element.find_all(name=True, string=True)
+        ]
+
     @staticmethod
     def create_subfield_value_list_from_datafield(
         xml_element: Tag,
@@ -54,9 +157,9 @@ class Marc(XMLTransformer):
             subfield_codes: Subfield codes from which values are extracted.
         """
         return [
-            str(subfield.string)
-            for subfield in xml_element.find_all(name=True, string=True)
-            if subfield.get("code", "") in subfield_codes
+            value
+            for _, code, value in Marc._get_indexed_subfields(xml_element)
+            if code in subfield_codes
         ]
 
     @staticmethod
@@ -122,7 +225,7 @@ class Marc(XMLTransformer):
             cls.create_subfield_value_string_from_datafield(
                 datafield, subfield_codes, " "
             )
-            for datafield in source_record.find_all("datafield", tag=tag)
+            for datafield in cls.get_datafields(source_record, tag)
         )
 
     @staticmethod
@@ -143,8 +246,9 @@ class Marc(XMLTransformer):
                 and the value is not only whitespace, the string value is returned;
                 else None is returned.
         """
-        if subfield := xml_element.find("subfield", code=subfield_code, string=True):
-            return str(subfield.string).strip() or None
+        for name, code, value in Marc._get_indexed_subfields(xml_element):
+            if name == "subfield" and code == subfield_code:
+                return value.strip() or None
         return None
 
     @staticmethod
@@ -175,7 +279,7 @@ class Marc(XMLTransformer):
 
     @staticmethod
     def loc_crosswalk_code_to_name(
-        code: str, crosswalk: Tag, record_id: str, code_type: str
+        code: str, crosswalk: dict[str, tuple[str, bool]], record_id: str, code_type: str
     ) -> str | None:
         """
         Retrieve the name associated with a given code from a Library of Congress XML
@@ -184,7 +288,8 @@ class Marc(XMLTransformer):
 
         Args:
             code: The code from a MARC record.
-            crosswalk: The crosswalked bs4 Tag to use, loaded from a config file.
+            crosswalk: The crosswalk dict of code to (name, obsolete) to use, loaded from
+                a config file with load_loc_code_crosswalk().
             record_id: The MMS ID of the MARC record.
             code_type: The type of code, e.g. country or language.
 
@@ -192,17 +297,17 @@ class Marc(XMLTransformer):
             str | None: If a mapping for the code is found in the crosswalk, the
                 mapped value is returned; else None is returned.
         """
-        code_element = crosswalk.find("code", string=code)
-        if code_element is None:
+        if (crosswalk_entry := crosswalk.get(code)) is None:
             logger.debug(
                 "Record #%s uses an invalid %s code: %s", record_id, code_type, code
             )
             return None
-        if code_element.get("status") == "obsolete":
+        name, obsolete = crosswalk_entry
+        if obsolete:
             logger.debug(
                 "Record #%s uses an obsolete %s code: %s", record_id, code_type, code
             )
-        return str(code_element.parent.find("name").string)
+        return name
 
     @classmethod
     def _get_leader_field(cls, source_record: Tag) -> str:
@@ -213,7 +318,7 @@ class Marc(XMLTransformer):
 
     @classmethod
     def _get_control_field(cls, source_record: Tag) -> str:
-        if control_field := source_record.find("controlfield", tag="008", string=True):
+        if control_field := cls.get_record_index(source_record).controlfields.get("008"):
             return str(control_field.string)
         message = (
             'Record skipped because key information is missing: <controlfield tag="008">.'
@@ -239,7 +344,7 @@ class Marc(XMLTransformer):
                         value=alternate_title_value.rstrip(" .,/"),
                         kind=kind,
                     )
-                    for datafield in source_record.find_all("datafield", tag=tag)
+                    for datafield in cls.get_datafields(source_record, tag)
                     if (
                         alternate_title_value := (
                             cls.create_subfield_value_string_from_datafield(
@@ -267,8 +372,8 @@ class Marc(XMLTransformer):
             },
         ]
         for call_number_marc_field in call_number_marc_fields:
-            for datafield in source_record.find_all(
-                "datafield", tag=call_number_marc_field["tag"]
+            for datafield in cls.get_datafields(
+                source_record, call_number_marc_field["tag"]
             ):
                 call_numbers.extend(
                     call_number
@@ -292,7 +397,7 @@ class Marc(XMLTransformer):
     @classmethod
     def get_contents(cls, source_record: Tag) -> list[str] | None:
         contents = []
-        for datafield in source_record.find_all("datafield", tag="505"):
+        for datafield in cls.get_datafields(source_record, "505"):
             for contents_value in cls.create_subfield_value_list_from_datafield(
                 datafield,
                 "agrt",
@@ -332,7 +437,7 @@ class Marc(XMLTransformer):
         ]
 
         for tag, subfields in contributor_marc_fields:
-            for datafield in source_record.find_all("datafield", tag=tag):
+            for datafield in cls.get_datafields(source_record, tag):
                 if contributor_name := (
                     cls.create_subfield_value_string_from_datafield(
                         xml_element=datafield,
@@ -369,7 +474,7 @@ class Marc(XMLTransformer):
     def get_edition(cls, source_record: Tag) -> str | None:
         edition_values = [
             edition_value
-            for datafield in source_record.find_all("datafield", tag="250")
+            for datafield in cls.get_datafields(source_record, "250")
             if (
                 edition_value := cls.create_subfield_value_string_from_datafield(
                     xml_element=datafield, subfield_codes="ab", separator=" "
@@ -387,7 +492,7 @@ class Marc(XMLTransformer):
 
     @classmethod
     def _get_holdings_physical_items(cls, source_record: Tag) -> Iterator[timdex.Holding]:
-        for datafield in source_record.find_all("datafield", tag="985"):
+        for datafield in cls.get_datafields(source_record, "985"):
             holding_call_number = cls.create_subfield_value_string_from_datafield(
                 datafield, ["bb"]
             )
@@ -433,7 +538,7 @@ class Marc(XMLTransformer):
     def _get_holdings_electronic_items(
         cls, source_record: Tag
     ) -> Iterator[timdex.Holding]:
-        for datafield in source_record.find_all("datafield", tag="986"):
+        for datafield in cls.get_datafields(source_record, "986"):
             holding_collection = cls.get_single_subfield_string(datafield, "j")
             holding_location = (
                 cls.get_single_subfield_string(datafield, "f")
@@ -472,7 +577,7 @@ class Marc(XMLTransformer):
                         value=identifier.strip().replace("(OCoLC)", ""),
                         kind=kind,
                     )
-                    for datafield in source_record.find_all("datafield", tag=tag)
+                    for datafield in cls.get_datafields(source_record, tag)
                     if (
                         identifier := (
                             cls.create_subfield_value_string_from_datafield(
@@ -497,7 +602,7 @@ class Marc(XMLTransformer):
             language_codes.append(fixed_language_value)
 
         # get language codes from data field 041
-        for datafield in source_record.find_all("datafield", tag="041"):
+        for datafield in cls.get_datafields(source_record, "041"):
             language_codes.extend(
                 cls.create_subfield_value_list_from_datafield(datafield, "abdefghjkmn")
             )
@@ -527,15 +632,15 @@ class Marc(XMLTransformer):
     def _get_language_notes(cls, source_record: Tag) -> list[str]:
         return [
             str(language_note.string).rstrip(" .")
-            for datafield in source_record.find_all("datafield", tag="546")
+            for datafield in cls.get_datafields(source_record, "546")
             if (language_note := datafield.find("subfield", code="a", string=True))
         ]
 
     @classmethod
     def get_links(cls, source_record: Tag) -> list[timdex.Link] | None:
         links: list[timdex.Link] = []
-        for datafield in source_record.find_all(
-            "datafield", tag="856", ind1="4", ind2=["0", "1"]
+        for datafield in cls.get_datafields(
+            source_record, "856", ind1="4", ind2=["0", "1"]
         ):
             url_value = cls.create_subfield_value_list_from_datafield(datafield, "u")
             text_value = cls.create_subfield_value_list_from_datafield(datafield, "y")
@@ -562,7 +667,7 @@ class Marc(XMLTransformer):
     def _get_links_holdings_electronic_items(
         cls, source_record: Tag
     ) -> Iterator[timdex.Link]:
-        for datafield in source_record.find_all("datafield", tag="986"):
+        for datafield in cls.get_datafields(source_record, "986"):
             holding_collection = cls.get_single_subfield_string(datafield, "j")
             holding_location = (
                 cls.get_single_subfield_string(datafield, "f")
@@ -623,7 +728,7 @@ class Marc(XMLTransformer):
                         value=location_value.rstrip(" .,/)"),
                         kind=kind,
                     )
-                    for datafield in source_record.find_all("datafield", tag=tag)
+                    for datafield in cls.get_datafields(source_record, tag)
                     if (
                         location_value := (
                             cls.create_subfield_value_string_from_datafield(
@@ -680,7 +785,7 @@ class Marc(XMLTransformer):
                         value=[note_value.rstrip(" .")],
                         kind=kind,
                     )
-                    for datafield in source_record.find_all("datafield", tag=tag)
+                    for datafield in cls.get_datafields(source_record, tag)
                     if (
                         note_value := (
                             cls.create_subfield_value_string_from_datafield(
@@ -716,7 +821,7 @@ class Marc(XMLTransformer):
     def get_publication_frequency(cls, source_record: Tag) -> list[str] | None:
         return [
             publication_frequency_value
-            for datafield in source_record.find_all("datafield", tag="310")
+            for datafield in cls.get_datafields(source_record, "310")
             if (
                 publication_frequency_value := (
                     cls.create_subfield_value_string_from_datafield(
@@ -730,7 +835,7 @@ class Marc(XMLTransformer):
     def get_publishers(cls, source_record: Tag) -> list[timdex.Publisher] | None:
         publishers = []
         for publisher_marc_tag in ["260", "264"]:
-            for datafield in source_record.find_all("datafield", tag=publisher_marc_tag):
+            for datafield in cls.get_datafields(source_record, publisher_marc_tag):
                 if any(
                     [
                         publisher_name := cls.get_single_subfield_string(datafield, "b"),
@@ -773,7 +878,7 @@ class Marc(XMLTransformer):
                         description=related_item_value.rstrip(" ."),
                         relationship=relationship,
                     )
-                    for datafield in source_record.find_all("datafield", tag=tag)
+                    for datafield in cls.get_datafields(source_record, tag)
                     if (
                         related_item_value := (
                             cls.create_subfield_value_string_from_datafield(
@@ -803,7 +908,7 @@ class Marc(XMLTransformer):
                         value=[subject_value.rstrip(" .")],
                         kind=kind,
                     )
-                    for datafield in source_record.find_all("datafield", tag=tag)
+                    for datafield in cls.get_datafields(source_record, tag)
                     if (
                         subject_value := (
                             cls.create_subfield_value_string_from_datafield(
@@ -821,7 +926,7 @@ class Marc(XMLTransformer):
     def get_summary(cls, source_record: Tag) -> list[str] | None:
         return [
             summary_value
-            for datafield in source_record.find_all("datafield", tag="520")
+            for datafield in cls.get_datafields(source_record, "520")
             if (
                 summary_value := cls.create_subfield_value_string_from_datafield(
                     xml_element=datafield, subfield_codes="a", separator=" "
@@ -842,7 +947,7 @@ class Marc(XMLTransformer):
         try:
             main_title_values = []
             if main_title_value := cls.create_subfield_value_string_from_datafield(
-                xml_element=source_record.find("datafield", tag="245"),
+                xml_element=next(iter(cls.get_datafields(source_record, "245")), None),
                 subfield_codes="abfgknps",
                 separator=" ",
             ):
@@ -866,7 +971,7 @@ class Marc(XMLTransformer):
         Args:
             source_record: A BeautifulSoup Tag representing a single MARC XML record.
         """
-        return str(source_record.find("controlfield", tag="001", string=True).string)
+        return str(cls.get_record_index(source_record).controlfields.get("001").string)  # type: ignore[union-attr]
 
     @classmethod
     def record_is_deleted(cls, source_record: Tag) -> bool:
@@ -0,0 +1,172 @@
+"""XML record parsing engine."""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from bs4 import BeautifulSoup, Tag  # type: ignore[import-untyped]
+
+from transmogrifier.config import (
+    EXECUTOR_TYPES,
+    RECORD_TYPES,
+    ExecutorType,
+    RecordType,
+)
+from transmogrifier.helpers import map_in_order
+from transmogrifier.sources.lxmlrecord import LxmlRecord
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def parse_bs4(source_record: bytes) -> Tag:
+    """Parse the bytes of a single XML record into a BeautifulSoup object.
+
+    Args:
+        source_record: Bytes of a single XML record.
+    """
+    return BeautifulSoup(source_record, "xml")
+
+
+class XMLParsingEngine:
+    """Parse XML records into BeautifulSoup objects with a long-lived worker pool.
+
+    BeautifulSoup parsing was previously run in a new thread for each record, keeping
+    it isolated from the main thread where the parquet dataset is written (see
+    test_transform_no_memory_fault_for_threaded_bs4_parsing).  This engine preserves
+    that isolation by always parsing in pool workers, but the workers are created once
+    and reused for every record of the run.  When more than one worker is configured,
+    several records are parsed at once while the main thread transforms earlier ones.
+
+    Workers are threads: a BeautifulSoup object returned by a process worker is parsed
+    again from its markup when unpickled, so the parent would parse every record.
+    To parse records in several processes, transform them with more than one
+    Transformer worker.
+
+    The pool is created lazily on first use.  A pool inherited by a forked child
+    process has no live workers, so a new pool is created for each process.
+
+    With record_type='lxml', records are instead wrapped as LxmlRecord objects (see
+    transmogrifier.sources.lxmlrecord) and BeautifulSoup is not used.  As lxml parsing
+    does not require isolation, and lxml elements cannot be sent between processes,
+    these records are parsed in the calling thread without the pool.
+    """
+
+    def __init__(
+        self,
+        executor_type: ExecutorType = "thread",
+        workers: int = 1,
+        record_type: RecordType = "bs4",
+    ) -> None:
+        self._executor: Executor | None = None
+        self._executor_pid: int | None = None
+        self.executor_type: ExecutorType = "thread"
+        self.workers: int = 1
+        self.record_type: RecordType = "bs4"
+        self.configure(executor_type, workers, record_type)
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None or self._executor_pid != os.getpid():
+            self._executor = self._create_executor()
+            self._executor_pid = os.getpid()
+        return self._executor
+
+    @property
+    def max_in_flight(self) -> int:
+        """Number of records submitted for parsing ahead of the consumer."""
+        return self.workers * 2
+
+    def configure(
+        self,
+        executor_type: ExecutorType,
+        workers: int,
+        record_type: RecordType = "bs4",
+    ) -> None:
+        """Set the pool type and size, shutting down any existing pool.
+
+        Args:
+            executor_type: 'thread', the only pool type.
+            workers: Number of pool workers, must be at least 1.
+            record_type: 'bs4' for BeautifulSoup records, 'lxml' for LxmlRecords.
+        """
+        if executor_type not in EXECUTOR_TYPES:
+            message = f"Unrecognized executor_type parameter: {executor_type}"
+            raise ValueError(message)
+        if record_type not in RECORD_TYPES:
+            message = f"Unrecognized record_type parameter: {record_type}"
+            raise ValueError(message)
+        if workers < 1:
+            message = f"Parsing engine requires at least 1 worker, received: {workers}"
+            raise ValueError(message)
+        self.shutdown()
+        self.executor_type = executor_type
+        self.workers = workers
+        self.record_type = record_type
+
+    def parse(self, source_record: bytes) -> Tag | LxmlRecord:
+        """Parse a single XML record in a pool worker.
+
+        Args:
+            source_record: Bytes of a single XML record.
+        """
+        if self.record_type == "lxml":
+            return LxmlRecord.from_bytes(source_record)
+        return self.executor.submit(parse_bs4, source_record).result()
+
+    def parse_many(self, source_records: Iterable[bytes]) -> Iterator[Tag | LxmlRecord]:
+        """Parse XML records in pool workers, yielding them in their original order.
+
+        Args:
+            source_records: An iterable of XML record bytes, consumed lazily.
+        """
+        if self.record_type == "lxml":
+            yield from map(LxmlRecord.from_bytes, source_records)
+            return
+        yield from map_in_order(
+            self.executor, parse_bs4, source_records, self.max_in_flight
+        )
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool, if one was created by this process."""
+        if self._executor is not None and self._executor_pid == os.getpid():
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        self._executor_pid = None
+
+    def _create_executor(self) -> Executor:
+        logger.debug(
+            "Starting XML parsing %s pool with %d worker(s)",
+            self.executor_type,
+            self.workers,
+        )
+        return ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="xml-parsing"
+        )
+
+
+parsing_engine = XMLParsingEngine()
+
+
+def configure_parsing_engine(
+    executor_type: ExecutorType = "thread",
+    workers: int = 1,
+    record_type: RecordType = "bs4",
+) -> str:
+    """Configure the XML parsing engine shared by all XML transformers.
+
+    Args:
+        executor_type: 'thread', the only pool type.
+        workers: Number of pool workers, must be at least 1.
+        record_type: 'bs4' for BeautifulSoup records, 'lxml' for LxmlRecords.
+    """
+    parsing_engine.configure(executor_type, workers, record_type)
+    return (
+        f"XML parsing engine configured with executor_type={executor_type}, "
+        f"workers={workers}, record_type={record_type}"
+    )
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-import threading
+import copy
+import itertools
 from typing import TYPE_CHECKING, final
 
 import smart_open  # type: ignore[import-untyped]
-from bs4 import BeautifulSoup, Tag  # type: ignore[import-untyped]
 from lxml import etree
 
-from transmogrifier.sources.transformer import Transformer
+from transmogrifier.sources.lxmlrecord import LxmlRecord
+from transmogrifier.sources.transformer import SourceRecord, Transformer
+from transmogrifier.sources.xmlparsing import parsing_engine
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from bs4 import Tag  # type: ignore[import-untyped]
+
+    from transmogrifier.sources.lxmlrecord import LxmlTag
+    from transmogrifier.sources.xmlparsing import RecordType
+
 
 class XMLTransformer(Transformer):
     """XML transformer class."""
@@ -24,6 +31,108 @@ class XMLTransformer(Transformer):
 
         May not be overridden.
 
+        Records are parsed by the shared XMLParsingEngine worker pool, see
+        transmogrifier.sources.xmlparsing.  If the engine is configured for 'lxml'
+        records, the elements produced while reading the file are wrapped as
+        LxmlRecords without being serialized and parsed a second time.
+
+        Args:
+            source_file: A file containing source records to be transformed.
+        """
+        if parsing_engine.record_type == "lxml":
+            for element in cls.iterparse_source_file(source_file):
+                yield LxmlRecord(copy.deepcopy(element))
+        else:
+            yield from parsing_engine.parse_many(cls.read_source_file(source_file))
+
+    @final
+    @classmethod
+    def read_source_file(cls, source_file: str, start: int = 0) -> Iterator[bytes]:
+        """
+        Read XML file and return the unparsed bytes of source records via an iterator.
+
+        Skipped records are read by iterparse, which needs the document from its start,
+        but are not serialized.
+
+        May not be overridden.
+
+        Args:
+            source_file: A file containing source records to be transformed.
+            start: Number of records at the start of the file to skip.
+        """
+        for element in itertools.islice(
+            cls.iterparse_source_file(source_file), start, None
+        ):
+            yield etree.tostring(element, encoding="utf-8", with_tail=False)
+
+    @final
+    @classmethod
+    def parse_source_file_with_raw(
+        cls, source_file: str, start: int = 0
+    ) -> Iterator[SourceRecord]:
+        """
+        Parse XML file and return source records with their raw bytes via an iterator.
+
+        If the shared XMLParsingEngine is configured for 'lxml' records, each element
+        produced while reading the file is copied and wrapped as an LxmlRecord, and
+        its serialized bytes are only kept as the raw bytes of the record.  Otherwise
+        the bytes returned by read_source_file() are parsed by
+        parse_source_records_with_raw().
+
+        May not be overridden.
+
+        Args:
+            source_file: A file containing source records to be transformed.
+            start: Number of records at the start of the file to skip.
+        """
+        if parsing_engine.record_type != "lxml":
+            yield from cls.parse_source_records_with_raw(
+                cls.read_source_file(source_file, start)
+            )
+            return
+        for element in itertools.islice(
+            cls.iterparse_source_file(source_file), start, None
+        ):
+            yield SourceRecord(
+                LxmlRecord(copy.deepcopy(element)),
+                etree.tostring(element, encoding="utf-8", with_tail=False),
+            )
+
+    @final
+    @classmethod
+    def parse_source_records_with_raw(  # type: ignore[override]
+        cls, source_records: Iterator[bytes]
+    ) -> Iterator[SourceRecord]:
+        """
+        Parse XML records and return them with their raw bytes via an iterator.
+
+        Records are parsed by the shared XMLParsingEngine worker pool from the bytes
+        returned by read_source_file(), which are kept as the raw bytes of the record.
+        Used for records read as bytes before they are parsed, e.g. changed records of
+        an incremental run; see parse_source_file_with_raw() for other records.
+
+        May not be overridden.
+
+        Args:
+            source_records: Bytes of XML records returned by read_source_file().
+        """
+        raw_records, unparsed_records = itertools.tee(source_records)
+        for raw_record, source_record in zip(
+            raw_records, parsing_engine.parse_many(unparsed_records), strict=True
+        ):
+            yield SourceRecord(source_record, raw_record)
+
+    @final
+    @classmethod
+    def iterparse_source_file(cls, source_file: str) -> Iterator[etree._Element]:
+        """
+        Read XML file and return source record lxml elements via an iterator.
+
+        Each element is cleared once the consumer resumes the iterator, so it must be
+        copied if it is needed beyond that.
+
+        May not be overridden.
+
         Args:
             source_file: A file containing source records to be transformed.
         """
@@ -34,22 +143,41 @@ class XMLTransformer(Transformer):
                 encoding="utf-8",
                 recover=True,
             ):
-                record_string = etree.tostring(element, encoding="utf-8")
-                record = cls.parse_bs4_in_isolated_thread(record_string)
-                yield record
+                yield element
                 element.clear()
 
     @classmethod
-    def parse_bs4_in_isolated_thread(cls, source_record: bytes) -> Tag:
-        def parse() -> Tag:
-            nonlocal source_record
-            source_record = BeautifulSoup(source_record, "xml")
-
-        thread = threading.Thread(target=parse)
-        thread.start()
-        thread.join()
+    def parse_source_record(cls, source_record: bytes) -> Tag | LxmlRecord:  # type: ignore[override]
+        """
+        Parse the bytes of a single XML record into a bs4 Tag or LxmlRecord.
+
+        Args:
+            source_record: Bytes of a single XML record.
+        """
+        return parsing_engine.parse(source_record)
+
+    @classmethod
+    def get_raw_source_record(cls, source_record: bytes) -> bytes:  # type: ignore[override]
+        """
+        Return the bytes of a single XML record, which are already raw bytes.
+
+        Args:
+            source_record: Bytes of a single XML record.
+        """
         return source_record
 
+    def get_parsing_record_type(self) -> RecordType:
+        """Return the XML record type configured for the shared parsing engine."""
+        return parsing_engine.record_type
+
+    def serialize_source_record(self, source_record: Tag | LxmlTag) -> bytes:  # type: ignore[override]
+        """Return the bytes of a parsed XML record.
+
+        Args:
+            source_record: A bs4 Tag or LxmlRecord.
+        """
+        return source_record.encode()
+
     @classmethod
     def get_main_titles(cls, _source_record: Tag) -> list[Tag]:
         """